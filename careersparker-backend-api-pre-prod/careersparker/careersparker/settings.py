@@ -15,6 +15,7 @@ from datetime import timedelta
 from pathlib import Path
 
 import dotenv
+from boto3.s3.transfer import TransferConfig
 
 from careersparker.middleware import RedirectUnauthenticatedSwaggerToLoginMiddleware
 from user import user_profile
@@ -83,24 +84,6 @@ INSTALLED_APPS = [
     'user.user_profile',
     'fixed_payments',
     'cvbuilder',
-    'cvbuilder.employment_history',
-    'cvbuilder.education',
-    'cvbuilder.skill',
-    'cvbuilder.award',
-    'cvbuilder.certificate',
-    'cvbuilder.publication',
-    'cvbuilder.achievement',
-    'cvbuilder.hobby',
-    'cvbuilder.reference',
-    'cvbuilder.internship',
-    'cvbuilder.course',
-    'cvbuilder.language',
-    'cvbuilder.volunteering',
-    'cvbuilder.social_media',
-    'cvbuilder.strength',
-    'cvbuilder.custom_section',
-    'cvbuilder.graph',
-    'cvbuilder.text',
     'cvbuilder.cv_template_list',
     'cvbuilder.cv_template',
     'subscription_payments',
@@ -137,8 +120,67 @@ MIDDLEWARE = [
     'django_user_agents.middleware.UserAgentMiddleware',
     'social_django.middleware.SocialAuthExceptionMiddleware',  # python-social-auth
     'careersparker.middleware.RedirectUnauthenticatedSwaggerToLoginMiddleware',
+    # deletes the s3 files released by a request in batches, see util/Storage/s3_deletion.py
+    'util.Storage.s3_deletion.S3DeletionBatchMiddleware',
 ]
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# Redis when REDIS_URL is set, otherwise no cache at all. A per-process memory cache is not
+# an option: a cv change only invalidates the cache of the process that handled it, the other
+# web workers and the render_worker would keep reading the old cv
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': REDIS_URL,
+            'OPTIONS': {
+                'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+                # fall back to the database instead of failing requests when redis is down
+                'IGNORE_EXCEPTIONS': True,
+            },
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        }
+    }
+
+# how long an assembled cv document stays cached, it is also invalidated on every change
+CV_DOCUMENT_CACHE_TIMEOUT = int(os.environ.get('CV_DOCUMENT_CACHE_TIMEOUT', 60 * 60 * 24))
+
+# cv pdf/word rendering runs in the render_worker command, see cvbuilder/documents/jobs.py
+# attempts per job, the delay before the first retry (doubled on every retry), after how long
+# a running job is considered abandoned by its worker, and the queued jobs allowed per user
+RENDER_JOB_MAX_ATTEMPTS = int(os.environ.get('RENDER_JOB_MAX_ATTEMPTS', 3))
+RENDER_JOB_RETRY_DELAY = int(os.environ.get('RENDER_JOB_RETRY_DELAY', 10))
+RENDER_JOB_TIMEOUT = int(os.environ.get('RENDER_JOB_TIMEOUT', 5 * 60))
+RENDER_JOB_MAX_ACTIVE_PER_USER = int(os.environ.get('RENDER_JOB_MAX_ACTIVE_PER_USER', 5))
+
+# seconds without edits before the preview thumbnails of a cv are rendered again
+CV_PREVIEW_DEBOUNCE = int(os.environ.get('CV_PREVIEW_DEBOUNCE', 30))
+
+# compiled document templates kept in memory by each process, least recently used dropped first
+CV_TEMPLATE_PLAN_CACHE_SIZE = int(os.environ.get('CV_TEMPLATE_PLAN_CACHE_SIZE', 64))
+
+# largest uploaded image accepted, in bytes and in pixels, checked before the image is decoded
+MAX_IMAGE_UPLOAD_SIZE = int(os.environ.get('MAX_IMAGE_UPLOAD_SIZE', 10 * 1024 * 1024))
+MAX_IMAGE_PIXELS = int(os.environ.get('MAX_IMAGE_PIXELS', 40_000_000))
+
+# seconds a presigned upload straight to the s3 bucket stays valid, see util/Storage/direct_upload.py
+# the bucket should expire objects under <AWS_LOCATION>/staging-uploads/ after a day with a lifecycle rule
+DIRECT_UPLOAD_EXPIRES = int(os.environ.get('DIRECT_UPLOAD_EXPIRES', 10 * 60))
+
+# uploaded images are decoded and encoded in a pool of worker processes, see util/Storage/image_pool.py
+# processes per web process, uploads waiting for a worker before new ones get a 429, and the
+# seconds an upload waits for its images
+IMAGE_POOL_SIZE = int(os.environ.get('IMAGE_POOL_SIZE', 2))
+IMAGE_POOL_MAX_PENDING = int(os.environ.get('IMAGE_POOL_MAX_PENDING', 4))
+IMAGE_POOL_TIMEOUT = int(os.environ.get('IMAGE_POOL_TIMEOUT', 20))
+
 USER_AGENTS_CACHE = 'default'
 SESSION_COOKIE_SECURE = True
 SESSION_COOKIE_HTTPONLY = True
@@ -253,6 +295,15 @@ AUTH_PASSWORD_VALIDATORS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_RENDERER_CLASSES': (
+        'util.Renderer.orjson_renderer.OrjsonRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'util.Renderer.orjson_renderer.OrjsonParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
     'DEFAULT_LIMIT_OFFSET_PAGINATION_CLASS': 'rest_framework.pagination.LimitOffsetPagination',
@@ -294,6 +345,17 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 AWS_ACCESS_KEY_ID = os.environ.get('AWS_ACCESS_KEY_ID')
 AWS_SECRET_ACCESS_KEY = os.environ.get('AWS_SECRET_ACCESS_KEY')
 
+# seconds before a failed s3 deletion is retried by the retry_s3_deletions command, doubled
+# after every failed retry
+S3_DELETION_RETRY_DELAY = int(os.environ.get('S3_DELETION_RETRY_DELAY', 60))
+
+# boto3 clients shared by each process, see util/Storage/aws_clients.py: connections kept open
+# per client, timeouts in seconds and attempts per call, retries included
+AWS_CLIENT_MAX_POOL_CONNECTIONS = int(os.environ.get('AWS_CLIENT_MAX_POOL_CONNECTIONS', 20))
+AWS_CLIENT_CONNECT_TIMEOUT = int(os.environ.get('AWS_CLIENT_CONNECT_TIMEOUT', 5))
+AWS_CLIENT_READ_TIMEOUT = int(os.environ.get('AWS_CLIENT_READ_TIMEOUT', 30))
+AWS_CLIENT_MAX_ATTEMPTS = int(os.environ.get('AWS_CLIENT_MAX_ATTEMPTS', 4))
+
 # AWS SES Configuration
 AWS_SES_REGION_NAME = os.environ.get('AWS_SES_REGION_NAME')
 AWS_SES_REGION_ENDPOINT = os.environ.get('AWS_SES_REGION_ENDPOINT')
@@ -312,6 +374,17 @@ STATIC_URL = 'https://%s/%s/' % (AWS_S3_CUSTOM_DOMAIN, AWS_LOCATION)
 DEFAULT_FILE_STORAGE = 'storages.backends.s3boto3.S3Boto3Storage'
 STATICFILES_STORAGE = 'storages.backends.s3boto3.S3Boto3Storage'
 
+# multipart uploads of large files to s3, see util/Storage/s3_function.py: files of at least
+# one part are uploaded in parts of S3_MULTIPART_PART_SIZE bytes (5MB at least), with up to
+# S3_MULTIPART_CONCURRENCY parts sent at once, the parts read ahead are held in memory (10 at most)
+S3_MULTIPART_PART_SIZE = max(int(os.environ.get('S3_MULTIPART_PART_SIZE', 16 * 1024 * 1024)), 5 * 1024 * 1024)
+S3_MULTIPART_CONCURRENCY = int(os.environ.get('S3_MULTIPART_CONCURRENCY', 8))
+AWS_S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=S3_MULTIPART_PART_SIZE,
+    multipart_chunksize=S3_MULTIPART_PART_SIZE,
+    max_concurrency=S3_MULTIPART_CONCURRENCY,
+)
+
 # Define local file paths
 PROFILE_IMAGE_LOCAL_PATH = os.path.join(BASE_DIR, 'static/public/user_profile_image.png')
 
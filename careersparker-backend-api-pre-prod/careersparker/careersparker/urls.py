@@ -49,22 +49,7 @@ urlpatterns = [
 
     # CV Builder urls
     path('cvbuilder/', include('cvbuilder.urls'), name='cvbuilder'),
-    path('cvbuilder/employment-history/', include('cvbuilder.employment_history.urls'), name='employment-history'),
-    path('cvbuilder/education/', include('cvbuilder.education.urls'), name='education'),
-    path('cvbuilder/skill/', include('cvbuilder.skill.urls'), name='skill'),
-    path('cvbuilder/award/', include('cvbuilder.award.urls'), name='award'),
-    path('cvbuilder/certificate/', include('cvbuilder.certificate.urls'), name='certification'),
-    path('cvbuilder/publication/', include('cvbuilder.publication.urls'), name='publication'),
-    path('cvbuilder/hobby/', include('cvbuilder.hobby.urls'), name='hobby'),
-    path('cvbuilder/achievement/', include('cvbuilder.achievement.urls'), name='achievement'),
-    path('cvbuilder/reference/', include('cvbuilder.reference.urls'), name='reference'),
-    path('cvbuilder/course/', include('cvbuilder.course.urls'), name='course'),
-    path('cvbuilder/language/', include('cvbuilder.language.urls'), name='language'),
-    path('cvbuilder/volunteering/', include('cvbuilder.volunteering.urls'), name='volunteering'),
-    path('cvbuilder/internship/', include('cvbuilder.internship.urls'), name='internship'),
-    path('cvbuilder/social_media/', include('cvbuilder.social_media.urls'), name='social-media'),
-    path('cvbuilder/strength/', include('cvbuilder.strength.urls'), name='strength'),
-    path('cvbuilder/custom_section/', include('cvbuilder.custom_section.urls'), name='custom-section'),
+    path('cvbuilder/', include('cvbuilder.sections.urls'), name='cv-sections'),
     path('cvbuilder/template/', include('cvbuilder.cv_template.urls'), name='template'),
     path('cvbuilder/template_list/', include('cvbuilder.cv_template_list.urls'), name='template-list'),
 ]
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CvbuilderConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'cvbuilder'
+
+    def ready(self):
+        # connect the cv document cache invalidation and preview signals
+        from cvbuilder import signals  # noqa: F401
@@ -1,3 +0,0 @@
-from django.contrib import admin
-
-# Register your models here.
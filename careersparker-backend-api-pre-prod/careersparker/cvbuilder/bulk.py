@@ -0,0 +1,169 @@
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+
+from cvbuilder.sections.registry import get_section
+from cvbuilder.serializers import CvSectionOperationSerializer
+from cvbuilder.signals import cv_content_changed
+
+OP_CREATE = CvSectionOperationSerializer.OP_CREATE
+OP_UPDATE = CvSectionOperationSerializer.OP_UPDATE
+OP_DELETE = CvSectionOperationSerializer.OP_DELETE
+
+STATUS_FOR_OP = {OP_CREATE: 'created', OP_UPDATE: 'updated', OP_DELETE: 'deleted'}
+
+
+def _section_model(section):
+    return get_section(section).model
+
+
+def _section_serializer(section, *args, **kwargs):
+    return get_section(section).serializer_class(*args, **kwargs)
+
+
+def _result(index, operation, status, entry_id=None, errors=None):
+    result = {
+        'index': index,
+        'op': operation['op'],
+        'section': operation['section'],
+        'id': entry_id if entry_id is not None else operation.get('id'),
+        'status': status,
+    }
+    if errors is not None:
+        result['errors'] = errors
+    return result
+
+
+def _check_unique_fields(cv, results, operations, creates, updates, deletes):
+    """
+    Mark the creates and updates that would repeat the unique field value of a section.
+
+    The values are checked against the cv as it will be once the whole batch is applied, so
+    a batch can rename or delete an entry and reuse its value, but cannot create two entries
+    with the same value or one that already exists.
+    """
+    for section in set(creates) | set(updates):
+        unique_field = get_section(section).unique_field
+        if unique_field is None:
+            continue
+
+        values = dict(_section_model(section).objects.filter(cv=cv).values_list('id', unique_field))
+        for _, entry in deletes.get(section, ()):
+            values.pop(entry.id, None)
+
+        changed = []
+        for index, entry, fields in updates.get(section, ()):
+            values[entry.id] = getattr(entry, unique_field)
+            if unique_field in fields:
+                changed.append((index, values[entry.id]))
+
+        created_values = [(index, getattr(entry, unique_field)) for index, entry in creates.get(section, ())]
+        counts = Counter(list(values.values()) + [value for _, value in created_values])
+
+        message = f'{_section_model(section)._meta.verbose_name.capitalize()} already exists on this cv.'
+        for index, value in changed + created_values:
+            if counts[value] > 1:
+                results[index] = _result(index, operations[index], 'error', errors={unique_field: [message]})
+
+
+def requires_premium(operations):
+    """
+    Return True if any operation creates or updates an entry of a premium section.
+    """
+    return any(
+        operation['op'] != OP_DELETE and get_section(operation['section']).premium
+        for operation in operations
+    )
+
+
+def apply_section_operations(cv, user, operations):
+    """
+    Validate and apply a batch of section operations to a cv.
+
+    Every operation is validated before anything is written. If one of them fails, nothing
+    is applied and the failing operations carry their errors. Otherwise all writes happen in
+    one transaction with a bulk_create, bulk_update and delete per section.
+
+    Returns a (results, applied) tuple, with one result per operation in request order.
+    """
+    # load every entry that is updated or deleted, one query per section
+    ids_by_section = defaultdict(set)
+    for operation in operations:
+        if operation['op'] != OP_CREATE:
+            ids_by_section[operation['section']].add(operation['id'])
+
+    entries = {}
+    for section, ids in ids_by_section.items():
+        for entry in _section_model(section).objects.filter(cv=cv, id__in=ids):
+            entries[(section, entry.id)] = entry
+
+    # validate every operation and group the writes by section
+    results = [None] * len(operations)
+    creates = defaultdict(list)
+    updates = defaultdict(list)
+    deletes = defaultdict(list)
+
+    for index, operation in enumerate(operations):
+        op, section = operation['op'], operation['section']
+
+        entry = None
+        if op != OP_CREATE:
+            entry = entries.get((section, operation['id']))
+            if entry is None:
+                results[index] = _result(index, operation, 'error', errors={'id': ['Entry not found on this cv.']})
+                continue
+
+        if op == OP_DELETE:
+            deletes[section].append((index, entry))
+            continue
+
+        if op == OP_CREATE:
+            serializer = _section_serializer(section, data=operation['data'])
+        else:
+            serializer = _section_serializer(section, entry, data=operation['data'], partial=True)
+
+        if not serializer.is_valid():
+            results[index] = _result(index, operation, 'error', errors=serializer.errors)
+            continue
+
+        if op == OP_CREATE:
+            creates[section].append((index, _section_model(section)(cv=cv, user=user, **serializer.validated_data)))
+        else:
+            for attr, value in serializer.validated_data.items():
+                setattr(entry, attr, value)
+            updates[section].append((index, entry, serializer.validated_data.keys()))
+
+    _check_unique_fields(cv, results, operations, creates, updates, deletes)
+
+    if any(result is not None for result in results):
+        for index, operation in enumerate(operations):
+            if results[index] is None:
+                results[index] = _result(index, operation, 'skipped')
+        return results, False
+
+    # apply every write at once, bulk queries do not send signals so the cache is invalidated
+    # and the preview scheduled here
+    with transaction.atomic():
+        for section, created in creates.items():
+            _section_model(section).objects.bulk_create([entry for _, entry in created])
+
+        now = timezone.now()
+        for section, updated in updates.items():
+            fields = {'updated_at'}
+            for _, entry, entry_fields in updated:
+                entry.updated_at = now  # auto_now is not applied by bulk_update
+                fields.update(entry_fields)
+            _section_model(section).objects.bulk_update([entry for _, entry, _ in updated], fields=sorted(fields))
+
+        for section, deleted in deletes.items():
+            _section_model(section).objects.filter(cv=cv, id__in=[entry.id for _, entry in deleted]).delete()
+
+        transaction.on_commit(lambda: cv_content_changed(cv.id))
+
+    for grouped in (creates, updates, deletes):
+        for items in grouped.values():
+            for index, entry, *_ in items:
+                results[index] = _result(index, operations[index], STATUS_FOR_OP[operations[index]['op']], entry.id)
+
+    return results, True
@@ -0,0 +1,107 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+# bump when the shape of the serialized cv changes, so old entries are never read again
+CV_DOCUMENT_CACHE_VERSION = 1
+
+CV_DOCUMENT_CACHE_HITS_KEY = 'cvbuilder:cv-document:hits'
+CV_DOCUMENT_CACHE_MISSES_KEY = 'cvbuilder:cv-document:misses'
+
+
+# -------------------------------------------------------------------
+# Cache keys
+# -------------------------------------------------------------------
+def _generation_key(cv_id):
+    return f'cvbuilder:cv-document:v{CV_DOCUMENT_CACHE_VERSION}:generation:{cv_id}'
+
+
+def _get_generation(cv_id):
+    """
+    Return the current generation of a cv.
+
+    The generation changes on every invalidation. A document computed before a change is
+    stored under the old generation, so a slow reader can never re-populate stale data.
+    """
+    key = _generation_key(cv_id)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def cv_document_cache_key(cv_id, generation):
+    return f'cvbuilder:cv-document:v{CV_DOCUMENT_CACHE_VERSION}:{cv_id}:{generation}'
+
+
+# -------------------------------------------------------------------
+# Hit / miss counters
+# -------------------------------------------------------------------
+def _count(key):
+    try:
+        cache.incr(key)
+    except ValueError:  # counter does not exist yet
+        cache.add(key, 1, timeout=None)
+
+
+def get_cv_document_cache_stats():
+    """
+    Return the hit/miss counters of the cv document cache.
+    """
+    hits = cache.get(CV_DOCUMENT_CACHE_HITS_KEY, 0)
+    misses = cache.get(CV_DOCUMENT_CACHE_MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': hits / total if total else 0.0,
+    }
+
+
+def reset_cv_document_cache_stats():
+    cache.delete_many([CV_DOCUMENT_CACHE_HITS_KEY, CV_DOCUMENT_CACHE_MISSES_KEY])
+
+
+# -------------------------------------------------------------------
+# CV document cache
+# -------------------------------------------------------------------
+def get_cv_document_generation(cv_id):
+    """
+    Return the generation to read and write the cv document with.
+
+    Read it before loading the cv from the database: a document computed while the cv
+    changed is then stored under a generation nobody reads anymore.
+    """
+    return _get_generation(cv_id)
+
+
+def get_cv_document(cv_id, generation):
+    """
+    Return the cached document of a cv, or None on a miss.
+
+    The document is a dict with the owner id under 'user_id' and the serialized cv
+    (CvBuilderFullSerializer) under 'data'.
+    """
+    document = cache.get(cv_document_cache_key(cv_id, generation))
+    _count(CV_DOCUMENT_CACHE_HITS_KEY if document is not None else CV_DOCUMENT_CACHE_MISSES_KEY)
+    return document
+
+
+def set_cv_document(cv_id, generation, user_id, data):
+    """
+    Store the serialized cv under the given generation.
+    """
+    cache.set(
+        cv_document_cache_key(cv_id, generation),
+        {'user_id': user_id, 'data': data},
+        timeout=settings.CV_DOCUMENT_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_cv_document(cv_id):
+    """
+    Invalidate the cached document of a cv by moving it to a new generation.
+    """
+    cache.set(_generation_key(cv_id), uuid.uuid4().hex, timeout=None)
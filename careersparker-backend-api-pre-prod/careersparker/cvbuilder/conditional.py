@@ -0,0 +1,65 @@
+import functools
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+
+
+# -------------------------------------------------------------------
+# Section validators
+# -------------------------------------------------------------------
+def get_section_validators(model, cv_id, user, query_string=''):
+    """
+    Return the etag of a section of a cv of user.
+
+    The etag comes from a single aggregate over the section rows: the latest updated_at and
+    the row count. The count catches deletes, which do not move max(updated_at). Returns
+    None when the section is empty, or the cv is not the user's.
+    """
+    section = model.objects.filter(cv=cv_id, cv__user=user).aggregate(last_modified=Max('updated_at'), count=Count('id'))
+    last_modified = section['last_modified']
+    if last_modified is None:
+        return None
+
+    # the query string is part of the representation (e.g. selected fields)
+    fingerprint = f'{model._meta.label}:{cv_id}:{section["count"]}:{last_modified.isoformat()}:{query_string}'
+    etag = quote_etag(hashlib.md5(fingerprint.encode()).hexdigest())
+    return f'W/{etag}'
+
+
+def conditional_section_get(model):
+    """
+    Answer GET requests on a cv section with 304 Not Modified when the section is unchanged.
+
+    Decorates the get(self, request, pk) of a *ByCvId view. If-None-Match is checked against
+    the section etag before the view runs, so an unchanged section is never loaded or
+    serialized. The etag only covers the cvs of the requesting user, the view checks the
+    ownership of any other cv. Every full response carries the ETag header the client sends
+    back on its next poll.
+
+    No Last-Modified is sent: at its one second resolution a delete, or a second edit within
+    the same second, would answer If-Modified-Since with a stale 304.
+    """
+
+    def decorator(view_func):
+        @functools.wraps(view_func)
+        def wrapper(self, request, pk=None, *args, **kwargs):
+            etag = get_section_validators(model, pk, request.user, request.META.get('QUERY_STRING', ''))
+            if etag is None:
+                return view_func(self, request, pk, *args, **kwargs)
+
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                not_modified['ETag'] = etag
+                return not_modified
+
+            response = view_func(self, request, pk, *args, **kwargs)
+            if response.status_code == 200:
+                response['ETag'] = etag
+                response['Cache-Control'] = 'private, no-cache'
+            return response
+
+        return wrapper
+
+    return decorator
@@ -1,6 +1,5 @@
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
-from rest_framework.generics import get_object_or_404
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -9,27 +8,32 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from cvbuilder.cv_template import serializers
 from cvbuilder.cv_template.serializers import CvTemplateSerializer
-from cvbuilder.models import CvTemplate, CvBuilder, CvTemplateList
+from cvbuilder.conditional import conditional_section_get
+from cvbuilder.models import CvTemplate, CvTemplateList
+from util.Permission.cv_owner_permission import CvOwnerMixin, IsCvOwner
 
 from util.payments.user_payment_checks import can_create_template
 
 
 @extend_schema(tags=['CV: Template'])
-class TemplateByCvId(APIView):
+class TemplateByCvId(CvOwnerMixin, APIView):
     """
     Retrieve, create, or delete a template by CV ID.
     """
 
     authentication_classes = [JWTAuthentication]
-    permission_classes = (IsAuthenticated,)
+    permission_classes = (IsAuthenticated, IsCvOwner)
     parser_classes = (MultiPartParser, FormParser, JSONParser)
     queryset = CvTemplate.objects.all()
     serializer_class = serializers.CvTemplateSerializer
 
+    @conditional_section_get(CvTemplate)
     def get(self, request, pk):
         """
         Retrieve a template by CV ID.
         """
+        self.get_owned_cv()
+
         try:
             queryset = self.queryset.get(cv=pk).order_by('-template_name')
             serializer = self.serializer_class(queryset)
@@ -47,7 +51,7 @@ class TemplateByCvId(APIView):
 
         user = self.request.user
 
-        cv = get_object_or_404(CvBuilder, pk=pk)
+        cv = self.get_owned_cv()
 
         # get cv builder fixed payment permission
 
@@ -79,13 +83,14 @@ class TemplateByCvId(APIView):
 
 
 @extend_schema(tags=['CV: Template'])
-class TemplateById(APIView):
+class TemplateById(CvOwnerMixin, APIView):
     """
 
     """
     serializer_class = CvTemplateSerializer
+    owner_model = CvTemplate
     parser_classes = (MultiPartParser, FormParser, JSONParser)
-    permission_classes = (IsAuthenticated,)
+    permission_classes = (IsAuthenticated, IsCvOwner)
     authentication_classes = [JWTAuthentication]
 
     @staticmethod
@@ -105,14 +110,9 @@ class TemplateById(APIView):
         :return:
         """
 
-        cv_template = get_object_or_404(CvTemplate, pk=pk)
+        cv_template = self.get_owned_object()
         user = request.user
 
-        # check the user is the owner of the template
-        if cv_template.user != user:
-            return Response({'message': 'You are not authorized to perform this action'},
-                            status=status.HTTP_403_FORBIDDEN)
-
         check_user_has_paid = can_create_template(user)
         if not check_user_has_paid:
             return Response({'error': 'Insufficient credits to create a template.'}, status=status.HTTP_403_FORBIDDEN)
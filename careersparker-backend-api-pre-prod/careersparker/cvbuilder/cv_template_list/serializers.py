@@ -1,11 +1,23 @@
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 from cvbuilder.models import CvTemplateList
+from util.Storage.process_image import image_srcset
 
 
 class CvTemplateListSerializer(serializers.ModelSerializer):
+	cv_template_thumbnail_srcset = serializers.SerializerMethodField()
+
+	@extend_schema_field(serializers.DictField(child=serializers.CharField(), allow_null=True))
+	def get_cv_template_thumbnail_srcset(self, cv_template):
+		return image_srcset({
+			'full': cv_template.cv_template_thumbnail,
+			'small': cv_template.cv_template_thumbnail_small,
+			'retina': cv_template.cv_template_thumbnail_retina,
+		}, cv_template.cv_template_thumbnail_variants)
+
 	class Meta:
 		model = CvTemplateList
-		fields = ('id', 'cv_template_name', 'cv_template_thumbnail')
+		fields = ('id', 'cv_template_name', 'cv_template_thumbnail', 'cv_template_thumbnail_srcset')
 
 		extra_kwargs = {'id': {'read_only': True}}
@@ -14,4 +14,5 @@ app_name = 'categoryList'
 urlpatterns = [
     # Category List URL Mapping
     path('', views.CVTemplateListViewSet.as_view(), name='categoryList'),
+    path('upload', views.CVTemplateListUploadView.as_view(), name='upload'),
 ]
@@ -3,15 +3,38 @@ from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from cvbuilder.cv_template_list.serializers import CvTemplateListSerializer
 from cvbuilder.models import CvTemplateList
-from util.Storage.process_image import convert_image_webp, check_image_size
-from util.Storage.s3_function import delete_s3_file
+from user.user_profile.serializers import PresignedUploadSerializer
+from util.Storage.image_pool import ImagePoolError, image_pool_error_response
+from util.Storage.direct_upload import create_presigned_upload, derive_uploaded_image_variants
+from util.Storage.process_image import TEMPLATE_THUMBNAIL_VARIANTS
+from util.Storage.s3_deletion import schedule_s3_deletion
+
+
+def thumbnail_fields(thumbnails, manifest):
+    """
+    Map the derived thumbnail variants to the thumbnail fields of a CvTemplateList.
+    """
+    return {
+        'cv_template_thumbnail': thumbnails['full'],
+        'cv_template_thumbnail_small': thumbnails['small'],
+        'cv_template_thumbnail_retina': thumbnails['retina'],
+        'cv_template_thumbnail_variants': manifest,
+    }
+
+
+def thumbnail_names(cv_template):
+    """
+    The stored names of the thumbnails of a CvTemplateList.
+    """
+    return [file.name for file in (cv_template.cv_template_thumbnail, cv_template.cv_template_thumbnail_small,
+                                   cv_template.cv_template_thumbnail_retina) if file]
 
 
 @extend_schema(tags=['CV Template List'])
@@ -46,24 +69,23 @@ class CVTemplateListViewSet(APIView):
             if CvTemplateList.objects.filter(template_name=request.data.get('template_name')).exists():
                 return Response({'error': 'Template already exists'}, status=status.HTTP_400_BAD_REQUEST)
 
-        cv_template_thumbnail = request.data.get('cv_template_thumbnail')
-
-        # check if cv_template_thumbnail is less than 1240x1754, if yes return error
-        if cv_template_thumbnail.width > 1240 or cv_template_thumbnail.height > 1754:
-            return Response({'error': 'Image must be less than 1240x1754'}, status=status.HTTP_400_BAD_REQUEST)
-
-        # process thumbnail to webp
-        cv_template_thumbnail = convert_image_webp(cv_template_thumbnail)
-
-        # check the filesize
-        cv_template_thumbnail = check_image_size(cv_template_thumbnail)
+        # check the thumbnail sent, or uploaded straight to s3 and confirmed with the upload_token
+        # of CVTemplateListUploadView, from its header, then decode it once and derive the full,
+        # small and retina webp thumbnails from it
+        try:
+            thumbnails, manifest = derive_uploaded_image_variants(
+                user, request.data, 'cv_template_thumbnail', 'cv_template_thumbnail', TEMPLATE_THUMBNAIL_VARIANTS
+            )
+        except ValidationError as e:
+            return Response({'error': e.detail[0]}, status=status.HTTP_400_BAD_REQUEST)
+        except ImagePoolError as e:
+            return image_pool_error_response(e)
 
         CvTemplateList.objects.create(
             user=user,
             cv_template_name=request.data.get('cv_template_name'),
             cv_template_profession=request.data.get('cv_template_profession'),
-            cv_template_thumbnail=cv_template_thumbnail,
-            cv_template_thumbnail_small=request.data.get('cv_template_small_thumbnail'),
+            **thumbnail_fields(thumbnails, manifest),
         )
 
         return Response({'message': 'Template created successfully'}, status=status.HTTP_201_CREATED)
@@ -79,33 +101,32 @@ class CVTemplateListViewSet(APIView):
                 return Response({'error': 'Template already exists'}, status=status.HTTP_400_BAD_REQUEST)
 
             cv_template = CvTemplateList.objects.get(pk=pk)
+            previous_thumbnails = thumbnail_names(cv_template)
 
-            # check if cv template already exists
-            if CvTemplateList.objects.filter(cv_template_name=request.data.get('cv_template_name')).exists():
-                delete_s3_file(cv_template.cv_template_thumbnail)
-                delete_s3_file(cv_template.cv_template_thumbnail_small)
-
-                cv_template.cv_template_thumbnail = None
-                cv_template.cv_template_thumbnail_small = None
-                cv_template.save()
-
-            cv_template_thumbnail = request.data.get('cv_template_thumbnail')
-
-            # check if cv_template_thumbnail is less than 1240x1754, if yes return error
-            if cv_template_thumbnail.width > 1240 or cv_template_thumbnail.height > 1754:
-                return Response({'error': 'Image must be less than 1240x1754'}, status=status.HTTP_400_BAD_REQUEST)
-
-            # process thumbnail to webp
-            cv_template_thumbnail = convert_image_webp(cv_template_thumbnail)
-
-            # check the filesize
-            cv_template_thumbnail = check_image_size(cv_template_thumbnail)
+            # check the thumbnail sent, or uploaded straight to s3 and confirmed with the upload_token
+            # of CVTemplateListUploadView, from its header, then decode it once and derive the full,
+            # small and retina webp thumbnails from it, before the current thumbnails are touched so
+            # a rejected upload or a busy image pool leaves them in place
+            try:
+                thumbnails, manifest = derive_uploaded_image_variants(
+                    user, request.data, 'cv_template_thumbnail', 'cv_template_thumbnail', TEMPLATE_THUMBNAIL_VARIANTS
+                )
+            except ValidationError as e:
+                return Response({'error': e.detail[0]}, status=status.HTTP_400_BAD_REQUEST)
+            except ImagePoolError as e:
+                return image_pool_error_response(e)
 
             serializer = self.serializer_class(cv_template, data=request.data, partial=True)
 
             try:
-                serializer.is_valid(raise_exception=True)
-                serializer.save()
+                with transaction.atomic():
+                    serializer.is_valid(raise_exception=True)
+                    serializer.save(**thumbnail_fields(thumbnails, manifest))
+
+                    # delete the replaced thumbnails in one call once the template is saved,
+                    # leaving a key the new ones overwrote
+                    replaced = thumbnail_names(serializer.instance)
+                    schedule_s3_deletion(*(name for name in previous_thumbnails if name not in replaced))
                 return Response({'message': 'Template updated successfully'}, status=status.HTTP_200_OK)
 
             except ValidationError as e:
@@ -125,10 +146,31 @@ class CVTemplateListViewSet(APIView):
 
         if user.is_superuser:
             cv_template = CvTemplateList.objects.get(pk=pk)
-            delete_s3_file(cv_template.cv_template_thumbnail)
-            delete_s3_file(cv_template.cv_template_thumbnail_small)
+            # deleted from the s3 bucket in one call, only once the deletion is committed
+            schedule_s3_deletion(*thumbnail_names(cv_template))
             cv_template.delete()
             return Response({'message': 'Template deleted successfully'}, status=status.HTTP_200_OK)
 
         else:
             return Response({'error': 'You are not allowed to delete cv template'}, status=status.HTTP_403_FORBIDDEN)
+
+
+@extend_schema(tags=['CV Template List'])
+class CVTemplateListUploadView(APIView):
+    """
+    Presign an upload of a cv template thumbnail straight to the s3 bucket.
+
+    The thumbnail is then set by sending the upload_token to CVTemplateListViewSet.
+    """
+
+    authentication_classes = [JWTAuthentication]
+    permission_classes = (IsAuthenticated,)
+    serializer_class = PresignedUploadSerializer
+
+    @extend_schema(request=None)
+    def post(self, request):
+        if not request.user.is_superuser:
+            return Response({'error': 'You are not allowed to upload cv template thumbnails'},
+                            status=status.HTTP_403_FORBIDDEN)
+
+        return Response(create_presigned_upload(request.user, 'cv_template_thumbnail'), status=status.HTTP_200_OK)
@@ -0,0 +1,121 @@
+import collections
+import re
+import threading
+
+from django.conf import settings
+
+from cvbuilder.documents.templates import DEFAULT_TEMPLATE, DOCUMENT_TEMPLATES
+
+HEX_COLOR = re.compile(r'^#?([0-9a-fA-F]{6})$')
+
+
+class TemplateCompileError(ValueError):
+    """
+    A template spec that cannot be rendered.
+    """
+
+
+# -------------------------------------------------------------------
+# Render plans
+# -------------------------------------------------------------------
+class RenderPlan:
+    """
+    A document template compiled for rendering.
+
+    spec is the template spec completed with the default template and validated. Each
+    renderer compiles what it derives from the spec (styles, style sheets) into a part of
+    the plan on first use, so it is worked out once per plan instead of on every render.
+    """
+
+    def __init__(self, name, spec):
+        self.name = name
+        self.spec = spec
+        self._parts = {}
+        self._lock = threading.Lock()
+
+    def part(self, name, compile_part):
+        """
+        Return a part of the plan, compiled by compile_part(spec) the first time it is asked for.
+        """
+        try:
+            return self._parts[name]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if name not in self._parts:
+                self._parts[name] = compile_part(self.spec)
+            return self._parts[name]
+
+
+def _parse_color(name, key, value):
+    match = HEX_COLOR.match(str(value))
+    if match is None:
+        raise TemplateCompileError(f'Template {name}: {key} is not a hex colour: {value!r}')
+    return f'#{match.group(1).upper()}'
+
+
+def compile_template(name):
+    """
+    Compile the document template of this name, the default template for an unknown name.
+    """
+    spec = dict(DOCUMENT_TEMPLATES[DEFAULT_TEMPLATE])
+    spec.update(DOCUMENT_TEMPLATES.get(name, {}))
+
+    for key in ('text_color', 'accent_color', 'muted_color'):
+        spec[key] = _parse_color(name, key, spec[key])
+    for key in ('title_size', 'heading_size', 'body_size'):
+        if not isinstance(spec[key], (int, float)) or spec[key] <= 1:
+            raise TemplateCompileError(f'Template {name}: {key} is not a font size: {spec[key]!r}')
+
+    return RenderPlan(name, spec)
+
+
+# -------------------------------------------------------------------
+# Plan cache
+# -------------------------------------------------------------------
+class RenderPlanCache:
+    """
+    Thread safe, in-process LRU cache of compiled render plans, keyed by template name.
+
+    Plans are compiled from DOCUMENT_TEMPLATES only, which does not change while the
+    process runs, so a cached plan never goes stale.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._plans = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, compile_plan):
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                return plan
+
+        # compiled outside of the lock, a plan compiled twice by two threads is harmless
+        plan = compile_plan()
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.max_size:
+                self._plans.popitem(last=False)
+        return plan
+
+    def clear(self):
+        with self._lock:
+            self._plans.clear()
+
+    def __len__(self):
+        return len(self._plans)
+
+
+render_plan_cache = RenderPlanCache(settings.CV_TEMPLATE_PLAN_CACHE_SIZE)
+
+
+def get_render_plan(template_name):
+    """
+    Return the compiled render plan of a template, compiling it when it is not cached.
+    """
+    return render_plan_cache.get(template_name, lambda: compile_template(template_name))
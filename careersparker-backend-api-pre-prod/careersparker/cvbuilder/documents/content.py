@@ -0,0 +1,156 @@
+import datetime
+import functools
+import hashlib
+
+import orjson
+from django.db import models
+
+from cvbuilder.cache import get_cv_document, get_cv_document_generation, set_cv_document
+from cvbuilder.documents.rich_text import rich_text_blocks
+from cvbuilder.documents.templates import DEFAULT_TEMPLATE, DOCUMENT_TEMPLATES
+from cvbuilder.models import CvBuilder, CvTemplate
+from cvbuilder.sections.registry import SECTIONS
+from cvbuilder.serializers import CvBuilderFullSerializer, CV_SECTION_PREFETCHES
+
+# bump when the output of a renderer changes for the same cv, so cached files are not served again
+DOCUMENT_RENDER_VERSION = 1
+
+# fields that are not part of the printed cv
+LAYOUT_EXCLUDED_FIELDS = frozenset({'id', 'user', 'cv', 'created_at', 'updated_at', 'hobby_icon_value'})
+
+
+# -------------------------------------------------------------------
+# CV document
+# -------------------------------------------------------------------
+def load_cv_document(cv_id, user):
+    """
+    Return the serialized full cv (CvBuilderFullSerializer) of a cv owned by the user.
+
+    The cached document is used when it is current, otherwise the cv is loaded with every
+    section prefetched and cached. Returns None if the user has no cv with this id.
+    """
+    generation = get_cv_document_generation(cv_id)
+    document = get_cv_document(cv_id, generation)
+    if document is not None:
+        return document['data'] if document['user_id'] == user.id else None
+
+    # filtering on the user is the ownership check, prefetching loads every section in one batch
+    cvbuilder = CvBuilder.objects.filter(user=user).prefetch_related(*CV_SECTION_PREFETCHES).filter(pk=cv_id).first()
+    if cvbuilder is None:
+        return None
+
+    data = CvBuilderFullSerializer(cvbuilder).data
+    set_cv_document(cvbuilder.id, generation, cvbuilder.user_id, data)
+    return data
+
+
+def get_selected_template(cv_id):
+    """
+    Return the name of the template selected for a cv, the latest one set on it.
+
+    Falls back to the default template when none is set or the name has no document template.
+    """
+    name = CvTemplate.objects.filter(cv=cv_id).order_by('-updated_at', '-id') \
+        .values_list('cv_template_name', flat=True).first()
+    name = (name or '').strip().lower()
+    return name if name in DOCUMENT_TEMPLATES else DEFAULT_TEMPLATE
+
+
+def _without_timestamps(value):
+    if isinstance(value, dict):
+        return {
+            key: _without_timestamps(item) for key, item in value.items() if key not in ('created_at', 'updated_at')
+        }
+    if isinstance(value, list):
+        return [_without_timestamps(item) for item in value]
+    return value
+
+
+def cv_content_hash(document, template, document_format):
+    """
+    Return the hash identifying a rendered cv file.
+
+    It covers everything printed: the cv content, the template and the format. Timestamps
+    are left out, so saving a cv without changing it keeps the same hash.
+    """
+    payload = orjson.dumps(
+        [DOCUMENT_RENDER_VERSION, document_format, template, _without_timestamps(document)],
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+# -------------------------------------------------------------------
+# Printed layout
+# -------------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def _layout_fields(model):
+    """
+    Group the printed fields of a section model by how they are laid out.
+    """
+    fields = [field for field in model._meta.concrete_fields if field.name not in LAYOUT_EXCLUDED_FIELDS]
+
+    start = next((field.name for field in fields if field.name.endswith('start_date')), None)
+    end = next((field.name for field in fields if field.name.endswith('end_date')), None)
+    return {
+        'text': [field.name for field in fields if isinstance(field, models.CharField)],
+        'dates': [field.name for field in fields if isinstance(field, models.DateField) and field.name not in (start, end)],
+        'range': (start, end) if start and end else None,
+        'current': [field.name for field in fields if isinstance(field, models.BooleanField)],
+        'numbers': [(field.name, field.verbose_name) for field in fields if isinstance(field, models.IntegerField)],
+        'rich_text': [field.name for field in fields if isinstance(field, models.TextField)],
+    }
+
+
+def _format_date(value):
+    try:
+        return datetime.date.fromisoformat(value).strftime('%b %Y')
+    except (TypeError, ValueError):
+        return ''
+
+
+def _entry_layout(model, entry):
+    fields = _layout_fields(model)
+
+    texts = [str(entry[name]).strip() for name in fields['text'] if entry.get(name)]
+    dates = [_format_date(entry.get(name)) for name in fields['dates']]
+
+    if fields['range']:
+        start, end = (_format_date(entry.get(name)) for name in fields['range'])
+        if not end and any(entry.get(name) for name in fields['current']):
+            end = 'Present'
+        dates.insert(0, ' - '.join(date for date in (start, end) if date))
+
+    details = [
+        f'{verbose_name.capitalize()}: {entry[name]}' for name, verbose_name in fields['numbers']
+        if entry.get(name) is not None
+    ]
+
+    body = []
+    for name in fields['rich_text']:
+        body.extend(rich_text_blocks(entry.get(name)))
+
+    return {
+        'title': texts[0] if texts else '',
+        'subtitle': ' | '.join(texts[1:]),
+        'dates': ' | '.join(date for date in dates if date),
+        'details': details,
+        'body': body,
+    }
+
+
+def build_cv_layout(document):
+    """
+    Return the format neutral layout of a serialized full cv, shared by the document renderers.
+
+    A dict with the cv 'title' and its non-empty 'sections', in the order of the full cv.
+    Each section is a (heading, entries) tuple; each entry a dict with a 'title', a 'subtitle',
+    'dates', short 'details' lines and a rich text 'body' (see rich_text_blocks).
+    """
+    sections = []
+    for section in SECTIONS:
+        entries = document.get(section.name) or []
+        if entries:
+            sections.append((section.title, [_entry_layout(section.model, entry) for entry in entries]))
+
+    return {'title': document.get('cv_title') or 'Curriculum Vitae', 'sections': sections}
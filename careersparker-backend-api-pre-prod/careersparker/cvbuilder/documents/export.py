@@ -0,0 +1,46 @@
+import zipfile
+
+import orjson
+from django.utils import timezone
+
+from cvbuilder.documents.streaming import StreamSink, zip_info
+from cvbuilder.models import CvBuilder
+from cvbuilder.serializers import CvBuilderFullSerializer, CV_SECTION_PREFETCHES
+from util.Renderer.orjson_renderer import ORJSON_OPTIONS, orjson_default
+
+ZIP_CONTENT_TYPE = 'application/zip'
+
+# cvs read per batch, the sections of a whole batch are prefetched together
+CV_EXPORT_BATCH_SIZE = 20
+
+
+def cv_export_name(cvbuilder):
+    """
+    Return the name of the file of a cv in the export archive, the id keeps names unique.
+    """
+    return f"{cvbuilder.id}-{cvbuilder.cv_slug or 'cv'}.json"
+
+
+def iter_cv_export(user):
+    """
+    Yield a zip archive of every cv of the user in chunks, a json file per cv with all of its sections.
+
+    Cvs are read CV_EXPORT_BATCH_SIZE at a time, and each one is handed out as soon as it is
+    written to the archive. Memory use stays flat however many cvs the user has; only the
+    small central directory entry of each file is kept until the archive is closed.
+    """
+    cvs = CvBuilder.objects.filter(user=user).order_by('created_at', 'id').prefetch_related(*CV_SECTION_PREFETCHES)
+    sink = StreamSink()
+
+    with zipfile.ZipFile(sink, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for cvbuilder in cvs.iterator(chunk_size=CV_EXPORT_BATCH_SIZE):
+            content = orjson.dumps(
+                CvBuilderFullSerializer(cvbuilder).data,
+                default=orjson_default,
+                option=ORJSON_OPTIONS | orjson.OPT_INDENT_2,
+            )
+            modified = timezone.localtime(cvbuilder.updated_at).timetuple()[:6]
+            archive.writestr(zip_info(cv_export_name(cvbuilder), date_time=modified), content)
+            yield sink.drain()
+
+    yield sink.drain()
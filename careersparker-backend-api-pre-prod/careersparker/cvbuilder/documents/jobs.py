@@ -0,0 +1,291 @@
+import datetime
+import tempfile
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile, File
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from cvbuilder.documents.content import cv_content_hash, get_selected_template, load_cv_document
+from cvbuilder.documents.pdf import PDF_CONTENT_TYPE, render_cv_pdf
+from cvbuilder.documents.preview import get_cv_preview, store_cv_preview
+from cvbuilder.documents.word import DOCX_CONTENT_TYPE, iter_cv_docx
+from cvbuilder.models import CvBuilder, RenderJob
+from util.payments.user_payment_checks import can_download_cv_pdf, can_download_worddoc
+
+
+class RenderJobError(Exception):
+    """
+    A render job failure that retrying would not fix.
+    """
+
+
+class RenderQueueFull(Exception):
+    """
+    The user has RENDER_JOB_MAX_ACTIVE_PER_USER jobs queued or running already.
+    """
+
+
+# a rendered word file is written to memory up to this size, to a temporary file past it
+RENDER_SPOOL_MAX_SIZE = 1024 * 1024
+
+
+def _stored_result(content_hash, document_format):
+    """
+    Return the stored file of a succeeded job with the same content hash, or None.
+    """
+    return RenderJob.objects.filter(
+        content_hash=content_hash, document_format=document_format, status=RenderJob.Status.SUCCEEDED,
+    ).exclude(result='').values_list('result', flat=True).first()
+
+
+def _render_pdf(document, template_name):
+    content_hash = cv_content_hash(document, template_name, 'pdf')
+    if _stored_result(content_hash, RenderJob.DocumentFormat.PDF):
+        return content_hash, None  # an unchanged cv is not rendered again
+    return content_hash, ContentFile(render_cv_pdf(document, template_name))
+
+
+def _render_docx(document, template_name):
+    """
+    Render the .docx of a cv to a spooled temporary file, so a large document is written
+    to disk chunk by chunk instead of being held in memory.
+    """
+    content_hash = cv_content_hash(document, template_name, 'docx')
+    if _stored_result(content_hash, RenderJob.DocumentFormat.DOCX):
+        return content_hash, None
+
+    output = tempfile.SpooledTemporaryFile(max_size=RENDER_SPOOL_MAX_SIZE)
+    for chunk in iter_cv_docx(document, template_name):
+        output.write(chunk)
+    output.seek(0)
+    return content_hash, File(output)
+
+
+def _store_result(job, content_hash, content):
+    """
+    Attach the rendered file to the job, reusing the stored file of an identical render.
+
+    The stored file is the only copy of a render, identical renders are found from the
+    content hash of their jobs.
+    """
+    job.content_hash = content_hash
+    rendered = _stored_result(content_hash, job.document_format)
+
+    if rendered:
+        job.result.name = rendered
+    else:
+        job.result.save(f"{content_hash}.{RENDER_FORMATS[job.document_format]['extension']}",
+                        content, save=False)
+
+    if content is not None:
+        content.close()  # the spooled temporary file of a word render is removed
+
+
+def _store_preview(job, content_hash, images):
+    job.content_hash = content_hash
+    store_cv_preview(job.cv, content_hash, images)
+
+
+# -------------------------------------------------------------------
+# Render formats
+# -------------------------------------------------------------------
+# How each document format is rendered, stored, served and paid for. The credit is checked
+# when a download is queued and only deducted once its file is rendered; previews are free.
+RENDER_FORMATS = {
+    RenderJob.DocumentFormat.PDF: {
+        'render': _render_pdf,
+        'store': _store_result,
+        'content_type': PDF_CONTENT_TYPE,
+        'extension': 'pdf',
+        'can_download': can_download_cv_pdf,
+        'deduct': 'deduct_pdf_download_count',
+        'limit_error': 'You have reached your limit of cv download',
+    },
+    RenderJob.DocumentFormat.DOCX: {
+        'render': _render_docx,
+        'store': _store_result,
+        'content_type': DOCX_CONTENT_TYPE,
+        'extension': 'docx',
+        'can_download': can_download_worddoc,
+        'deduct': 'deduct_word_download_count',
+        'limit_error': 'You have reached your limit of cv Word download',
+    },
+    RenderJob.DocumentFormat.PREVIEW: {
+        'render': get_cv_preview,
+        'store': _store_preview,
+        'can_download': None,
+        'deduct': None,
+    },
+}
+
+
+# -------------------------------------------------------------------
+# Queue
+# -------------------------------------------------------------------
+def enqueue_render_job(user, cv_id, document_format):
+    """
+    Queue the rendering of a cv, returns the job.
+
+    A job already queued or running for the same cv and format is returned instead of
+    queueing another one. Paying users' jobs are picked before free users' ones.
+    Raises RenderQueueFull when the user has too many jobs in the queue.
+    """
+    active_jobs = RenderJob.objects.filter(
+        user=user, status__in=(RenderJob.Status.PENDING, RenderJob.Status.RUNNING),
+    ).exclude(document_format=RenderJob.DocumentFormat.PREVIEW)
+
+    job = active_jobs.filter(cv=cv_id, document_format=document_format).order_by('-id').first()
+    if job is not None:
+        return job
+
+    if active_jobs.count() >= settings.RENDER_JOB_MAX_ACTIVE_PER_USER:
+        raise RenderQueueFull()
+
+    return RenderJob.objects.create(
+        user=user,
+        cv_id=cv_id,
+        document_format=document_format,
+        priority=RenderJob.PRIORITY_NORMAL if user.is_free else RenderJob.PRIORITY_HIGH,
+        max_attempts=settings.RENDER_JOB_MAX_ATTEMPTS,
+    )
+
+
+def _postpone_cv_preview(cv_id, run_after):
+    return RenderJob.objects.filter(
+        cv=cv_id, document_format=RenderJob.DocumentFormat.PREVIEW, status=RenderJob.Status.PENDING,
+    ).update(run_after=run_after)
+
+
+def schedule_cv_preview(cv_id):
+    """
+    Queue the rendering of the preview of a cv once its edits have settled.
+
+    Every edit within CV_PREVIEW_DEBOUNCE seconds pushes the queued preview job back, so a
+    burst of edits gives a single render. A cv has at most one queued preview, the job
+    queued by a concurrent edit is postponed instead. Previews are claimed after the downloads.
+    """
+    run_after = timezone.now() + datetime.timedelta(seconds=settings.CV_PREVIEW_DEBOUNCE)
+    if _postpone_cv_preview(cv_id, run_after):
+        return
+
+    user_id = CvBuilder.objects.filter(pk=cv_id).values_list('user_id', flat=True).first()
+    if user_id is None:  # the cv was deleted
+        return
+
+    try:
+        with transaction.atomic():
+            RenderJob.objects.create(
+                user_id=user_id,
+                cv_id=cv_id,
+                document_format=RenderJob.DocumentFormat.PREVIEW,
+                priority=RenderJob.PRIORITY_LOW,
+                run_after=run_after,
+                max_attempts=settings.RENDER_JOB_MAX_ATTEMPTS,
+            )
+    except IntegrityError:  # render_job_one_pending_preview, queued meanwhile
+        _postpone_cv_preview(cv_id, run_after)
+
+
+def claim_render_job():
+    """
+    Take the next job off the queue and mark it running, returns None when the queue is empty.
+
+    Rows locked by other workers are skipped, so any number of workers can claim jobs
+    concurrently without taking the same one. A job left running past RENDER_JOB_TIMEOUT,
+    by a worker that died, is claimed again while it has attempts left. One that has none
+    left, e.g. a render killing its worker every time, is failed instead.
+    """
+    now = timezone.now()
+    abandoned = now - datetime.timedelta(seconds=settings.RENDER_JOB_TIMEOUT)
+
+    RenderJob.objects.filter(
+        status=RenderJob.Status.RUNNING, locked_at__lt=abandoned, attempts__gte=F('max_attempts'),
+    ).update(status=RenderJob.Status.FAILED, error='The render was abandoned too many times',
+             finished_at=now, locked_at=None, updated_at=now)
+
+    with transaction.atomic():
+        job = RenderJob.objects.select_for_update(skip_locked=True).filter(
+            Q(status=RenderJob.Status.PENDING, run_after__lte=now)
+            | Q(status=RenderJob.Status.RUNNING, locked_at__lt=abandoned, attempts__lt=F('max_attempts'))
+        ).order_by('-priority', 'run_after', 'id').first()
+        if job is None:
+            return None
+
+        job.status = RenderJob.Status.RUNNING
+        job.locked_at = now
+        job.attempts += 1
+        job.save(update_fields=['status', 'locked_at', 'attempts', 'updated_at'])
+    return job
+
+
+def _finish(job, status, error=''):
+    job.status = status
+    job.error = error
+    job.finished_at = timezone.now()
+    job.locked_at = None
+
+
+def _fail_or_retry(job, error, retry=True):
+    if job.document_format == RenderJob.DocumentFormat.PREVIEW and RenderJob.objects.filter(
+            cv=job.cv_id, document_format=job.document_format, status=RenderJob.Status.PENDING).exists():
+        retry = False  # a preview of a later edit is queued already
+
+    if retry and job.attempts < job.max_attempts:
+        # back off: RENDER_JOB_RETRY_DELAY, then twice as long after every failed attempt
+        delay = settings.RENDER_JOB_RETRY_DELAY * 2 ** (job.attempts - 1)
+        job.status = RenderJob.Status.PENDING
+        job.run_after = timezone.now() + datetime.timedelta(seconds=delay)
+        job.locked_at = None
+        job.error = error
+    else:
+        _finish(job, RenderJob.Status.FAILED, error)
+    job.save()
+
+
+def run_render_job(job):
+    """
+    Render and store the file of a claimed job, and deduct the user's download credit.
+
+    A failed render is retried until the job runs out of attempts. The credit of a paid
+    format is only deducted when the file is rendered, in the transaction marking the
+    job succeeded.
+    """
+    render_format = RENDER_FORMATS[job.document_format]
+
+    try:
+        document = load_cv_document(job.cv_id, job.user)
+        if document is None:
+            raise RenderJobError('The cv does not exist')
+        content_hash, content = render_format['render'](document, get_selected_template(job.cv_id))
+        render_format['store'](job, content_hash, content)
+    except RenderJobError as error:
+        _fail_or_retry(job, str(error), retry=False)
+        return job
+    except Exception as error:  # any rendering or storage error is retried
+        _fail_or_retry(job, f'{type(error).__name__}: {error}')
+        return job
+
+    with transaction.atomic():
+        # a job taken over by another worker after RENDER_JOB_TIMEOUT is finished by that worker
+        claimed = RenderJob.objects.select_for_update().filter(
+            pk=job.pk, status=RenderJob.Status.RUNNING, locked_at=job.locked_at,
+        ).exists()
+        if not claimed:
+            return job
+
+        if render_format['deduct'] is None:
+            _finish(job, RenderJob.Status.SUCCEEDED)
+            job.save()
+            return job
+
+        user = get_user_model().objects.select_for_update().get(pk=job.user_id)
+        if render_format['can_download'](user):
+            getattr(user, render_format['deduct'])()
+            _finish(job, RenderJob.Status.SUCCEEDED)
+        else:  # the credits were used up while the job was queued
+            _finish(job, RenderJob.Status.FAILED, render_format['limit_error'])
+        job.save()
+    return job
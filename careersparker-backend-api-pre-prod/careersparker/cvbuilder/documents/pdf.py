@@ -0,0 +1,116 @@
+import io
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import mm
+from reportlab.platypus import HRFlowable, KeepTogether, Paragraph, SimpleDocTemplate, Spacer
+
+from cvbuilder.documents.content import build_cv_layout
+from cvbuilder.documents.compiler import get_render_plan
+
+PDF_CONTENT_TYPE = 'application/pdf'
+
+
+def _styles(template):
+    text_color = colors.HexColor(template['text_color'])
+    accent_color = colors.HexColor(template['accent_color'])
+    muted_color = colors.HexColor(template['muted_color'])
+    body_size = template['body_size']
+
+    return {
+        'title': ParagraphStyle(
+            'title', fontName=template['bold_font'], fontSize=template['title_size'],
+            leading=template['title_size'] * 1.2, textColor=accent_color, spaceAfter=4 * mm,
+        ),
+        'heading': ParagraphStyle(
+            'heading', fontName=template['bold_font'], fontSize=template['heading_size'],
+            leading=template['heading_size'] * 1.3, textColor=accent_color, spaceBefore=5 * mm, spaceAfter=1 * mm,
+        ),
+        'entry_title': ParagraphStyle(
+            'entry_title', fontName=template['bold_font'], fontSize=body_size + 1, leading=(body_size + 1) * 1.3,
+            textColor=text_color, spaceBefore=2 * mm,
+        ),
+        'meta': ParagraphStyle(
+            'meta', fontName=template['italic_font'], fontSize=body_size - 1, leading=(body_size - 1) * 1.3,
+            textColor=muted_color,
+        ),
+        'body': ParagraphStyle(
+            'body', fontName=template['font'], fontSize=body_size, leading=body_size * 1.35, textColor=text_color,
+            spaceBefore=1 * mm,
+        ),
+        'bullet': ParagraphStyle(
+            'bullet', fontName=template['font'], fontSize=body_size, leading=body_size * 1.35, textColor=text_color,
+            leftIndent=5 * mm, bulletIndent=1 * mm,
+        ),
+    }
+
+
+def _markup(runs):
+    """
+    Return the reportlab paragraph markup of the runs of a rich text block.
+    """
+    parts = []
+    for text, bold, italic in runs:
+        if text == '\n':
+            parts.append('<br/>')
+            continue
+
+        text = escape(text)
+        if italic:
+            text = f'<i>{text}</i>'
+        if bold:
+            text = f'<b>{text}</b>'
+        parts.append(text)
+    return ''.join(parts)
+
+
+def _entry_flowables(entry, styles):
+    head = []
+    if entry['title']:
+        head.append(Paragraph(escape(entry['title']), styles['entry_title']))
+
+    meta = ' | '.join(value for value in (entry['subtitle'], entry['dates']) if value)
+    if meta:
+        head.append(Paragraph(escape(meta), styles['meta']))
+    for detail in entry['details']:
+        head.append(Paragraph(escape(detail), styles['meta']))
+
+    body = [
+        Paragraph(_markup(runs), styles['bullet'], bulletText='•') if bullet
+        else Paragraph(_markup(runs), styles['body'])
+        for bullet, runs in entry['body']
+    ]
+
+    # keep the entry header on the page of its first line of text
+    return [KeepTogether(head + body[:1])] + body[1:]
+
+
+def render_cv_pdf(document, template_name):
+    """
+    Render a serialized full cv to a PDF with the given template, returns the PDF bytes.
+    """
+    plan = get_render_plan(template_name)
+    template = plan.spec
+    styles = plan.part('pdf_styles', _styles)
+    layout = build_cv_layout(document)
+
+    story = [Paragraph(escape(layout['title']), styles['title'])]
+    for heading, entries in layout['sections']:
+        story.append(Paragraph(escape(heading.upper() if template['uppercase_headings'] else heading),
+                               styles['heading']))
+        if template['heading_rule']:
+            story.append(HRFlowable(width='100%', thickness=0.6, color=colors.HexColor(template['accent_color']),
+                                    spaceBefore=0, spaceAfter=1 * mm))
+        for entry in entries:
+            story.extend(_entry_flowables(entry, styles))
+        story.append(Spacer(1, 2 * mm))
+
+    output = io.BytesIO()
+    pdf = SimpleDocTemplate(
+        output, pagesize=A4, leftMargin=18 * mm, rightMargin=18 * mm, topMargin=16 * mm, bottomMargin=16 * mm,
+        title=layout['title'], author='CareerSparker', invariant=True,
+    )
+    pdf.build(story)
+    return output.getvalue()
@@ -0,0 +1,211 @@
+import functools
+import io
+import os
+
+import reportlab
+from django.core.files.base import ContentFile
+from django.utils import timezone
+from PIL import Image, ImageDraw, ImageFont
+
+from cvbuilder.documents.compiler import get_render_plan
+from cvbuilder.documents.content import build_cv_layout, cv_content_hash
+from cvbuilder.documents.templates import DEFAULT_TEMPLATE
+from cvbuilder.models import CvTemplate
+from util.Storage.s3_deletion import schedule_s3_deletion
+
+PREVIEW_DPI = 150
+PREVIEW_SIZE = (1240, 1754)  # an A4 page at PREVIEW_DPI, the largest cv template thumbnail
+PREVIEW_SMALL_SIZE = (310, 438)
+PREVIEW_QUALITY = 80
+
+# the TrueType fonts shipped with reportlab; thumbnails are too small for the serif of
+# the classic template to matter, so every template is previewed with the same family
+PREVIEW_FONT_DIR = os.path.join(os.path.dirname(reportlab.__file__), 'fonts')
+PREVIEW_FONTS = {
+    'regular': 'Vera.ttf',
+    'bold': 'VeraBd.ttf',
+    'italic': 'VeraIt.ttf',
+    'bold_italic': 'VeraBI.ttf',
+}
+
+
+class PageFull(Exception):
+    """
+    Nothing more fits on the previewed page.
+    """
+
+
+def _px(points):
+    return round(points * PREVIEW_DPI / 72)
+
+
+@functools.lru_cache(maxsize=64)
+def _font(style, size):
+    return ImageFont.truetype(os.path.join(PREVIEW_FONT_DIR, PREVIEW_FONTS[style]), _px(size))
+
+
+def _run_style(bold, italic):
+    if bold and italic:
+        return 'bold_italic'
+    return 'bold' if bold else 'italic' if italic else 'regular'
+
+
+# -------------------------------------------------------------------
+# First page raster
+# -------------------------------------------------------------------
+class PreviewPage:
+    """
+    The first page of a cv drawn with Pillow, laid out like the PDF at a lower fidelity.
+    """
+
+    def __init__(self):
+        self.image = Image.new('RGB', PREVIEW_SIZE, 'white')
+        self.draw = ImageDraw.Draw(self.image)
+        self.margin = _px(18 / 25.4 * 72)  # 18mm, the margin of the PDF
+        self.width = PREVIEW_SIZE[0] - 2 * self.margin
+        self.bottom = PREVIEW_SIZE[1] - self.margin
+        self.y = self.margin
+
+    def space(self, points):
+        self.y += _px(points)
+
+    def rule(self, color):
+        self.draw.line((self.margin, self.y, self.margin + self.width, self.y), fill=color, width=2)
+        self.space(3)
+
+    def _lines(self, runs, size, width):
+        lines, line_width = [[]], 0
+        for text, style in runs:
+            if text == '\n':
+                lines.append([])
+                line_width = 0
+                continue
+
+            font = _font(style, size)
+            for word in text.split():
+                word_width = font.getlength(word)
+                if lines[-1] and line_width + word_width > width:
+                    lines.append([])
+                    line_width = 0
+                lines[-1].append((line_width, word, font))
+                line_width += word_width + font.getlength(' ')
+        return lines
+
+    def paragraph(self, runs, size, color, bullet=False, leading=1.35):
+        """
+        Draw word wrapped (text, style) runs, raises PageFull at the bottom of the page.
+        """
+        indent = _px(14) if bullet else 0
+        line_height = _px(size * leading)
+
+        for number, line in enumerate(self._lines(runs, size, self.width - indent)):
+            if self.y + line_height > self.bottom:
+                raise PageFull()
+            if bullet and number == 0:
+                self.draw.text((self.margin + _px(4), self.y), '•', font=_font('regular', size), fill=color)
+            for x, word, font in line:
+                self.draw.text((self.margin + indent + x, self.y), word, font=font, fill=color)
+            self.y += line_height
+
+
+def render_cv_preview(document, template_name):
+    """
+    Render the first page of a serialized full cv to an image of PREVIEW_SIZE.
+    """
+    template = get_render_plan(template_name).spec
+    layout = build_cv_layout(document)
+    body_size = template['body_size']
+    page = PreviewPage()
+
+    try:
+        page.paragraph([(layout['title'], 'bold')], template['title_size'], template['accent_color'], leading=1.2)
+        page.space(6)
+
+        for heading, entries in layout['sections']:
+            page.space(8)
+            heading = heading.upper() if template['uppercase_headings'] else heading
+            page.paragraph([(heading, 'bold')], template['heading_size'], template['accent_color'])
+            if template['heading_rule']:
+                page.rule(template['accent_color'])
+
+            for entry in entries:
+                page.space(4)
+                if entry['title']:
+                    page.paragraph([(entry['title'], 'bold')], body_size + 1, template['text_color'])
+
+                meta = ' | '.join(value for value in (entry['subtitle'], entry['dates']) if value)
+                for line in ([meta] if meta else []) + entry['details']:
+                    page.paragraph([(line, 'italic')], body_size - 1, template['muted_color'])
+
+                for bullet, runs in entry['body']:
+                    runs = [(text, _run_style(bold, italic)) for text, bold, italic in runs]
+                    page.paragraph(runs, body_size, template['text_color'], bullet=bullet)
+    except PageFull:
+        pass  # only the first page is previewed
+
+    return page.image
+
+
+def encode_cv_preview(image, size):
+    """
+    Return the webp bytes of a preview image scaled down to size.
+    """
+    if image.size != size:
+        image = image.resize(size, Image.LANCZOS)
+    output = io.BytesIO()
+    image.save(output, format='webp', quality=PREVIEW_QUALITY)
+    return output.getvalue()
+
+
+def get_cv_preview(document, template_name):
+    """
+    Return the (content hash, {'large': webp, 'small': webp}) previews of a serialized full cv.
+    """
+    image = render_cv_preview(document, template_name)
+    return cv_content_hash(document, template_name, 'preview'), {
+        'large': encode_cv_preview(image, PREVIEW_SIZE),
+        'small': encode_cv_preview(image, PREVIEW_SMALL_SIZE),
+    }
+
+
+# -------------------------------------------------------------------
+# Storage
+# -------------------------------------------------------------------
+def _preview_name(cv_id, content_hash=''):
+    return f'cv-{cv_id}-preview-{content_hash[:16]}'
+
+
+def store_cv_preview(cv, content_hash, images):
+    """
+    Save the previews of a cv as the thumbnails of its cv template, created when it has none.
+
+    Nothing is stored when the thumbnails already show this content. The row is written
+    with queryset updates, which send no post_save, so storing a preview does not
+    schedule another one.
+    """
+    cv_template = CvTemplate.objects.filter(cv=cv).order_by('-updated_at', '-id').first()
+    if cv_template is None:
+        cv_template = CvTemplate.objects.bulk_create([
+            CvTemplate(user_id=cv.user_id, cv=cv, cv_template_name=DEFAULT_TEMPLATE),
+        ])[0]
+
+    name = _preview_name(cv.id, content_hash)
+    if name in os.path.basename(cv_template.cv_template_thumbnail.name or ''):
+        return
+
+    stored = {}
+    for field_name, size in (('cv_template_thumbnail', 'large'), ('cv_template_thumbnail_small', 'small')):
+        field = CvTemplate._meta.get_field(field_name)
+        filename = field.generate_filename(cv_template, f'{name}-{size}.webp')
+        stored[field_name] = field.storage.save(filename, ContentFile(images[size]))
+
+    # updated_at moves on so conditional reads of the template stop answering 304 with the
+    # replaced thumbnails, deleted below
+    CvTemplate.objects.filter(pk=cv_template.pk).update(**stored, updated_at=timezone.now())
+
+    # remove the previews replaced once the update is committed, leaving any thumbnail
+    # uploaded by other means alone
+    for field_name in stored:
+        previous = getattr(cv_template, field_name)
+        if previous and os.path.basename(previous.name).startswith(_preview_name(cv.id)):
+            schedule_s3_deletion(previous)
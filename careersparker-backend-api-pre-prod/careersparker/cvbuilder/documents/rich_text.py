@@ -0,0 +1,89 @@
+import re
+from html.parser import HTMLParser
+
+BLOCK_TAGS = frozenset({'p', 'div', 'li', 'ul', 'ol', 'blockquote', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'tr'})
+HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+BOLD_TAGS = frozenset({'b', 'strong'}) | HEADING_TAGS
+ITALIC_TAGS = frozenset({'i', 'em'})
+SKIPPED_TAGS = frozenset({'script', 'style'})
+
+WHITESPACE = re.compile(r'\s+')
+
+
+class _RichTextParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks = []
+        self._runs = []
+        self._bullet = False
+        self._bold = 0
+        self._italic = 0
+        self._skipped = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self._skipped += 1
+        elif tag == 'br':
+            self._runs.append(('\n', False, False))
+
+        if tag in BLOCK_TAGS:
+            self._flush()
+            self._bullet = tag == 'li'
+        if tag in BOLD_TAGS:
+            self._bold += 1
+        elif tag in ITALIC_TAGS:
+            self._italic += 1
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS:
+            self._skipped = max(self._skipped - 1, 0)
+
+        if tag in BOLD_TAGS:
+            self._bold = max(self._bold - 1, 0)
+        elif tag in ITALIC_TAGS:
+            self._italic = max(self._italic - 1, 0)
+        if tag in BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data):
+        if self._skipped:
+            return
+
+        text = WHITESPACE.sub(' ', data)
+        if not self._runs or self._runs[-1][0] == '\n':
+            text = text.lstrip()
+        if text:
+            self._runs.append((text, self._bold > 0, self._italic > 0))
+
+    def _flush(self):
+        runs = self._runs
+        while runs and not runs[-1][0].strip():
+            runs.pop()
+        if runs:
+            text, bold, italic = runs[-1]
+            runs[-1] = (text.rstrip(), bold, italic)
+            self.blocks.append((self._bullet, runs))
+
+        self._runs = []
+        self._bullet = False
+
+    def close(self):
+        super().close()
+        self._flush()
+
+
+def rich_text_blocks(html):
+    """
+    Split the html of a rich text field into format neutral blocks.
+
+    Returns a list of (bullet, runs) tuples, one per paragraph or list item. runs is a list of
+    (text, bold, italic) tuples, and a run of '\n' is a line break inside the block. Tags other
+    than paragraphs, lists, headings, bold and italic are dropped, keeping their text.
+    """
+    if not html:
+        return []
+
+    parser = _RichTextParser()
+    parser.feed(html)
+    parser.close()
+    return parser.blocks
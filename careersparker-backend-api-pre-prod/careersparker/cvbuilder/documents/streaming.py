@@ -0,0 +1,43 @@
+import zipfile
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# a fixed timestamp on every archive member, so the same content always gives the same bytes
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+class StreamSink:
+    """
+    Write-only, unseekable file object collecting the output of a writer between two reads.
+
+    zipfile writes an archive to it with data descriptors, since it cannot seek back, so
+    the archive can be handed out in chunks while it is written. drain() returns and
+    forgets what was written so far.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self.pending = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self.pending += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        self.pending = 0
+        return data
+
+
+def zip_info(name, date_time=ZIP_DATE_TIME):
+    """
+    Return the header of a deflated archive member.
+    """
+    info = zipfile.ZipInfo(name, date_time=date_time)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    return info
@@ -0,0 +1,53 @@
+DEFAULT_TEMPLATE = 'default'
+
+
+# -------------------------------------------------------------------
+# Document templates
+# -------------------------------------------------------------------
+# The look of a rendered cv, by template name. Colours are hex strings, sizes are points.
+# font/bold_font/italic_font are PDF base fonts, word_font the font family of Word documents.
+# Every renderer reads the same spec, so a cv looks alike in every format.
+DOCUMENT_TEMPLATES = {
+    'default': {
+        'font': 'Helvetica',
+        'bold_font': 'Helvetica-Bold',
+        'italic_font': 'Helvetica-Oblique',
+        'word_font': 'Arial',
+        'title_size': 22,
+        'heading_size': 13,
+        'body_size': 10,
+        'text_color': '#222222',
+        'accent_color': '#1F4E79',
+        'muted_color': '#666666',
+        'uppercase_headings': True,
+        'heading_rule': True,
+    },
+    'classic': {
+        'font': 'Times-Roman',
+        'bold_font': 'Times-Bold',
+        'italic_font': 'Times-Italic',
+        'word_font': 'Times New Roman',
+        'title_size': 24,
+        'heading_size': 14,
+        'body_size': 11,
+        'text_color': '#000000',
+        'accent_color': '#000000',
+        'muted_color': '#444444',
+        'uppercase_headings': False,
+        'heading_rule': True,
+    },
+    'modern': {
+        'font': 'Helvetica',
+        'bold_font': 'Helvetica-Bold',
+        'italic_font': 'Helvetica-Oblique',
+        'word_font': 'Arial',
+        'title_size': 26,
+        'heading_size': 12,
+        'body_size': 10,
+        'text_color': '#2D3436',
+        'accent_color': '#00897B',
+        'muted_color': '#7F8C8D',
+        'uppercase_headings': True,
+        'heading_rule': False,
+    },
+}
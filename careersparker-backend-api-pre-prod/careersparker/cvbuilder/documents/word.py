@@ -0,0 +1,186 @@
+import re
+import zipfile
+from xml.sax.saxutils import escape, quoteattr
+
+from cvbuilder.documents.content import build_cv_layout
+from cvbuilder.documents.streaming import STREAM_CHUNK_SIZE, StreamSink, zip_info
+from cvbuilder.documents.compiler import get_render_plan
+
+DOCX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+# characters XML 1.0 does not allow, e.g. control characters pasted into the editor
+INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+W_NAMESPACE = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '<Override PartName="/word/numbering.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml"/>'
+    '</Types>'
+)
+
+PACKAGE_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+DOCUMENT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering" '
+    'Target="numbering.xml"/>'
+    '</Relationships>'
+)
+
+# a single bullet list definition, used by every list item (numId 1)
+NUMBERING_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    f'<w:numbering xmlns:w="{W_NAMESPACE}">'
+    '<w:abstractNum w:abstractNumId="0"><w:multiLevelType w:val="singleLevel"/>'
+    '<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="bullet"/><w:lvlText w:val="•"/>'
+    '<w:lvlJc w:val="left"/><w:pPr><w:ind w:left="360" w:hanging="360"/></w:pPr></w:lvl>'
+    '</w:abstractNum>'
+    '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+    '</w:numbering>'
+)
+
+
+# -------------------------------------------------------------------
+# WordprocessingML
+# -------------------------------------------------------------------
+def _text(value):
+    return escape(INVALID_XML_CHARS.sub('', value))
+
+
+def _run(text, bold=False, italic=False):
+    if text == '\n':
+        return '<w:r><w:br/></w:r>'
+
+    properties = ('<w:b/>' if bold else '') + ('<w:i/>' if italic else '')
+    properties = f'<w:rPr>{properties}</w:rPr>' if properties else ''
+    return f'<w:r>{properties}<w:t xml:space="preserve">{_text(text)}</w:t></w:r>'
+
+
+def _paragraph(runs, style=None, bullet=False):
+    properties = f'<w:pStyle w:val="{style}"/>' if style else ''
+    if bullet:
+        properties += '<w:numPr><w:ilvl w:val="0"/><w:numId w:val="1"/></w:numPr>'
+    properties = f'<w:pPr>{properties}</w:pPr>' if properties else ''
+    return f'<w:p>{properties}{"".join(_run(*run) for run in runs)}</w:p>'
+
+
+def _styles_xml(template):
+    font = quoteattr(template['word_font'])
+    text_color = template['text_color'].lstrip('#')
+    accent_color = template['accent_color'].lstrip('#')
+    muted_color = template['muted_color'].lstrip('#')
+    caps = '<w:caps/>' if template['uppercase_headings'] else ''
+    rule = f'<w:pBdr><w:bottom w:val="single" w:sz="4" w:space="1" w:color="{accent_color}"/></w:pBdr>' \
+        if template['heading_rule'] else ''
+
+    def style(style_id, name, run_properties, paragraph_properties=''):
+        return (
+            f'<w:style w:type="paragraph" w:styleId="{style_id}"><w:name w:val="{name}"/>'
+            f'<w:basedOn w:val="Normal"/><w:pPr>{paragraph_properties}</w:pPr><w:rPr>{run_properties}</w:rPr>'
+            '</w:style>'
+        )
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:styles xmlns:w="{W_NAMESPACE}">'
+        f'<w:docDefaults><w:rPrDefault><w:rPr><w:rFonts w:ascii={font} w:hAnsi={font} w:cs={font}/>'
+        f'<w:color w:val="{text_color}"/><w:sz w:val="{template["body_size"] * 2}"/></w:rPr></w:rPrDefault>'
+        '<w:pPrDefault><w:pPr><w:spacing w:after="60"/></w:pPr></w:pPrDefault></w:docDefaults>'
+        '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>'
+        + style('Title', 'Title', f'<w:b/><w:color w:val="{accent_color}"/><w:sz w:val="{template["title_size"] * 2}"/>',
+                '<w:spacing w:after="240"/>')
+        + style('Heading1', 'heading 1',
+                f'<w:b/>{caps}<w:color w:val="{accent_color}"/><w:sz w:val="{template["heading_size"] * 2}"/>',
+                f'<w:keepNext/><w:spacing w:before="280" w:after="80"/>{rule}')
+        + style('Heading2', 'heading 2', f'<w:b/><w:sz w:val="{(template["body_size"] + 1) * 2}"/>',
+                '<w:keepNext/><w:spacing w:before="120" w:after="0"/>')
+        + style('EntryMeta', 'Entry Meta', f'<w:i/><w:color w:val="{muted_color}"/>'
+                                           f'<w:sz w:val="{(template["body_size"] - 1) * 2}"/>',
+                '<w:keepNext/><w:spacing w:after="40"/>')
+        + '</w:styles>'
+    )
+
+
+def _document_paragraphs(layout):
+    """
+    Yield the paragraphs of the document body, one section entry at a time.
+    """
+    yield _paragraph([(layout['title'],)], style='Title')
+
+    for heading, entries in layout['sections']:
+        yield _paragraph([(heading,)], style='Heading1')
+
+        for entry in entries:
+            if entry['title']:
+                yield _paragraph([(entry['title'],)], style='Heading2')
+
+            meta = ' | '.join(value for value in (entry['subtitle'], entry['dates']) if value)
+            for line in ([meta] if meta else []) + entry['details']:
+                yield _paragraph([(line,)], style='EntryMeta')
+
+            for bullet, runs in entry['body']:
+                yield _paragraph(runs, bullet=bullet)
+
+
+# -------------------------------------------------------------------
+# Streaming .docx archive
+# -------------------------------------------------------------------
+def iter_cv_docx(document, template_name):
+    """
+    Render a serialized full cv to a .docx archive, yielding the archive in chunks.
+
+    The archive is written to an unseekable sink and handed out whenever STREAM_CHUNK_SIZE
+    bytes are pending, so only one chunk and the deflate window are held in memory at a time,
+    whatever the length of the cv.
+    """
+    plan = get_render_plan(template_name)
+    layout = build_cv_layout(document)
+    sink = StreamSink()
+
+    with zipfile.ZipFile(sink, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in (
+                ('[Content_Types].xml', CONTENT_TYPES_XML),
+                ('_rels/.rels', PACKAGE_RELS_XML),
+                ('word/_rels/document.xml.rels', DOCUMENT_RELS_XML),
+                ('word/styles.xml', plan.part('word_styles', _styles_xml)),
+                ('word/numbering.xml', NUMBERING_XML),
+        ):
+            archive.writestr(zip_info(name), content)
+
+        with archive.open(zip_info('word/document.xml'), mode='w') as part:
+            part.write(
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                f'<w:document xmlns:w="{W_NAMESPACE}"><w:body>'.encode()
+            )
+            for paragraph in _document_paragraphs(layout):
+                part.write(paragraph.encode())
+                if sink.pending >= STREAM_CHUNK_SIZE:
+                    yield sink.drain()
+
+            # A4 page with 2cm margins
+            part.write(
+                '<w:sectPr><w:pgSz w:w="11906" w:h="16838"/>'
+                '<w:pgMar w:top="1134" w:right="1134" w:bottom="1134" w:left="1134" w:header="708" '
+                'w:footer="708" w:gutter="0"/></w:sectPr></w:body></w:document>'.encode()
+            )
+
+    yield sink.drain()
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from cvbuilder.cache import get_cv_document_cache_stats, reset_cv_document_cache_stats
+
+
+class Command(BaseCommand):
+    """
+    Print the hit/miss counters of the cv document cache.
+
+    The counters live in the shared cache, without REDIS_URL nothing is cached or counted.
+    """
+
+    help = 'Show hit/miss counters of the cv document cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Reset the counters after printing them')
+
+    def handle(self, *args, **options):
+        stats = get_cv_document_cache_stats()
+        self.stdout.write(
+            f"hits: {stats['hits']}  misses: {stats['misses']}  hit ratio: {stats['hit_ratio']:.2%}"
+        )
+
+        if options['reset']:
+            reset_cv_document_cache_stats()
+            self.stdout.write('Counters reset')
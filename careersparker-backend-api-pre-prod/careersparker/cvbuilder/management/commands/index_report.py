@@ -0,0 +1,90 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+# every query is limited to the schemas of the search_path, each environment keeps its tables
+# in its own schema and a table of the same name in another schema must not be reported
+UNUSED_INDEXES_SQL = """
+    SELECT s.relname, s.indexrelname, s.idx_scan, pg_relation_size(s.indexrelid)
+    FROM pg_stat_user_indexes s
+    JOIN pg_index i ON i.indexrelid = s.indexrelid
+    WHERE s.schemaname = ANY(current_schemas(false)) AND s.relname = ANY(%s)
+        AND s.idx_scan <= %s AND NOT i.indisunique AND NOT i.indisprimary
+    ORDER BY pg_relation_size(s.indexrelid) DESC
+"""
+
+EXISTING_INDEXES_SQL = """
+    SELECT indexname FROM pg_indexes
+    WHERE schemaname = ANY(current_schemas(false)) AND tablename = ANY(%s)
+"""
+
+SEQ_SCAN_TABLES_SQL = """
+    SELECT relname, seq_scan, seq_tup_read, COALESCE(idx_scan, 0), n_live_tup
+    FROM pg_stat_user_tables
+    WHERE schemaname = ANY(current_schemas(false)) AND relname = ANY(%s)
+        AND n_live_tup >= %s AND seq_scan > COALESCE(idx_scan, 0)
+    ORDER BY seq_tup_read DESC
+"""
+
+
+class Command(BaseCommand):
+    """
+    Report unused and missing indexes of the app tables, from the PostgreSQL statistics views.
+
+    Unused: non unique indexes scanned at most --max-scans times since the statistics were reset.
+    Missing: indexes declared in a model Meta but not in the database (migration not applied),
+    and tables read mostly by sequential scans.
+    """
+
+    help = 'Report unused and missing indexes from pg_stat_user_indexes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--app', action='append', dest='apps', help='Only report the tables of this app')
+        parser.add_argument('--max-scans', type=int, default=0, help='Report indexes scanned at most this many times')
+        parser.add_argument('--min-rows', type=int, default=10000,
+                            help='Only report sequential scans on tables with at least this many rows')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('The index report needs the PostgreSQL statistics views')
+
+        app_configs = [apps.get_app_config(label) for label in options['apps']] if options['apps'] \
+            else apps.get_app_configs()
+        models = [model for app_config in app_configs for model in app_config.get_models()]
+        tables = sorted({model._meta.db_table for model in models})
+
+        with connection.cursor() as cursor:
+            cursor.execute(UNUSED_INDEXES_SQL, [tables, options['max_scans']])
+            unused = cursor.fetchall()
+
+            cursor.execute(EXISTING_INDEXES_SQL, [tables])
+            existing = {row[0] for row in cursor.fetchall()}
+
+            cursor.execute(SEQ_SCAN_TABLES_SQL, [tables, options['min_rows']])
+            seq_scanned = cursor.fetchall()
+
+        self.stdout.write('Unused indexes:')
+        for table, index, scans, size in unused:
+            self.stdout.write(f'  {table}.{index}: {scans} scans, {size} bytes')
+        if not unused:
+            self.stdout.write('  none')
+
+        self.stdout.write('Declared indexes missing from the database:')
+        missing = [
+            (model._meta.db_table, index.name)
+            for model in models for index in model._meta.indexes
+            if index.name not in existing
+        ]
+        for table, index in missing:
+            self.stdout.write(f'  {table}.{index}')
+        if not missing:
+            self.stdout.write('  none')
+
+        self.stdout.write('Tables read mostly by sequential scans:')
+        for table, seq_scans, rows_read, index_scans, rows in seq_scanned:
+            self.stdout.write(
+                f'  {table}: {seq_scans} sequential scans ({rows_read} rows read), {index_scans} index scans, '
+                f'{rows} rows'
+            )
+        if not seq_scanned:
+            self.stdout.write('  none')
@@ -0,0 +1,93 @@
+import datetime
+import json
+import timeit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from cvbuilder.models import CvBuilder
+from cvbuilder.sections.registry import SECTIONS
+from cvbuilder.serializers import CvBuilderSerializer
+from util.Renderer.orjson_renderer import OrjsonRenderer
+
+# a rich text body close to what the editor produces for a long job description
+RICH_TEXT = ''.join(
+    f'<p><strong>Project {index}</strong> &ndash; led a team of engineers, '
+    f'shipped the <em>billing</em> &amp; <em>reporting</em> services.</p>'
+    f'<ul><li>Cut p95 latency by {index * 3}%</li><li>Migrated {index} services</li></ul>'
+    for index in range(8)
+)
+
+
+def _seed_value(field, index, now):
+    if isinstance(field, models.DateTimeField):
+        return now
+    if isinstance(field, models.DateField):
+        return datetime.date(2015, 1, 1) + datetime.timedelta(days=30 * index)
+    if isinstance(field, models.BooleanField):
+        return index % 2 == 0
+    if isinstance(field, models.IntegerField):
+        return index % 5
+    if isinstance(field, models.TextField):
+        return RICH_TEXT
+    if isinstance(field, models.CharField):
+        return f'{field.verbose_name} {index}'
+    return None
+
+
+def seed_cv_document(entries):
+    """
+    Return the full cv document of an unsaved cv with the given number of entries per section.
+
+    The entries are built in memory from the section models, so no database rows are written.
+    """
+    now = timezone.now()
+    cv = CvBuilder(id=1, user_id=1, cv_title='Benchmark CV', cv_slug='benchmark-cv', created_at=now, updated_at=now)
+    document = dict(CvBuilderSerializer(cv).data)
+
+    for section in SECTIONS:
+        instances = []
+        for index in range(entries):
+            instance = section.model(id=index + 1, cv_id=cv.id, user_id=cv.user_id)
+            for field in section.model._meta.concrete_fields:
+                if field.primary_key or field.is_relation:
+                    continue
+                value = _seed_value(field, index, now)
+                if value is not None:
+                    setattr(instance, field.attname, value)
+            instances.append(instance)
+        document[section.name] = section.serializer_class(instances, many=True).data
+
+    return document
+
+
+class Command(BaseCommand):
+    """
+    Compare the orjson renderer with DRF's JSONRenderer on a seeded large cv.
+    """
+
+    help = 'Benchmark the orjson renderer against the stock DRF JSON renderer'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--entries', type=int, default=30, help='Entries per section of the seeded cv')
+        parser.add_argument('--iterations', type=int, default=200, help='Renders per renderer')
+
+    def handle(self, *args, **options):
+        document = seed_cv_document(options['entries'])
+
+        stock, fast = JSONRenderer(), OrjsonRenderer()
+        stock_output, fast_output = stock.render(document), fast.render(document)
+        if json.loads(stock_output) != json.loads(fast_output):
+            raise CommandError('The orjson renderer output differs from the stock renderer output')
+
+        self.stdout.write(f'Payload: {len(stock_output)} bytes (stock), {len(fast_output)} bytes (orjson)')
+
+        results = {}
+        for name, renderer in (('stock', stock), ('orjson', fast)):
+            seconds = timeit.timeit(lambda: renderer.render(document), number=options['iterations'])
+            results[name] = seconds / options['iterations']
+            self.stdout.write(f'{name}: {results[name] * 1000:.3f} ms per render')
+
+        self.stdout.write(f'Speedup: {results["stock"] / results["orjson"]:.1f}x')
@@ -0,0 +1,93 @@
+import multiprocessing
+import signal
+import sys
+
+import django
+from django.core.management.base import BaseCommand, OutputWrapper
+from django.db import close_old_connections, connection
+
+
+def work(stop, poll_interval, once, stdout):
+    """
+    Claim and render one job at a time until stop is set, or the queue is empty with once.
+    """
+    # imported here, a spawned worker process loads this module before django.setup()
+    from cvbuilder.documents.jobs import claim_render_job, run_render_job
+
+    try:
+        while not stop.is_set():
+            close_old_connections()
+            job = claim_render_job()
+            if job is None:
+                if once:
+                    return
+                stop.wait(poll_interval)
+                continue
+
+            job = run_render_job(job)
+            stdout.write(
+                f'{job.document_format} job {job.id} (cv {job.cv_id}): {job.status}'
+                + (f' - {job.error}' if job.error else '')
+            )
+    finally:
+        connection.close()
+
+
+def _work_in_process(stop, poll_interval, once):
+    # Ctrl-C reaches every process of the group, the parent stops the workers through stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    django.setup()
+    work(stop, poll_interval, once, OutputWrapper(sys.stdout))
+
+
+class Command(BaseCommand):
+    """
+    Process the cv render job queue.
+
+    Rendering is CPU bound, so each of the --concurrency workers is a separate process that
+    claims and renders one job at a time. The number of documents rendered at once on this
+    host is bounded by it. Several workers can run on several hosts against the same queue.
+    """
+
+    help = 'Render queued cv pdf/word documents'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=1,
+                            help='Number of worker processes, each renders one job at a time')
+        parser.add_argument('--poll-interval', type=float, default=2.0,
+                            help='Seconds to wait before polling an empty queue again')
+        parser.add_argument('--once', action='store_true', help='Exit once the queue is empty')
+
+    def handle(self, *args, **options):
+        concurrency = max(options['concurrency'], 1)
+        context = multiprocessing.get_context('spawn')
+        stop = context.Event()
+
+        if concurrency == 1:
+            previous = signal.signal(signal.SIGINT, lambda signum, frame: self.request_stop(stop))
+            try:
+                work(stop, options['poll_interval'], options['once'], self.stdout)
+            finally:
+                signal.signal(signal.SIGINT, previous)
+            return
+
+        # spawned, not forked, so no worker shares the database connection of this process
+        connection.close()
+        processes = [
+            context.Process(target=_work_in_process, args=(stop, options['poll_interval'], options['once']))
+            for _ in range(concurrency)
+        ]
+        for process in processes:
+            process.start()
+
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            self.request_stop(stop)
+            for process in processes:
+                process.join()
+
+    def request_stop(self, stop):
+        self.stdout.write('Stopping once the running jobs are finished')
+        stop.set()
@@ -2,8 +2,10 @@ from autoslug import AutoSlugField
 from ckeditor.fields import RichTextField
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
-from util.Storage.media_storage_path import get_upload_cv_template_path, get_upload_cv_template_list_path
+from util.Storage.media_storage_path import get_upload_cv_template_path, get_upload_cv_template_list_path, \
+    get_upload_rendered_cv_path
 from util.general.general_util import slugify_function
 
 
@@ -27,6 +29,9 @@ class CvBuilder(models.Model):
     class Meta:
         verbose_name = 'Cv'
         verbose_name_plural = 'Cvs'
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-id'], name='cv_user_created_idx'),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -43,6 +48,8 @@ class CvTemplateList(models.Model):
     cv_template_profession = models.CharField(max_length=255, blank=True)
     cv_template_thumbnail = models.ImageField(upload_to=get_upload_cv_template_list_path, blank=True)
     cv_template_thumbnail_small = models.ImageField(upload_to=get_upload_cv_template_path, blank=True)
+    cv_template_thumbnail_retina = models.ImageField(upload_to=get_upload_cv_template_path, blank=True)
+    cv_template_thumbnail_variants = models.JSONField(default=dict, blank=True)
     created_at = models.DateTimeField(auto_now_add=True, null=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -97,6 +104,9 @@ class EmploymentHistory(models.Model):  # CV Employment History
     class Meta:
         verbose_name = 'EmploymentHistory'
         verbose_name_plural = 'EmploymentHistories'  #
+        indexes = [
+            models.Index(fields=['cv', '-employer_name', 'id'], name='employment_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -127,6 +137,9 @@ class Education(models.Model):
     class Meta:
         verbose_name = 'Education'
         verbose_name_plural = 'Educations'
+        indexes = [
+            models.Index(fields=['cv', 'id'], name='education_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -151,6 +164,9 @@ class Skill(models.Model):
     class Meta:
         verbose_name = 'Skill'
         verbose_name_plural = 'Skills'
+        indexes = [
+            models.Index(fields=['cv', '-skill_name', 'id'], name='skill_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -173,6 +189,9 @@ class Strength(models.Model):
     class Meta:
         verbose_name = 'Strength'
         verbose_name_plural = 'Strengths'
+        indexes = [
+            models.Index(fields=['cv', '-strength_name', 'id'], name='strength_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -200,6 +219,9 @@ class Award(models.Model):
     class Meta:
         verbose_name = 'Award'
         verbose_name_plural = 'Awards'
+        indexes = [
+            models.Index(fields=['cv', 'id'], name='award_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -226,6 +248,9 @@ class Certificate(models.Model):
     class Meta:
         verbose_name = 'Certificate'
         verbose_name_plural = 'Certificates'
+        indexes = [
+            models.Index(fields=['cv', 'id'], name='certificate_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -252,6 +277,9 @@ class Publication(models.Model):
     class Meta:
         verbose_name = 'Publication'
         verbose_name_plural = 'Publications'
+        indexes = [
+            models.Index(fields=['cv', 'id'], name='publication_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -271,6 +299,9 @@ class Achievement(models.Model):
     class Meta:
         verbose_name = 'Achievement'
         verbose_name_plural = 'Achievements'
+        indexes = [
+            models.Index(fields=['cv', 'id'], name='achievement_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -294,6 +325,9 @@ class Hobby(models.Model):
     class Meta:
         verbose_name = 'Hobby'
         verbose_name_plural = 'Hobbies'
+        indexes = [
+            models.Index(fields=['cv', 'id'], name='hobby_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -321,6 +355,9 @@ class Reference(models.Model):
     class Meta:
         verbose_name = 'reference'
         verbose_name_plural = 'References'
+        indexes = [
+            models.Index(fields=['cv', 'id'], name='reference_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -350,6 +387,9 @@ class Internship(models.Model):
     class Meta:
         verbose_name = 'internship'
         verbose_name_plural = 'Internships'
+        indexes = [
+            models.Index(fields=['cv', 'id'], name='internship_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -378,6 +418,9 @@ class Course(models.Model):
     class Meta:
         verbose_name = 'Course'
         verbose_name_plural = 'Courses'
+        indexes = [
+            models.Index(fields=['cv', 'id'], name='course_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -400,6 +443,9 @@ class Language(models.Model):
     class Meta:
         verbose_name = 'Language'
         verbose_name_plural = 'Languages'
+        indexes = [
+            models.Index(fields=['cv', 'id'], name='language_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -428,6 +474,9 @@ class Volunteering(models.Model):
     class Meta:
         verbose_name = 'Volunteering'
         verbose_name_plural = 'Volunteering'
+        indexes = [
+            models.Index(fields=['cv', 'id'], name='volunteering_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -451,6 +500,9 @@ class social_media(models.Model):
     class Meta:
         verbose_name = 'Social Media'
         verbose_name_plural = 'Social Media'
+        indexes = [
+            models.Index(fields=['cv', 'id'], name='social_media_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -480,6 +532,9 @@ class CustomSection(models.Model):
     class Meta:
         verbose_name = 'Custom Section'
         verbose_name_plural = 'Custom Sections'
+        indexes = [
+            models.Index(fields=['cv', 'id'], name='custom_section_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -503,6 +558,9 @@ class Graph(models.Model):
     class Meta:
         verbose_name = 'Graph'
         verbose_name_plural = 'Graphs'
+        indexes = [
+            models.Index(fields=['cv', 'id'], name='graph_cv_order_idx', include=['updated_at']),
+        ]
 
 
 # -------------------------------------------------------------------
@@ -523,3 +581,64 @@ class TextSection(models.Model):
     class Meta:
         verbose_name = 'Text Section'
         verbose_name_plural = 'Text Sections'
+        indexes = [
+            models.Index(fields=['cv', 'id'], name='text_section_cv_order_idx', include=['updated_at']),
+        ]
+
+
+# -------------------------------------------------------------------
+# Render Job Model
+# -------------------------------------------------------------------
+
+class RenderJob(models.Model):
+    """A queued pdf/word rendering of a cv, processed by the render_worker command"""
+
+    class DocumentFormat(models.TextChoices):
+        PDF = 'pdf', 'PDF'
+        DOCX = 'docx', 'Word'
+        PREVIEW = 'preview', 'Preview'
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        RUNNING = 'running', 'Running'
+        SUCCEEDED = 'succeeded', 'Succeeded'
+        FAILED = 'failed', 'Failed'
+
+    PRIORITY_LOW = -10
+    PRIORITY_NORMAL = 0
+    PRIORITY_HIGH = 10
+
+    id = models.AutoField(primary_key=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='render_jobs')
+    cv = models.ForeignKey(CvBuilder, on_delete=models.CASCADE, related_name='render_jobs')
+    document_format = models.CharField(max_length=10, choices=DocumentFormat.choices)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    priority = models.SmallIntegerField(default=PRIORITY_NORMAL)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    content_hash = models.CharField(max_length=64, blank=True)
+    result = models.FileField(upload_to=get_upload_rendered_cv_path, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self):
+        return f'{self.document_format} render of cv {self.cv_id} ({self.status})'
+
+    class Meta:
+        verbose_name = 'Render Job'
+        verbose_name_plural = 'Render Jobs'
+        indexes = [
+            # the worker's claim query: pending jobs by priority, then oldest first
+            models.Index(fields=['-priority', 'run_after', 'id'], name='render_job_queue_idx',
+                         condition=models.Q(status='pending')),
+            models.Index(fields=['user', 'status'], name='render_job_user_status_idx'),
+        ]
+        constraints = [
+            # edits of a cv postpone its one queued preview instead of queueing another
+            models.UniqueConstraint(fields=['cv'], name='render_job_one_pending_preview',
+                                    condition=models.Q(status='pending', document_format='preview')),
+        ]
@@ -0,0 +1,50 @@
+from rest_framework.pagination import CursorPagination
+
+
+# -------------------------------------------------------------------
+# Keyset pagination
+# -------------------------------------------------------------------
+# Cursor pagination filters on the sort column of the last row returned instead of using
+# OFFSET, and skips the COUNT(*), so every page costs the same single indexed query.
+#
+# DRF positions the cursor on the first ordering field only, the other fields just make the
+# order stable. Rows that tie on the first field are skipped with an offset stored in the
+# cursor, so a page boundary inside a run of tied values reads and discards that run again.
+
+class OptInCursorPagination(CursorPagination):
+    """
+    Cursor pagination a list only uses when the client asks for it, see is_requested().
+    """
+
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def is_requested(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+
+class CvCursorPagination(OptInCursorPagination):
+    """
+    Pagination of the cvs of a user, newest first.
+
+    The cursor is positioned on created_at, id only breaks ties. Cvs created in the same
+    microsecond are paged through the cursor offset. Without ?cursor= or ?page_size= the cv
+    list keeps its page number pagination.
+    """
+
+    ordering = ('-created_at', '-id')
+
+
+class SectionCursorPagination(OptInCursorPagination):
+    """
+    Pagination of the entries of a cv section, positioned on the first field of the section
+    ordering.
+
+    Section lists stay unpaginated unless the client asks for a page, see is_requested().
+    """
+
+    page_size = 50
+
+    def __init__(self, ordering):
+        self.ordering = ordering
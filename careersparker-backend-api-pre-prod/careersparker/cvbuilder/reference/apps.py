@@ -1,6 +0,0 @@
-from django.apps import AppConfig
-
-
-class ReferenceConfig(AppConfig):
-    default_auto_field = 'django.db.models.BigAutoField'
-    name = 'cvbuilder.reference'
@@ -0,0 +1,106 @@
+import re
+
+from django.db.models import Prefetch
+
+from cvbuilder.models import EmploymentHistory, Education, Skill, Strength, Award, Certificate, Publication, \
+    Achievement, Hobby, Reference, Internship, Course, Language, Volunteering, social_media, CustomSection, Graph, \
+    TextSection
+from cvbuilder.sections.serializers import section_serializer_factory
+
+
+class Section:
+    """
+    Declarative spec of a cv section.
+
+    The section views, urls, serializer, the full cv prefetch, the bulk operations and the
+    cache invalidation signals are all generated from these specs.
+
+    Attributes:
+        name: The related name of the section on CvBuilder, also its key in the full cv and bulk payloads.
+        model: The section model.
+        url_prefix: The url of the section, under cvbuilder/.
+        tag: The OpenAPI tag of the section views.
+        title: The heading of the section in rendered documents, the model verbose_name_plural by default.
+        cv_url: The url segment in front of the cv id on the by cv id endpoint.
+        url_names: The (by cv id, by id) url names.
+        response_key: The key the list of entries is returned under, None for a bare list.
+        entry_response_key: The key a single entry is returned under by the by id endpoint, None for
+            the bare entry.
+        entry_as_list: Whether the by id endpoint returns the entry in a one item list.
+        ordering: The order of the entries in every list of the section, backed by a (cv, *ordering) index.
+        premium: Whether creating or updating an entry is a premium feature.
+        unique_field: A field whose value can only appear once per cv.
+    """
+
+    def __init__(self, name, model, url_prefix, tag, title=None, cv_url='cv', url_names=None, response_key=None,
+                 entry_response_key=None, entry_as_list=False, ordering=('id',), premium=True, unique_field=None):
+        self.name = name
+        self.model = model
+        self.url_prefix = url_prefix
+        self.tag = tag
+        self.title = title or str(model._meta.verbose_name_plural)
+        self.cv_url = cv_url
+        self.url_names = url_names or (f'{url_prefix}_by_cv_id', f'{url_prefix}_by_id')
+        self.response_key = response_key
+        self.entry_response_key = entry_response_key
+        self.entry_as_list = entry_as_list
+        self.ordering = tuple(ordering)
+        self.premium = premium
+        self.unique_field = unique_field
+
+        # e.g. social_media -> SocialMedia, used to name the generated classes
+        self.class_prefix = ''.join(part.capitalize() for part in re.split(r'[-_]', url_prefix))
+        self.serializer_class = section_serializer_factory(model, f'{self.class_prefix}Serializer')
+
+    def __repr__(self):
+        return f'<Section {self.name}>'
+
+    def get_queryset(self):
+        return self.model.objects.order_by(*self.ordering)
+
+    def get_prefetch(self):
+        return Prefetch(self.name, queryset=self.get_queryset())
+
+
+# every section of a cv, in the order of the full cv
+SECTIONS = (
+    Section('cv_employment_history', EmploymentHistory, 'employment-history', 'CV: Employment History',
+            title='Employment History',
+            url_names=('employment_history_by_cv_id', 'employment_history'), response_key='employment history',
+            entry_response_key='employment history',
+            ordering=('-employer_name', 'id'), premium=False),
+    Section('educations', Education, 'education', 'CV: Education', title='Education',
+            url_names=('cv_education_id', 'education'), response_key='education', premium=False),
+    Section('skills', Skill, 'skill', 'CV: Skill', cv_url='cvbuilder',
+            url_names=('skill_cv_id', 'skill'), response_key='skills', entry_response_key='skills', entry_as_list=True,
+            ordering=('-skill_name', 'id'), premium=False, unique_field='skill_name'),
+    Section('strengths', Strength, 'strength', 'CV: Strength', cv_url='cvbuilder',
+            url_names=('strength_cv_id', 'strength'), response_key='strengths',
+            ordering=('-strength_name', 'id'), unique_field='strength_name'),
+    Section('awards', Award, 'award', 'CV: Award', response_key='awards'),
+    Section('certifications', Certificate, 'certificate', 'CV: Certificate', response_key='certificates'),
+    Section('publications', Publication, 'publication', 'CV: Publication', response_key='publications'),
+    Section('achievements', Achievement, 'achievement', 'CV: Achievement', response_key='achievements'),
+    Section('hobbies', Hobby, 'hobby', 'CV: Hobby', response_key='hobbies'),
+    Section('references', Reference, 'reference', 'CV: Reference', response_key='references'),
+    Section('internships', Internship, 'internship', 'CV: Internship', response_key='internships'),
+    Section('cv_courses', Course, 'course', 'CV: Course'),
+    Section('languages', Language, 'language', 'CV Builder: Language',
+            url_names=('Language_by_cv_id', 'Language_by_id')),
+    Section('volunteering', Volunteering, 'volunteering', 'CV: Volunteering'),
+    Section('social_media', social_media, 'social_media', 'CV: Social Media'),
+    Section('custom_sections', CustomSection, 'custom_section', 'CV: Custom Section', cv_url='cvbuilder',
+            url_names=('custom_section_cv_id', 'custom_section')),
+    Section('graphs', Graph, 'graph', 'CV: Graph', cv_url='cvbuilder', url_names=('graph_cv_id', 'graph')),
+    Section('text_sections', TextSection, 'text', 'CV: Text', title='Other', cv_url='cvbuilder',
+            url_names=('text_cv_id', 'text')),
+)
+
+SECTIONS_BY_NAME = {section.name: section for section in SECTIONS}
+
+
+def get_section(name):
+    """
+    Return the section spec of a related name, raises KeyError for an unknown section.
+    """
+    return SECTIONS_BY_NAME[name]
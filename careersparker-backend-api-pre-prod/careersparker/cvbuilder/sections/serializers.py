@@ -0,0 +1,23 @@
+from rest_framework import serializers
+
+from cvbuilder.sparse_fields import SparseFieldsSerializerMixin
+
+
+class SectionSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """
+    Base serializer of a cv section entry.
+
+    The cv and the user of an entry come from the url and the request, never from the payload.
+    """
+
+    class Meta:
+        fields = '__all__'
+        read_only_fields = ('id', 'user', 'cv', 'created_at', 'updated_at')
+
+
+def section_serializer_factory(model, class_name):
+    """
+    Return a SectionSerializer subclass for a section model.
+    """
+    meta = type('Meta', (SectionSerializer.Meta,), {'model': model})
+    return type(class_name, (SectionSerializer,), {'Meta': meta, '__module__': __name__})
@@ -0,0 +1,15 @@
+from django.urls import path
+
+from cvbuilder.sections.registry import SECTIONS
+from cvbuilder.sections.views import SECTION_VIEWS
+
+urlpatterns = []
+
+for section in SECTIONS:
+    by_cv_id_view, by_id_view = SECTION_VIEWS[section.name]
+    by_cv_id_name, by_id_name = section.url_names
+
+    urlpatterns += [
+        path(f'{section.url_prefix}/{section.cv_url}/<int:pk>', by_cv_id_view.as_view(), name=by_cv_id_name),
+        path(f'{section.url_prefix}/<int:pk>', by_id_view.as_view(), name=by_id_name),
+    ]
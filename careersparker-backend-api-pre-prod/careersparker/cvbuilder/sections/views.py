@@ -0,0 +1,188 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from cvbuilder.conditional import conditional_section_get
+from cvbuilder.pagination import SectionCursorPagination
+from cvbuilder.sections.registry import SECTIONS
+from cvbuilder.sparse_fields import get_sparse_fields, only_fields
+from util.Permission.cv_owner_permission import CvOwnerMixin, IsCvOwner
+from util.payments.user_payment_checks import premium_required
+
+
+# ----------------------------------------------------------------
+# Section by CV ID
+# ----------------------------------------------------------------
+class SectionByCvId(CvOwnerMixin, APIView):
+    """
+    Retrieve, create, or delete the entries of a cv section by CV ID.
+
+    GET:
+    Retrieve all entries of the section associated with a CV.
+
+    POST:
+    Create a new entry of the section associated with a CV.
+
+    DELETE:
+    Delete all entries of the section associated with a CV.
+    """
+
+    section = None
+    permission_classes = (IsAuthenticated, IsCvOwner)
+    authentication_classes = [JWTAuthentication]
+
+    def get(self, request, pk=None):
+        """
+        Retrieve all entries of the section associated with a CV by providing the CV ID.
+        :param request:
+        :param pk:
+        :return:
+        """
+
+        cv = self.get_owned_cv()
+
+        fields = get_sparse_fields(request, self.section.serializer_class)
+        queryset = self.section.get_queryset().filter(cv=cv)
+        if fields is not None:
+            queryset = only_fields(queryset, fields, extra=self.section.ordering)
+
+        # a page is only returned when the client asks for one, e.g. ?page_size=20
+        paginator = SectionCursorPagination(self.section.ordering)
+        if paginator.is_requested(request):
+            page = paginator.paginate_queryset(queryset, request, view=self)
+            data = self.section.serializer_class(page, many=True, fields=fields).data
+            return paginator.get_paginated_response(data)
+
+        data = self.section.serializer_class(queryset, many=True, fields=fields).data
+        if self.section.response_key is not None:
+            data = {self.section.response_key: data}
+        return Response(data, status=status.HTTP_200_OK)
+
+    def post(self, request, pk=None):
+        """
+        Create a new entry of the section by CV ID.
+        :param request:
+        :param pk:
+        :return:
+        """
+
+        cv = self.get_owned_cv()
+
+        serializer = self.section.serializer_class(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        unique_field = self.section.unique_field
+        if unique_field and self.section.model.objects.filter(
+                cv=cv, **{unique_field: serializer.validated_data.get(unique_field, '')}).exists():
+            message = f'{self.section.model._meta.verbose_name.capitalize()} already exists'
+            return Response({'message': message}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer.save(cv=cv, user=request.user)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def delete(self, request, pk=None):
+        """
+        Delete all entries of the section by CV ID.
+        :param request:
+        :param pk:
+        :return:
+        """
+
+        self.section.model.objects.filter(cv=pk).delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# ----------------------------------------------------------------
+# Section by entry ID
+# ----------------------------------------------------------------
+class SectionById(CvOwnerMixin, APIView):
+    """
+    Retrieve, update, or delete a cv section entry by its ID.
+    """
+
+    section = None
+    permission_classes = (IsAuthenticated, IsCvOwner)
+    authentication_classes = [JWTAuthentication]
+
+    def get(self, request, pk=None):
+        """
+        Retrieve a section entry by its ID.
+        :param request:
+        :param pk:
+        :return:
+        """
+
+        fields = get_sparse_fields(request, self.section.serializer_class)
+        entry = self.get_owned_object()
+        data = self.section.serializer_class(entry, fields=fields).data
+        if self.section.entry_as_list:
+            data = [data]
+        if self.section.entry_response_key is not None:
+            data = {self.section.entry_response_key: data}
+        return Response(data, status=status.HTTP_200_OK)
+
+    def patch(self, request, pk=None):
+        """
+        Update a section entry by its ID.
+        :param request:
+        :param pk:
+        :return:
+        """
+
+        entry = self.get_owned_object()
+
+        serializer = self.section.serializer_class(entry, data=request.data, partial=True)
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data, status=status.HTTP_200_OK)
+
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    def delete(self, request, pk=None):
+        """
+        Delete a section entry by its ID.
+        :param request:
+        :param pk:
+        :return:
+        """
+
+        self.get_owned_object().delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# ----------------------------------------------------------------
+# Generated section views
+# ----------------------------------------------------------------
+def section_view_factory(section, base):
+    """
+    Return the view of a section, e.g. SkillByCvId, built on SectionByCvId or SectionById.
+
+    Unchanged lists are answered with 304 Not Modified, and writes to premium sections
+    are limited to premium users.
+    """
+    attrs = {'section': section, 'serializer_class': section.serializer_class, '__module__': __name__}
+
+    if base is SectionByCvId:
+        attrs['get'] = conditional_section_get(section.model)(base.get)
+        suffix = 'ByCvId'
+    else:
+        attrs['owner_model'] = section.model
+        suffix = 'ById'
+
+    if section.premium:
+        write_method = 'post' if base is SectionByCvId else 'patch'
+        attrs[write_method] = premium_required(getattr(base, write_method))
+
+    view = type(f'{section.class_prefix}{suffix}', (base,), attrs)
+    return extend_schema(tags=[section.tag])(view)
+
+
+# the (by cv id, by id) views of every section, keyed by the section related name
+SECTION_VIEWS = {
+    section.name: (section_view_factory(section, SectionByCvId), section_view_factory(section, SectionById))
+    for section in SECTIONS
+}
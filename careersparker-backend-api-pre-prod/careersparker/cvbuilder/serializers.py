@@ -1,8 +1,13 @@
-from cvbuilder.models import CvBuilder
+from django.urls import reverse
+from drf_spectacular.utils import extend_schema_field
+
+from cvbuilder.models import CvBuilder, RenderJob
+from cvbuilder.sections.registry import SECTIONS
+from cvbuilder.sparse_fields import SparseFieldsSerializerMixin
 from rest_framework import serializers
 
 
-class CvBuilderSerializer(serializers.ModelSerializer):
+class CvBuilderSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = CvBuilder
         fields = '__all__'
@@ -25,4 +30,108 @@ class CvBuilderSerializer(serializers.ModelSerializer):
         return data
 
 
+# -------------------------------------------------------------------
+# Full CV (cv builder + every section)
+# -------------------------------------------------------------------
+# every section of a cv, keyed by its related name on CvBuilder, in the order of each section list
+CV_SECTION_PREFETCHES = tuple(section.get_prefetch() for section in SECTIONS)
+
+
+class CvBuilderFullSerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer for a CV and all of its sections.
+
+    Every section field is a reverse relation of CvBuilder, so the instance passed in
+    should come from a queryset prefetching CV_SECTION_PREFETCHES to avoid one query per section.
+    """
+
+    class Meta:
+        model = CvBuilder
+        fields = '__all__'
+        read_only_fields = ('id', 'user', 'cv_title', 'cv_slug', 'created_at', 'updated_at')
+
+    def get_fields(self):
+        fields = super().get_fields()
+        for section in SECTIONS:
+            fields[section.name] = section.serializer_class(many=True, read_only=True)
+        return fields
+
+
+# -------------------------------------------------------------------
+# Bulk section operations
+# -------------------------------------------------------------------
+CV_BULK_MAX_OPERATIONS = 200
+
+
+class CvSectionOperationSerializer(serializers.Serializer):
+    """
+    A single create, update or delete of a section entry.
+    """
+
+    OP_CREATE = 'create'
+    OP_UPDATE = 'update'
+    OP_DELETE = 'delete'
+
+    op = serializers.ChoiceField(choices=(OP_CREATE, OP_UPDATE, OP_DELETE))
+    section = serializers.ChoiceField(choices=tuple(section.name for section in SECTIONS))
+    id = serializers.IntegerField(required=False, min_value=1)
+    data = serializers.DictField(required=False)
+
+    def validate(self, attrs):
+        if attrs['op'] != self.OP_CREATE and 'id' not in attrs:
+            raise serializers.ValidationError({'id': f'This field is required to {attrs["op"]} an entry.'})
+
+        if attrs['op'] != self.OP_DELETE and 'data' not in attrs:
+            raise serializers.ValidationError({'data': f'This field is required to {attrs["op"]} an entry.'})
+
+        return attrs
+
+
+class CvBulkOperationSerializer(serializers.Serializer):
+    """
+    The list of section operations applied to a cv in one transaction.
+    """
+
+    operations = CvSectionOperationSerializer(many=True, allow_empty=False, max_length=CV_BULK_MAX_OPERATIONS)
+
+    def validate_operations(self, operations):
+        # an entry can be touched once per batch, otherwise the outcome would depend on the order of the statements
+        seen = set()
+        for operation in operations:
+            if operation['op'] == CvSectionOperationSerializer.OP_CREATE:
+                continue
+
+            key = (operation['section'], operation['id'])
+            if key in seen:
+                raise serializers.ValidationError(f'{operation["section"]} entry {operation["id"]} appears more than once.')
+            seen.add(key)
+
+        return operations
+
+
+# -------------------------------------------------------------------
+# Render jobs
+# -------------------------------------------------------------------
+class RenderJobSerializer(serializers.ModelSerializer):
+    """
+    Status of a cv render job, with the url of its file once it succeeded.
+    """
+
+    status_url = serializers.SerializerMethodField()
+    result_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = RenderJob
+        fields = ['id', 'cv', 'document_format', 'status', 'attempts', 'error', 'created_at', 'finished_at',
+                  'status_url', 'result_url']
+        read_only_fields = fields
+
+    @extend_schema_field(serializers.CharField)
+    def get_status_url(self, job):
+        return reverse('cvbuilder:render-job', args=[job.id])
 
+    @extend_schema_field(serializers.CharField(allow_null=True))
+    def get_result_url(self, job):
+        if job.status != RenderJob.Status.SUCCEEDED or not job.result:
+            return None
+        return reverse('cvbuilder:render-job-result', args=[job.id])
@@ -0,0 +1,81 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch.dispatcher import receiver
+
+from cvbuilder.cache import invalidate_cv_document
+from cvbuilder.documents.jobs import schedule_cv_preview
+from cvbuilder.models import CvBuilder, CvTemplate, RenderJob
+from cvbuilder.sections.registry import SECTIONS
+from util.Storage.s3_deletion import schedule_s3_deletion
+
+# every model that is part of the cached cv document
+CV_SECTION_MODELS = tuple(section.model for section in SECTIONS)
+
+
+def cv_content_changed(cv_id):
+    """
+    Drop the cached document of a changed cv and schedule its preview to be rendered again.
+    """
+    invalidate_cv_document(cv_id)
+    schedule_cv_preview(cv_id)
+
+
+def _handle_changed_cvs(connection):
+    changed, connection.changed_cvs = connection.changed_cvs, set()
+    for cv_id in changed:
+        cv_content_changed(cv_id)
+
+
+def _invalidate_after_commit(cv_id):
+    # invalidate once the change is visible to other requests, otherwise a concurrent
+    # read could cache the old rows again under the new generation. The cvs changed by a
+    # transaction are gathered on its connection: the first callback to run once it
+    # commits handles each of them once, those of the other rows, e.g. of a cascade or a
+    # bulk save, find nothing left to do.
+    connection = transaction.get_connection()
+    if not hasattr(connection, 'changed_cvs'):
+        connection.changed_cvs = set()
+    connection.changed_cvs.add(cv_id)
+    transaction.on_commit(lambda: _handle_changed_cvs(connection))
+
+
+# ----------------- Invalidate cached cv document -----------------
+
+@receiver(post_save, sender=CvBuilder)
+@receiver(post_delete, sender=CvBuilder)
+def invalidate_cv_document_on_cv_change(sender, instance, **kwargs):
+    _invalidate_after_commit(instance.pk)
+
+
+# a new template changes the look of the previews
+@receiver(post_save, sender=CvTemplate)
+def schedule_cv_preview_on_template_change(sender, instance, **kwargs):
+    transaction.on_commit(lambda: schedule_cv_preview(instance.cv_id))
+
+
+def invalidate_cv_document_on_section_change(sender, instance, **kwargs):
+    _invalidate_after_commit(instance.cv_id)
+
+
+for section_model in CV_SECTION_MODELS:
+    post_save.connect(invalidate_cv_document_on_section_change, sender=section_model)
+    post_delete.connect(invalidate_cv_document_on_section_change, sender=section_model)
+
+
+# ----------------- Delete rendered documents -----------------
+
+def _release_render_result(name):
+    # identical renders share one stored file, it is kept while another job points at it
+    if not RenderJob.objects.filter(result=name).exists():
+        schedule_s3_deletion(name)
+
+
+@receiver(post_delete, sender=RenderJob)
+def release_render_result(sender, instance, **kwargs):
+    """
+    Delete the rendered file of a deleted render job, also deleted by cascade with its cv
+    or user, once no other job uses it.
+    """
+    if instance.result:
+        name = instance.result.name
+        transaction.on_commit(lambda: _release_render_result(name))
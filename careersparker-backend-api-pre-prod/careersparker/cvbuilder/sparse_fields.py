@@ -0,0 +1,64 @@
+from rest_framework.exceptions import ValidationError
+
+FIELDS_QUERY_PARAM = 'fields'
+EXCLUDE_QUERY_PARAM = 'exclude'
+
+
+# -------------------------------------------------------------------
+# Sparse fieldsets
+# -------------------------------------------------------------------
+def _split(value):
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def get_sparse_fields(request, serializer_class):
+    """
+    Return the serializer field names selected by ?fields= and ?exclude=.
+
+    Both take a comma separated list of field names, e.g. ?fields=id,skill_name or
+    ?exclude=job_description. Returns None when neither is given, so the full
+    representation is used. Raises ValidationError for unknown field names.
+    """
+    fields_param = request.query_params.get(FIELDS_QUERY_PARAM)
+    exclude_param = request.query_params.get(EXCLUDE_QUERY_PARAM)
+    if not fields_param and not exclude_param:
+        return None
+
+    available = list(serializer_class().fields)
+    selected = _split(fields_param) if fields_param else available
+    excluded = _split(exclude_param) if exclude_param else []
+
+    unknown = sorted(set(selected).union(excluded).difference(available))
+    if unknown:
+        raise ValidationError({'fields': f'Unknown fields: {", ".join(unknown)}'})
+
+    return [name for name in available if name in selected and name not in excluded]
+
+
+def only_fields(queryset, field_names, extra=()):
+    """
+    Restrict the columns loaded by a queryset to the selected fields.
+
+    The primary key and the extra fields, e.g. the ordering a cursor paginator reads back from
+    the last row, are always loaded. Names that are not concrete model fields are ignored.
+    """
+    opts = queryset.model._meta
+    concrete = {field.name for field in opts.concrete_fields}
+    names = {opts.pk.name}
+    names.update(name.lstrip('-') for name in extra)
+    names.update(name for name in field_names if name in concrete)
+    return queryset.only(*sorted(names))
+
+
+class SparseFieldsSerializerMixin:
+    """
+    Serializer mixin taking an optional fields argument that limits the fields serialized.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for field_name in set(self.fields).difference(fields):
+                self.fields.pop(field_name)
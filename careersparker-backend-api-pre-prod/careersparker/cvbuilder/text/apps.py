@@ -1,6 +0,0 @@
-from django.apps import AppConfig
-
-
-class TextConfig(AppConfig):
-    default_auto_field = 'django.db.models.BigAutoField'
-    name = 'cvbuilder.text'
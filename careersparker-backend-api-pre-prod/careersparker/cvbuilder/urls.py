@@ -14,7 +14,12 @@ urlpatterns = [
 
     # path('create/', StripeCvBuilderPayment.as_view(), name='create'),
     path('update-cv/<int:pk>', views.CvBuilderUpdate.as_view(), name='cv-update'),
-    path('cv-word-download', views.CvWordDownload.as_view(), name='cv-word-download'),
-    path('cv-pdf-download', views.CvPdfDownload.as_view(), name='cv-pdf-download'),
+    path('<int:pk>/full', views.CvBuilderFull.as_view(), name='cv-full'),
+    path('<int:pk>/bulk', views.CvBuilderBulk.as_view(), name='cv-bulk'),
+    path('export', views.CvBuilderExport.as_view(), name='cv-export'),
+    path('cv-word-download/<int:pk>', views.CvWordDownload.as_view(), name='cv-word-download'),
+    path('cv-pdf-download/<int:pk>', views.CvPdfDownload.as_view(), name='cv-pdf-download'),
+    path('render-jobs/<int:pk>', views.RenderJobStatus.as_view(), name='render-job'),
+    path('render-jobs/<int:pk>/result', views.RenderJobResult.as_view(), name='render-job-result'),
 
 ]
@@ -1,22 +1,27 @@
 import uuid
 
 from autoslug.utils import slugify
+from django.http import FileResponse, Http404, StreamingHttpResponse
+from django.utils.http import quote_etag
 from drf_spectacular.utils import extend_schema
 from rest_framework import mixins, generics, viewsets, status
-from rest_framework.generics import get_object_or_404
-from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from cvbuilder import serializers
-from cvbuilder.models import CvBuilder
+from cvbuilder.models import CvBuilder, RenderJob
+from cvbuilder.bulk import apply_section_operations, requires_premium
+from cvbuilder.documents.content import load_cv_document
+from cvbuilder.documents.export import ZIP_CONTENT_TYPE, iter_cv_export
+from cvbuilder.documents.jobs import RENDER_FORMATS, RenderQueueFull, enqueue_render_job
+from cvbuilder.pagination import CvCursorPagination
 from cvbuilder.serializers import CvBuilderSerializer
+from cvbuilder.sparse_fields import get_sparse_fields, only_fields
+from util.Permission.cv_owner_permission import CvOwnerMixin, IsCvOwner
 from util.payments.user_payment_checks import can_create_cv, can_download_worddoc, can_download_cv_pdf
 
-COMMON_ERROR_MESSAGE = 'You are not the owner of this cv'
-
 
 @extend_schema(tags=['CV'])
 class CvBuilderViewset(mixins.DestroyModelMixin, mixins.ListModelMixin, viewsets.GenericViewSet,
@@ -27,7 +32,6 @@ class CvBuilderViewset(mixins.DestroyModelMixin, mixins.ListModelMixin, viewsets
 
     authentication_classes = [JWTAuthentication]  # JWT Authentication
     permission_classes = (IsAuthenticated,)
-    parser_classes = (MultiPartParser, FormParser, JSONParser)
     queryset = CvBuilder.objects.all()
     serializer_class = serializers.CvBuilderSerializer
 
@@ -35,7 +39,41 @@ class CvBuilderViewset(mixins.DestroyModelMixin, mixins.ListModelMixin, viewsets
         """
 
         """
-        return CvBuilder.objects.order_by('-created_at').filter(user=self.request.user)
+        queryset = CvBuilder.objects.filter(user=self.request.user).order_by(*CvCursorPagination.ordering)
+
+        fields = self.get_sparse_fields()
+        if fields is not None:
+            queryset = only_fields(queryset, fields, extra=CvCursorPagination.ordering)
+        return queryset
+
+    @property
+    def paginator(self):
+        """
+        The cursor paginator when the client asks for one, e.g. ?page_size=20, otherwise the
+        default page number paginator with its count and ?page=.
+        """
+        if not hasattr(self, '_paginator'):
+            cursor_paginator = CvCursorPagination()
+            self._paginator = cursor_paginator if cursor_paginator.is_requested(self.request) \
+                else self.pagination_class()
+        return self._paginator
+
+    def get_sparse_fields(self):
+        """
+        The fields selected by ?fields= / ?exclude= on the cv list, None for the full cvs.
+        """
+        if self.action != 'list':
+            return None
+
+        if not hasattr(self, '_sparse_fields'):
+            self._sparse_fields = get_sparse_fields(self.request, self.serializer_class)
+        return self._sparse_fields
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_sparse_fields()
+        if fields is not None:
+            kwargs['fields'] = fields
+        return super().get_serializer(*args, **kwargs)
 
     # create cv builder
     def create(self, request, *args, **kwargs):
@@ -76,7 +114,7 @@ class CvBuilderViewset(mixins.DestroyModelMixin, mixins.ListModelMixin, viewsets
 
 
 @extend_schema(tags=['CV'])
-class CvBuilderUpdate(APIView):
+class CvBuilderUpdate(CvOwnerMixin, APIView):
     """
 
     """
@@ -84,8 +122,7 @@ class CvBuilderUpdate(APIView):
     queryset = CvBuilder.objects.all()
     serializer_class = serializers.CvBuilderSerializer
     authentication_classes = [JWTAuthentication]  # JWT Authentication
-    permission_classes = (IsAuthenticated,)
-    parser_classes = (MultiPartParser, FormParser, JSONParser)
+    permission_classes = (IsAuthenticated, IsCvOwner)
 
     @staticmethod
     def get(pk):
@@ -100,14 +137,7 @@ class CvBuilderUpdate(APIView):
         """
 
         """
-        try:
-            user = self.request.user
-            cvbuilder = get_object_or_404(CvBuilder.objects.filter(user=user, id=pk))
-        except CvBuilder.DoesNotExist:
-            return Response({'error': 'CV not found'}, status=status.HTTP_404_NOT_FOUND)
-
-        if cvbuilder.user != user:
-            return Response({'error': 'You are not the owner of this cv'}, status=status.HTTP_400_BAD_REQUEST)
+        cvbuilder = self.get_owned_cv()
 
         serializer = CvBuilderSerializer(cvbuilder, data=request.data, partial=True)
         cvbuilder.cv_title = request.data.get('cv_title', cvbuilder.cv_title)
@@ -133,11 +163,122 @@ class CvBuilderUpdate(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+# ---------------------------------------------------------------------------------------------
+# Full cv with all sections
+# ---------------------------------------------------------------------------------------------
+@extend_schema(tags=['CV'])
+class CvBuilderFull(APIView):
+    """
+    Retrieve a cv together with every one of its sections.
+
+    GET:
+    Returns the cv and all section entries in a single response, so the editor
+    does not need one request per section.
+    """
+
+    queryset = CvBuilder.objects.all()
+    serializer_class = serializers.CvBuilderFullSerializer
+    authentication_classes = [JWTAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    def get(self, request, pk):
+        """
+        Retrieve a cv and all of its sections by CV ID.
+
+        Parameters:
+        - request: Request object.
+        - pk: CV ID.
+
+        Returns:
+        - The cv with each section as a list under its related name.
+        """
+
+        # served from the cache when still current, without touching the database
+        document = load_cv_document(pk, request.user)
+        if document is None:
+            raise Http404
+        return Response(document, status=status.HTTP_200_OK)
+
+
+@extend_schema(tags=['CV'])
+class CvBuilderExport(APIView):
+    """
+    Export every cv of the authenticated user.
+
+    GET:
+    Streams a zip archive with a json file per cv, each with all of its sections.
+    The archive is written while the cvs are read, so it is never held in memory.
+    """
+
+    queryset = CvBuilder.objects.all()
+    serializer_class = serializers.CvBuilderFullSerializer
+    authentication_classes = [JWTAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    def get(self, request):
+        """
+        Download all cvs of the user as a zip archive.
+        """
+        response = StreamingHttpResponse(iter_cv_export(request.user), content_type=ZIP_CONTENT_TYPE)
+        response['Content-Disposition'] = 'attachment; filename="cvs.zip"'
+        return response
+
+
+# ---------------------------------------------------------------------------------------------
+# Bulk section operations
+# ---------------------------------------------------------------------------------------------
+@extend_schema(tags=['CV'])
+class CvBuilderBulk(CvOwnerMixin, APIView):
+    """
+    Create, update and delete entries of any section of a cv in one request.
+
+    POST:
+    Takes a list of operations, each with an op (create, update or delete), a section
+    (its related name, as in the full cv), the entry id for updates and deletes, and the
+    entry data for creates and updates. The batch is applied in a single transaction:
+    either every operation succeeds or none is applied.
+    """
+
+    queryset = CvBuilder.objects.all()
+    serializer_class = serializers.CvBulkOperationSerializer
+    authentication_classes = [JWTAuthentication]
+    permission_classes = (IsAuthenticated, IsCvOwner)
+
+    def post(self, request, pk):
+        """
+        Apply a batch of section operations to a cv by CV ID.
+
+        Parameters:
+        - request: Request object.
+        - pk: CV ID.
+
+        Returns:
+        - HTTP 200 OK with one result per operation if the batch is applied.
+        - HTTP 400 BAD REQUEST with the per-operation errors if any operation is invalid.
+        - HTTP 403 FORBIDDEN if the cv belongs to another user, or a free user writes to a premium section.
+        """
+
+        user = request.user
+        cv = self.get_owned_cv()  # the ownership check for every operation in the batch
+
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        operations = serializer.validated_data['operations']
+
+        if user.is_free and requires_premium(operations):
+            return Response({'message': 'This is a premium feature.'}, status=status.HTTP_403_FORBIDDEN)
+
+        results, applied = apply_section_operations(cv, user, operations)
+        if not applied:
+            return Response({'results': results}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'results': results}, status=status.HTTP_200_OK)
+
+
 # ---------------------------------------------------------------------------------------------
 # Change cv template
 # ---------------------------------------------------------------------------------------------
 @extend_schema(tags=['CV'])
-class CvTemplateChange(APIView):
+class CvTemplateChange(CvOwnerMixin, APIView):
     """
 
     """
@@ -145,8 +286,7 @@ class CvTemplateChange(APIView):
     queryset = CvBuilder.objects.all()
     serializer_class = serializers.CvBuilderSerializer
     authentication_classes = [JWTAuthentication]
-    permission_classes = (IsAuthenticated,)
-    parser_classes = (MultiPartParser, FormParser, JSONParser)
+    permission_classes = (IsAuthenticated, IsCvOwner)
 
     @staticmethod
     def get_object(pk):
@@ -162,11 +302,7 @@ class CvTemplateChange(APIView):
 
         """
         user = self.request.user
-        cvbuilder = get_object_or_404(CvBuilder.objects.filter(user=user, id=pk))
-
-        # check if user is the owner of the cv builder
-        if cvbuilder.user != user:
-            return Response({'error': COMMON_ERROR_MESSAGE}, status=status.HTTP_400_BAD_REQUEST)
+        cvbuilder = self.get_owned_cv()
 
         # check if user has paid for cv template
         can_create_template = can_create_cv(user)
@@ -196,7 +332,7 @@ class CvTemplateChange(APIView):
 # ---------------------------------------------------------------------------------------------
 
 @extend_schema(tags=['CV'])
-class CvWordDownload(APIView):
+class CvWordDownload(CvOwnerMixin, APIView):
     """
 
     """
@@ -205,7 +341,6 @@ class CvWordDownload(APIView):
     serializer_class = serializers.CvBuilderSerializer
     authentication_classes = [JWTAuthentication]
     permission_classes = (IsAuthenticated,)
-    parser_classes = (MultiPartParser, FormParser, JSONParser)
 
     @staticmethod
     def get_object(pk):
@@ -221,10 +356,7 @@ class CvWordDownload(APIView):
 
         """
         user = self.request.user
-        cvbuilder = get_object_or_404(CvBuilder.objects.filter(user=user, id=pk))
-        # check if user is the owner of the cv builder
-        if cvbuilder.user != user:
-            return Response({'error': 'You are not the owner of this cv builder'}, status=status.HTTP_400_BAD_REQUEST)
+        self.get_owned_cv()  # downloads are GET requests, check the owner here
 
         # check if user can download the cv using can_download_cv method
         can_download_word = can_download_worddoc(user)
@@ -232,9 +364,8 @@ class CvWordDownload(APIView):
             return Response({'error': 'You have reached your limit of cv Word download'},
                             status=status.HTTP_400_BAD_REQUEST)
 
-        # UPDATE  WORD DOWNLOAD COUNT
-        user.deduct_word_download_count()
-        return Response(status=status.HTTP_200_OK, data={'success': 'CV Word Document downloaded successfully'})
+        # rendered by the render worker, the credit is deducted once the document is ready
+        return enqueue_render_response(user, pk, RenderJob.DocumentFormat.DOCX)
 
 
 # ---------------------------------------------------------------------------------------------
@@ -242,7 +373,7 @@ class CvWordDownload(APIView):
 # ---------------------------------------------------------------------------------------------
 
 @extend_schema(tags=['CV'])
-class CvPdfDownload(APIView):
+class CvPdfDownload(CvOwnerMixin, APIView):
     """
 
     """
@@ -251,7 +382,6 @@ class CvPdfDownload(APIView):
     serializer_class = serializers.CvBuilderSerializer
     authentication_classes = [JWTAuthentication]
     permission_classes = (IsAuthenticated,)
-    parser_classes = (MultiPartParser, FormParser, JSONParser)
 
     @staticmethod
     def get_object(pk):
@@ -267,17 +397,77 @@ class CvPdfDownload(APIView):
 
         """
         user = self.request.user
-        cvbuilder = get_object_or_404(CvBuilder.objects.filter(user=user, id=pk))
-
-        # check if user is the owner of the cv builder
-        if cvbuilder.user != user:
-            return Response({'error': 'You are not the owner of this cv builder'}, status=status.HTTP_400_BAD_REQUEST)
+        self.get_owned_cv()  # downloads are GET requests, check the owner here
 
         # check if user can download the cv using can_download_cv method
         can_download_pdf = can_download_cv_pdf(user)
         if not can_download_pdf:
             return Response({'error': 'You have reached your limit of cv download'}, status=status.HTTP_400_BAD_REQUEST)
 
-        # UPDATE THE PDF DOWNLOAD COUNT
-        user.deduct_pdf_download_count()
-        return Response(status=status.HTTP_200_OK, data={'success': 'CV PDF Document downloaded successfully'})
+        # rendered by the render worker, the credit is deducted once the document is ready
+        return enqueue_render_response(user, pk, RenderJob.DocumentFormat.PDF)
+
+
+# ---------------------------------------------------------------------------------------------
+# Render jobs of the cv downloads
+# ---------------------------------------------------------------------------------------------
+
+def enqueue_render_response(user, cv_id, document_format):
+    """
+    Queue the rendering of a cv download, returns a 202 response pointing to the job status.
+    """
+    try:
+        job = enqueue_render_job(user, cv_id, document_format)
+    except RenderQueueFull:
+        return Response({'error': 'Too many documents are being prepared, please try again shortly'},
+                        status=status.HTTP_429_TOO_MANY_REQUESTS)
+
+    data = serializers.RenderJobSerializer(job).data
+    return Response(data, status=status.HTTP_202_ACCEPTED, headers={'Location': data['status_url']})
+
+
+class RenderJobMixin:
+    """
+    Looks up a render job of the authenticated user, 404 for other users' jobs.
+    """
+
+    authentication_classes = [JWTAuthentication]
+    permission_classes = (IsAuthenticated,)
+    serializer_class = serializers.RenderJobSerializer
+
+    def get_job(self, pk):
+        job = RenderJob.objects.select_related('cv').filter(user=self.request.user, pk=pk).first()
+        if job is None:
+            raise Http404
+        return job
+
+
+@extend_schema(tags=['CV'])
+class RenderJobStatus(RenderJobMixin, APIView):
+    """
+    Status of a cv download being rendered, poll it until it has succeeded or failed.
+    """
+
+    def get(self, request, pk):
+        return Response(self.serializer_class(self.get_job(pk)).data)
+
+
+@extend_schema(tags=['CV'])
+class RenderJobResult(RenderJobMixin, APIView):
+    """
+    The rendered file of a succeeded render job.
+    """
+
+    def get(self, request, pk):
+        job = self.get_job(pk)
+        if job.status != RenderJob.Status.SUCCEEDED:
+            return Response({'error': 'The document is not ready', 'status': job.status},
+                            status=status.HTTP_409_CONFLICT)
+        if not job.result:  # previews are stored on the cv template
+            raise Http404
+
+        render_format = RENDER_FORMATS[job.document_format]
+        response = FileResponse(job.result.open('rb'), as_attachment=True, content_type=render_format['content_type'],
+                                filename=f"{job.cv.cv_slug or 'cv'}.{render_format['extension']}")
+        response['ETag'] = quote_etag(job.content_hash)
+        return response
@@ -0,0 +1,154 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from cvbuilder.models import CvBuilder, Skill, Education, Hobby
+
+
+# ----------------------------------------------------------------
+# Bulk section operations
+# ----------------------------------------------------------------
+class TestCVBulk(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email='test@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username='johndoe',
+            is_active=True,
+            is_verified=True,
+        )
+
+        login_url = reverse('user:token_obtain_pair')
+
+        token_data = {
+            'email': 'test@example.com',
+            'password': 'Password123!',
+        }
+
+        response = self.client.post(login_url, token_data, format='json')  # login user
+        self.token = response.data['access']  # get token
+
+        self.cv = CvBuilder.objects.create(user=self.user, cv_title='Test CV')
+        self.skill = Skill.objects.create(user=self.user, cv=self.cv, skill_name='Django', skill_level=4)
+        self.education = Education.objects.create(user=self.user, cv=self.cv, school_name='Test School')
+        self.url = reverse('cvbuilder:cv-bulk', args=[self.cv.id])
+
+    def post_operations(self, operations, url=None):
+        return self.client.post(
+            url or self.url,
+            {'operations': operations},
+            content_type='application/json',
+            HTTP_AUTHORIZATION=f'Bearer {self.token}',
+        )
+
+    def test_bulk_operations_success(self):
+        response = self.post_operations([
+            {'op': 'create', 'section': 'skills', 'data': {'skill_name': 'Python', 'skill_level': 5}},
+            {'op': 'create', 'section': 'skills', 'data': {'skill_name': 'SQL', 'skill_level': 3}},
+            {'op': 'update', 'section': 'skills', 'id': self.skill.id, 'data': {'skill_level': 5}},
+            {'op': 'delete', 'section': 'educations', 'id': self.education.id},
+        ])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result['status'] for result in response.data['results']],
+                         ['created', 'created', 'updated', 'deleted'])
+        self.assertEqual(Skill.objects.filter(cv=self.cv).count(), 3)
+        self.skill.refresh_from_db()
+        self.assertEqual(self.skill.skill_level, 5)
+        self.assertFalse(Education.objects.filter(cv=self.cv).exists())
+
+        created = Skill.objects.get(id=response.data['results'][0]['id'])
+        self.assertEqual(created.skill_name, 'Python')
+        self.assertEqual(created.user, self.user)
+
+    def test_bulk_operations_invalid_operation_applies_nothing(self):
+        response = self.post_operations([
+            {'op': 'create', 'section': 'skills', 'data': {'skill_name': 'Python', 'skill_level': 5}},
+            {'op': 'update', 'section': 'skills', 'id': self.skill.id, 'data': {'skill_level': 'expert'}},
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([result['status'] for result in response.data['results']], ['skipped', 'error'])
+        self.assertIn('skill_level', response.data['results'][1]['errors'])
+        self.assertEqual(Skill.objects.filter(cv=self.cv).count(), 1)
+
+    def test_bulk_operations_create_existing_unique_value(self):
+        response = self.post_operations([
+            {'op': 'create', 'section': 'skills', 'data': {'skill_name': 'Python', 'skill_level': 5}},
+            {'op': 'create', 'section': 'skills', 'data': {'skill_name': 'Django', 'skill_level': 3}},
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([result['status'] for result in response.data['results']], ['skipped', 'error'])
+        self.assertIn('skill_name', response.data['results'][1]['errors'])
+        self.assertEqual(Skill.objects.filter(cv=self.cv).count(), 1)
+
+    def test_bulk_operations_duplicate_unique_value_within_batch(self):
+        response = self.post_operations([
+            {'op': 'create', 'section': 'skills', 'data': {'skill_name': 'Python', 'skill_level': 5}},
+            {'op': 'create', 'section': 'skills', 'data': {'skill_name': 'Python', 'skill_level': 3}},
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([result['status'] for result in response.data['results']], ['error', 'error'])
+        self.assertEqual(Skill.objects.filter(cv=self.cv).count(), 1)
+
+    def test_bulk_operations_rename_to_existing_unique_value(self):
+        python = Skill.objects.create(user=self.user, cv=self.cv, skill_name='Python', skill_level=5)
+
+        response = self.post_operations([
+            {'op': 'update', 'section': 'skills', 'id': python.id, 'data': {'skill_name': 'Django'}},
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('skill_name', response.data['results'][0]['errors'])
+        python.refresh_from_db()
+        self.assertEqual(python.skill_name, 'Python')
+
+    def test_bulk_operations_reuse_unique_value_of_deleted_entry(self):
+        response = self.post_operations([
+            {'op': 'delete', 'section': 'skills', 'id': self.skill.id},
+            {'op': 'create', 'section': 'skills', 'data': {'skill_name': 'Django', 'skill_level': 2}},
+        ])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(Skill.objects.filter(cv=self.cv).values_list('skill_name', 'skill_level')),
+                         [('Django', 2)])
+
+    def test_bulk_operations_entry_of_another_cv(self):
+        other_cv = CvBuilder.objects.create(user=self.user, cv_title='Other CV')
+        other_skill = Skill.objects.create(user=self.user, cv=other_cv, skill_name='Go', skill_level=2)
+
+        response = self.post_operations([{'op': 'delete', 'section': 'skills', 'id': other_skill.id}])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['results'][0]['status'], 'error')
+        self.assertTrue(Skill.objects.filter(id=other_skill.id).exists())
+
+    def test_bulk_operations_cv_of_another_user(self):
+        other_user = get_user_model().objects.create_user(
+            email='other@example.com',
+            password='Password123!',
+            first_name='Jane',
+            last_name='Doe',
+            username='janedoe',
+            is_active=True,
+            is_verified=True,
+        )
+        other_cv = CvBuilder.objects.create(user=other_user, cv_title='Other CV')
+
+        response = self.post_operations(
+            [{'op': 'create', 'section': 'skills', 'data': {'skill_name': 'Python'}}],
+            url=reverse('cvbuilder:cv-bulk', args=[other_cv.id]),
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Skill.objects.filter(cv=other_cv).exists())
+
+    def test_bulk_operations_premium_section_free_user(self):
+        response = self.post_operations([{'op': 'create', 'section': 'hobbies', 'data': {}}])
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Hobby.objects.filter(cv=self.cv).exists())
@@ -0,0 +1,84 @@
+import io
+import json
+import zipfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from cvbuilder.documents import export
+from cvbuilder.models import CvBuilder, Skill, Education
+
+
+# ----------------------------------------------------------------
+# Export all cvs
+# ----------------------------------------------------------------
+class TestCVExport(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            email='test@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username='johndoe',
+            is_active=True,
+            is_verified=True,
+        )
+
+        login_url = reverse('user:token_obtain_pair')
+
+        token_data = {
+            'email': 'test@example.com',
+            'password': 'Password123!',
+        }
+
+        response = self.client.post(login_url, token_data, format='json')  # login user
+        self.token = response.data['access']  # get token
+
+        self.cvs = [CvBuilder.objects.create(user=self.user, cv_title=f'Test CV {number}') for number in range(3)]
+        for cv in self.cvs:
+            Skill.objects.create(user=self.user, cv=cv, skill_name='Django', skill_level=4)
+        Education.objects.create(user=self.user, cv=self.cvs[0], school_name='Test School')
+
+        other_user = get_user_model().objects.create_user(
+            email='other@example.com', password='Password123!', first_name='Jane', last_name='Doe', username='other',
+        )
+        CvBuilder.objects.create(user=other_user, cv_title='Other CV')
+
+    def export(self):
+        response = self.client.get(reverse('cvbuilder:cv-export'), HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+
+    def test_export_all_cvs(self):
+        archive = self.export()
+
+        self.assertIsNone(archive.testzip())
+        self.assertEqual(archive.namelist(), [export.cv_export_name(cv) for cv in self.cvs])
+
+        first = json.loads(archive.read(export.cv_export_name(self.cvs[0])))
+        self.assertEqual(first['cv_title'], 'Test CV 0')
+        self.assertEqual(first['skills'][0]['skill_name'], 'Django')
+        self.assertEqual(first['educations'][0]['school_name'], 'Test School')
+
+    def test_export_in_batches(self):
+        with mock.patch.object(export, 'CV_EXPORT_BATCH_SIZE', 2):
+            archive = self.export()
+
+        self.assertEqual(len(archive.namelist()), 3)
+        last = json.loads(archive.read(export.cv_export_name(self.cvs[2])))
+        self.assertEqual(last['skills'][0]['skill_name'], 'Django')
+
+    def test_export_without_cvs(self):
+        CvBuilder.objects.filter(user=self.user).delete()
+
+        self.assertEqual(self.export().namelist(), [])
+
+    def test_export_unauthenticated(self):
+        response = self.client.get(reverse('cvbuilder:cv-export'))
+
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,120 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from cvbuilder.models import CvBuilder, Skill, Education, Award
+
+
+# ----------------------------------------------------------------
+# Full CV with all sections
+# ----------------------------------------------------------------
+# a memory cache stands in for the shared redis cache
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class TestCVFull(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            email='test@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username='johndoe',
+            is_active=True,
+            is_verified=True,
+        )
+
+        login_url = reverse('user:token_obtain_pair')
+
+        token_data = {
+            'email': 'test@example.com',
+            'password': 'Password123!',
+        }
+
+        response = self.client.post(login_url, token_data, format='json')  # login user
+        self.token = response.data['access']  # get token
+
+        self.cv = CvBuilder.objects.create(user=self.user, cv_title='Test CV')
+        Skill.objects.create(user=self.user, cv=self.cv, skill_name='Django', skill_level=4)
+        Skill.objects.create(user=self.user, cv=self.cv, skill_name='Python', skill_level=5)
+        Education.objects.create(user=self.user, cv=self.cv, school_name='Test School')
+        Award.objects.create(user=self.user, cv=self.cv, award_title='Test Award')
+
+    def test_get_full_cv_success(self):
+        url = reverse('cvbuilder:cv-full', args=[self.cv.id])
+
+        response = self.client.get(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['cv_title'], 'Test CV')
+        self.assertEqual([skill['skill_name'] for skill in response.data['skills']], ['Python', 'Django'])
+        self.assertEqual(response.data['educations'][0]['school_name'], 'Test School')
+        self.assertEqual(response.data['awards'][0]['award_title'], 'Test Award')
+        self.assertEqual(response.data['text_sections'], [])
+
+    def test_get_full_cv_served_from_cache(self):
+        url = reverse('cvbuilder:cv-full', args=[self.cv.id])
+        self.client.get(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        # only the authenticated user is loaded, the cv comes from the cache
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['skills']), 2)
+
+    def test_get_full_cv_cache_invalidated_on_section_change(self):
+        url = reverse('cvbuilder:cv-full', args=[self.cv.id])
+        self.client.get(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(user=self.user, cv=self.cv, skill_name='SQL', skill_level=3)
+
+        response = self.client.get(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([skill['skill_name'] for skill in response.data['skills']], ['SQL', 'Python', 'Django'])
+
+    def test_get_full_cv_of_another_user(self):
+        other_user = get_user_model().objects.create_user(
+            email='other@example.com',
+            password='Password123!',
+            first_name='Jane',
+            last_name='Doe',
+            username='janedoe',
+            is_active=True,
+            is_verified=True,
+        )
+        other_cv = CvBuilder.objects.create(user=other_user, cv_title='Other CV')
+        url = reverse('cvbuilder:cv-full', args=[other_cv.id])
+
+        response = self.client.get(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 404)
+
+
+class TestCVFullWithoutSharedCache(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email='test@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username='johndoe',
+            is_active=True,
+            is_verified=True,
+        )
+        token = self.client.post(reverse('user:token_obtain_pair'),
+                                 {'email': 'test@example.com', 'password': 'Password123!'}).data['access']
+        self.headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        self.cv = CvBuilder.objects.create(user=self.user, cv_title='Test CV')
+
+    def test_cv_is_read_from_the_database(self):
+        url = reverse('cvbuilder:cv-full', args=[self.cv.id])
+        self.client.get(url, **self.headers)
+
+        # without REDIS_URL nothing is cached, an update without signals stands in for another process
+        CvBuilder.objects.filter(pk=self.cv.pk).update(cv_title='Renamed CV')
+        response = self.client.get(url, **self.headers)
+
+        self.assertEqual(response.data['cv_title'], 'Renamed CV')
@@ -0,0 +1,80 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from cvbuilder.models import CvBuilder, Skill
+
+
+# ----------------------------------------------------------------
+# Cursor pagination of cv and section lists
+# ----------------------------------------------------------------
+class TestCVPagination(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email='test@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username='johndoe',
+            is_active=True,
+            is_verified=True,
+        )
+
+        login_url = reverse('user:token_obtain_pair')
+
+        token_data = {
+            'email': 'test@example.com',
+            'password': 'Password123!',
+        }
+
+        response = self.client.post(login_url, token_data, format='json')  # login user
+        self.token = response.data['access']  # get token
+
+        self.cvs = [CvBuilder.objects.create(user=self.user, cv_title=f'CV {index}') for index in range(3)]
+
+    def test_list_cvs_by_cursor(self):
+        response = self.client.get(reverse('cvbuilder:cvbuilder-list'), {'page_size': 2},
+                                   HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('count', response.data)
+        first_page = [cv['id'] for cv in response.data['results']]
+
+        response = self.client.get(response.data['next'], HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data['next'])
+        second_page = [cv['id'] for cv in response.data['results']]
+        self.assertEqual(first_page + second_page, [cv.id for cv in reversed(self.cvs)])
+
+    def test_list_cvs_by_page_number(self):
+        response = self.client.get(reverse('cvbuilder:cvbuilder-list'), {'page': 1},
+                                   HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual([cv['id'] for cv in response.data['results']], [cv.id for cv in reversed(self.cvs)])
+
+    def test_list_skills_by_cursor(self):
+        cv = self.cvs[0]
+        for name in ('Django', 'Python', 'SQL'):
+            Skill.objects.create(user=self.user, cv=cv, skill_name=name, skill_level=3)
+        url = reverse('skill_cv_id', args=[cv.id])
+
+        response = self.client.get(url, {'page_size': 2}, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        names = [skill['skill_name'] for skill in response.data['results']]
+
+        response = self.client.get(response.data['next'], HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        names += [skill['skill_name'] for skill in response.data['results']]
+        self.assertEqual(names, ['SQL', 'Python', 'Django'])
+
+    def test_list_skills_without_page(self):
+        Skill.objects.create(user=self.user, cv=self.cvs[0], skill_name='Django', skill_level=3)
+        url = reverse('skill_cv_id', args=[self.cvs[0].id])
+
+        response = self.client.get(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['skills']), 1)
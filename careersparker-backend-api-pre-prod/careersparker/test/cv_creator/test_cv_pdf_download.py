@@ -0,0 +1,93 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from cvbuilder.documents import jobs, pdf
+from cvbuilder.documents.jobs import claim_render_job, run_render_job
+from cvbuilder.models import CvBuilder, EmploymentHistory, Skill
+
+
+# ----------------------------------------------------------------
+# PDF download
+# ----------------------------------------------------------------
+class TestCVPdfDownload(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            email='test@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username='johndoe',
+            is_active=True,
+            is_verified=True,
+        )
+        self.user.cv_pdf_download_count = 5
+        self.user.save()
+
+        login_url = reverse('user:token_obtain_pair')
+
+        token_data = {
+            'email': 'test@example.com',
+            'password': 'Password123!',
+        }
+
+        response = self.client.post(login_url, token_data, format='json')  # login user
+        self.token = response.data['access']  # get token
+
+        self.cv = CvBuilder.objects.create(user=self.user, cv_title='Test CV')
+        EmploymentHistory.objects.create(
+            user=self.user, cv=self.cv, job_title='Engineer', employer_name='ACME',
+            job_description='<p>Built <strong>things</strong> &amp; more</p><ul><li>One</li><li>Two</li></ul>',
+        )
+        Skill.objects.create(user=self.user, cv=self.cv, skill_name='Django', skill_level=4)
+        self.url = reverse('cvbuilder:cv-pdf-download', args=[self.cv.id])
+
+    def download(self):
+        """Request the download, render it like the render worker does and fetch the file"""
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {self.token}'}
+        response = self.client.get(self.url, **headers)
+        if response.status_code != 202:
+            return response
+
+        while (job := claim_render_job()) is not None:
+            run_render_job(job)
+
+        job_status = self.client.get(response['Location'], **headers)
+        return self.client.get(job_status.data['result_url'], **headers)
+
+    def test_download_pdf(self):
+        response = self.download()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertIn('attachment', response['Content-Disposition'])
+        self.assertTrue(b''.join(response.streaming_content).startswith(b'%PDF'))
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.cv_pdf_download_count, 4)
+
+    def test_download_unchanged_cv_is_not_rendered_again(self):
+        with mock.patch.object(jobs, 'render_cv_pdf', wraps=pdf.render_cv_pdf) as render:
+            first = self.download()
+            second = self.download()
+
+            self.assertEqual(render.call_count, 1)
+            self.assertEqual(first['ETag'], second['ETag'])
+
+            with self.captureOnCommitCallbacks(execute=True):  # invalidates the cached cv
+                Skill.objects.create(user=self.user, cv=self.cv, skill_name='Python', skill_level=5)
+            third = self.download()
+
+            self.assertEqual(render.call_count, 2)
+            self.assertNotEqual(first['ETag'], third['ETag'])
+
+    def test_download_pdf_without_credits(self):
+        self.user.cv_pdf_download_count = 0
+        self.user.save()
+
+        response = self.download()
+
+        self.assertEqual(response.status_code, 400)
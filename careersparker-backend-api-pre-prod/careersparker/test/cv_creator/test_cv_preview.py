@@ -0,0 +1,116 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase
+from django.utils import timezone
+from PIL import Image
+
+from cvbuilder import signals
+from cvbuilder.documents import jobs
+from cvbuilder.documents.jobs import claim_render_job, run_render_job
+from cvbuilder.documents.preview import PREVIEW_SIZE, PREVIEW_SMALL_SIZE
+from cvbuilder.models import CvBuilder, CvTemplate, RenderJob, Skill
+from util.Storage import s3_deletion
+
+
+# ----------------------------------------------------------------
+# CV preview thumbnails
+# ----------------------------------------------------------------
+class TestCVPreview(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            email='test@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username='johndoe',
+            is_active=True,
+            is_verified=True,
+        )
+        self.cv = CvBuilder.objects.create(user=self.user, cv_title='Test CV')
+
+    def edit(self, skill_name):
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(user=self.user, cv=self.cv, skill_name=skill_name, skill_level=4)
+
+    def render_previews(self):
+        RenderJob.objects.filter(status=RenderJob.Status.PENDING).update(run_after=timezone.now())
+        while (job := claim_render_job()) is not None:
+            run_render_job(job)
+
+    def test_edits_are_debounced(self):
+        self.edit('Django')
+        job = RenderJob.objects.get(cv=self.cv, document_format=RenderJob.DocumentFormat.PREVIEW)
+
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertIsNone(claim_render_job())
+
+        self.edit('Python')
+
+        self.assertEqual(RenderJob.objects.filter(cv=self.cv).count(), 1)
+        self.assertGreater(RenderJob.objects.get(pk=job.pk).run_after, job.run_after)
+
+    def test_changes_of_a_transaction_are_handled_once(self):
+        with mock.patch.object(signals, 'schedule_cv_preview', wraps=jobs.schedule_cv_preview) as schedule:
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic():
+                    for skill_name in ('Django', 'Python', 'SQL'):
+                        Skill.objects.create(user=self.user, cv=self.cv, skill_name=skill_name, skill_level=4)
+                    Skill.objects.filter(cv=self.cv).delete()
+
+        self.assertEqual(schedule.call_count, 1)
+        self.assertEqual(RenderJob.objects.filter(cv=self.cv).count(), 1)
+
+    def test_preview_queued_concurrently_is_postponed(self):
+        self.edit('Django')
+        job = RenderJob.objects.get(cv=self.cv)
+
+        # a concurrent edit queued the job between the postpone and the insert
+        with mock.patch.object(jobs, '_postpone_cv_preview', side_effect=[0, 1]) as postpone:
+            jobs.schedule_cv_preview(self.cv.id)
+
+        self.assertEqual(postpone.call_count, 2)
+        self.assertEqual(list(RenderJob.objects.filter(cv=self.cv)), [job])
+
+    def test_preview_is_stored_on_the_cv_template(self):
+        self.edit('Django')
+        self.render_previews()
+
+        cv_template = CvTemplate.objects.get(cv=self.cv)
+        with Image.open(cv_template.cv_template_thumbnail) as image:
+            self.assertEqual(image.size, PREVIEW_SIZE)
+        with Image.open(cv_template.cv_template_thumbnail_small) as image:
+            self.assertEqual(image.size, PREVIEW_SMALL_SIZE)
+        self.assertEqual(RenderJob.objects.get(cv=self.cv).status, RenderJob.Status.SUCCEEDED)
+
+    def test_preview_is_replaced_when_the_cv_changes(self):
+        self.edit('Django')
+        self.render_previews()
+        first = CvTemplate.objects.get(cv=self.cv).cv_template_thumbnail
+
+        self.edit('Python')
+        with mock.patch.object(s3_deletion, 'delete_s3_keys') as delete_s3_keys:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.render_previews()
+        second = CvTemplate.objects.get(cv=self.cv)
+
+        self.assertNotEqual(first.name, second.cv_template_thumbnail.name)
+        deleted = [key for call in delete_s3_keys.call_args_list for key in call.args[0]]
+        self.assertEqual(deleted, [s3_deletion.s3_key(first.name),
+                                   s3_deletion.s3_key(first.instance.cv_template_thumbnail_small.name)])
+        self.assertGreater(second.updated_at, first.instance.updated_at)
+        self.assertEqual(CvTemplate.objects.filter(cv=self.cv).count(), 1)
+
+    def test_unchanged_preview_is_not_stored_again(self):
+        self.edit('Django')
+        self.render_previews()
+        first = CvTemplate.objects.get(cv=self.cv).cv_template_thumbnail.name
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.cv.save()
+        self.render_previews()
+
+        self.assertEqual(CvTemplate.objects.get(cv=self.cv).cv_template_thumbnail.name, first)
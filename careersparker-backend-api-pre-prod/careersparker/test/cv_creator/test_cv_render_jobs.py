@@ -0,0 +1,172 @@
+import datetime
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from cvbuilder.documents import jobs
+from cvbuilder.documents.jobs import claim_render_job, run_render_job
+from cvbuilder.models import CvBuilder, RenderJob
+from util.Storage import s3_deletion
+
+
+# ----------------------------------------------------------------
+# Render job queue
+# ----------------------------------------------------------------
+class TestCVRenderJobs(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            email='test@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username='johndoe',
+            is_active=True,
+            is_verified=True,
+        )
+        self.user.cv_pdf_download_count = 5
+        self.user.save()
+
+        login_url = reverse('user:token_obtain_pair')
+
+        token_data = {
+            'email': 'test@example.com',
+            'password': 'Password123!',
+        }
+
+        response = self.client.post(login_url, token_data, format='json')  # login user
+        self.token = response.data['access']  # get token
+
+        self.cv = CvBuilder.objects.create(user=self.user, cv_title='Test CV')
+        self.url = reverse('cvbuilder:cv-pdf-download', args=[self.cv.id])
+
+    def get(self, url):
+        return self.client.get(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+    def test_download_is_queued_and_paid_on_success(self):
+        response = self.get(self.url)
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data['status'], RenderJob.Status.PENDING)
+        self.assertIsNone(response.data['result_url'])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.cv_pdf_download_count, 5)
+
+        result = self.get(reverse('cvbuilder:render-job-result', args=[response.data['id']]))
+        self.assertEqual(result.status_code, 409)
+
+        job = run_render_job(claim_render_job())
+
+        self.assertEqual(job.status, RenderJob.Status.SUCCEEDED)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.cv_pdf_download_count, 4)
+
+        job_status = self.get(response['Location'])
+        self.assertEqual(job_status.data['status'], RenderJob.Status.SUCCEEDED)
+        result = self.get(job_status.data['result_url'])
+        self.assertEqual(result.status_code, 200)
+        self.assertTrue(b''.join(result.streaming_content).startswith(b'%PDF'))
+
+    def test_download_requested_twice_is_queued_once(self):
+        first = self.get(self.url)
+        second = self.get(self.url)
+
+        self.assertEqual(first.data['id'], second.data['id'])
+        self.assertEqual(RenderJob.objects.count(), 1)
+
+    @override_settings(RENDER_JOB_MAX_ACTIVE_PER_USER=1)
+    def test_download_with_full_queue(self):
+        other_cv = CvBuilder.objects.create(user=self.user, cv_title='Other CV')
+        self.get(self.url)
+
+        response = self.get(reverse('cvbuilder:cv-pdf-download', args=[other_cv.id]))
+
+        self.assertEqual(response.status_code, 429)
+
+    def test_paying_users_jobs_are_claimed_first(self):
+        paying_user = get_user_model().objects.create_user(
+            email='paying@example.com', password='Password123!', first_name='Jane', last_name='Doe', username='paying',
+            is_free=False,
+        )
+        paying_cv = CvBuilder.objects.create(user=paying_user, cv_title='Paying CV')
+        jobs.enqueue_render_job(self.user, self.cv.id, RenderJob.DocumentFormat.PDF)
+        paying_job = jobs.enqueue_render_job(paying_user, paying_cv.id, RenderJob.DocumentFormat.PDF)
+
+        self.assertEqual(claim_render_job().id, paying_job.id)
+
+    @override_settings(RENDER_JOB_MAX_ATTEMPTS=2)
+    def test_failed_render_is_retried_then_failed_without_charge(self):
+        job = jobs.enqueue_render_job(self.user, self.cv.id, RenderJob.DocumentFormat.PDF)
+
+        with mock.patch.dict(jobs.RENDER_FORMATS[RenderJob.DocumentFormat.PDF],
+                             render=mock.Mock(side_effect=RuntimeError('boom'))):
+            run_render_job(claim_render_job())
+            job.refresh_from_db()
+            self.assertEqual(job.status, RenderJob.Status.PENDING)
+            self.assertGreater(job.run_after, timezone.now())
+            self.assertIsNone(claim_render_job())  # backing off
+
+            RenderJob.objects.filter(pk=job.pk).update(run_after=timezone.now())
+            run_render_job(claim_render_job())
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, RenderJob.Status.FAILED)
+        self.assertEqual(job.attempts, 2)
+        self.assertIn('boom', job.error)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.cv_pdf_download_count, 5)
+
+    def test_abandoned_job_is_claimed_again(self):
+        job = jobs.enqueue_render_job(self.user, self.cv.id, RenderJob.DocumentFormat.PDF)
+        claim_render_job()
+        self.assertIsNone(claim_render_job())
+
+        RenderJob.objects.filter(pk=job.pk).update(locked_at=timezone.now() - datetime.timedelta(hours=1))
+
+        self.assertEqual(claim_render_job().id, job.id)
+
+    @override_settings(RENDER_JOB_MAX_ATTEMPTS=2)
+    def test_job_abandoned_on_every_attempt_is_failed(self):
+        job = jobs.enqueue_render_job(self.user, self.cv.id, RenderJob.DocumentFormat.PDF)
+        abandoned = timezone.now() - datetime.timedelta(hours=1)
+
+        claim_render_job()
+        RenderJob.objects.filter(pk=job.pk).update(locked_at=abandoned)
+        self.assertEqual(claim_render_job().id, job.id)
+        RenderJob.objects.filter(pk=job.pk).update(locked_at=abandoned)
+
+        self.assertIsNone(claim_render_job())
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (RenderJob.Status.FAILED, 2))
+
+    def test_render_job_of_other_user(self):
+        other_user = get_user_model().objects.create_user(
+            email='other@example.com', password='Password123!', first_name='Jane', last_name='Doe', username='other',
+        )
+        other_cv = CvBuilder.objects.create(user=other_user, cv_title='Other CV')
+        job = jobs.enqueue_render_job(other_user, other_cv.id, RenderJob.DocumentFormat.PDF)
+
+        response = self.get(reverse('cvbuilder:render-job', args=[job.id]))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_result_is_deleted_with_its_last_job(self):
+        first = RenderJob.objects.create(user=self.user, cv=self.cv, document_format=RenderJob.DocumentFormat.PDF,
+                                         status=RenderJob.Status.SUCCEEDED, result='rendered/cv.pdf')
+        other_cv = CvBuilder.objects.create(user=self.user, cv_title='Other CV')
+        RenderJob.objects.create(user=self.user, cv=other_cv, document_format=RenderJob.DocumentFormat.PDF,
+                                 status=RenderJob.Status.SUCCEEDED, result='rendered/cv.pdf')
+
+        with mock.patch.object(s3_deletion, 'delete_s3_keys') as delete_s3_keys:
+            with self.captureOnCommitCallbacks(execute=True):
+                first.delete()
+            delete_s3_keys.assert_not_called()  # still the result of the other cv's job
+
+            with self.captureOnCommitCallbacks(execute=True):
+                other_cv.delete()
+
+        delete_s3_keys.assert_called_once_with([s3_deletion.s3_key('rendered/cv.pdf')])
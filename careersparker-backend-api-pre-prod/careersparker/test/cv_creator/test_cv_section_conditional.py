@@ -0,0 +1,101 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from cvbuilder.models import CvBuilder, Skill
+
+
+# ----------------------------------------------------------------
+# Conditional GET on CV sections
+# ----------------------------------------------------------------
+class TestCVSectionConditionalGet(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email='test@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username='johndoe',
+            is_active=True,
+            is_verified=True,
+        )
+
+        login_url = reverse('user:token_obtain_pair')
+
+        token_data = {
+            'email': 'test@example.com',
+            'password': 'Password123!',
+        }
+
+        response = self.client.post(login_url, token_data, format='json')  # login user
+        self.token = response.data['access']  # get token
+
+        self.cv = CvBuilder.objects.create(user=self.user, cv_title='Test CV')
+        self.skill = Skill.objects.create(user=self.user, cv=self.cv, skill_name='Django', skill_level=4)
+        Skill.objects.create(user=self.user, cv=self.cv, skill_name='Python', skill_level=5)
+        self.url = reverse('skill_cv_id', args=[self.cv.id])
+
+    def test_get_section_sends_etag(self):
+        response = self.client.get(self.url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('ETag', response)
+        self.assertNotIn('Last-Modified', response)
+
+    def test_get_unchanged_section_not_modified(self):
+        response = self.client.get(self.url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        # the user and the section aggregate, the section rows are never loaded
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                self.url,
+                HTTP_AUTHORIZATION=f'Bearer {self.token}',
+                HTTP_IF_NONE_MATCH=response['ETag'],
+            )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_get_section_modified_after_update(self):
+        response = self.client.get(self.url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.skill.skill_level = 5
+        self.skill.save()
+
+        response = self.client.get(
+            self.url,
+            HTTP_AUTHORIZATION=f'Bearer {self.token}',
+            HTTP_IF_NONE_MATCH=response['ETag'],
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['skills']), 2)
+
+    def test_get_section_modified_after_delete(self):
+        response = self.client.get(self.url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.skill.delete()
+
+        response = self.client.get(
+            self.url,
+            HTTP_AUTHORIZATION=f'Bearer {self.token}',
+            HTTP_IF_NONE_MATCH=response['ETag'],
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([skill['skill_name'] for skill in response.data['skills']], ['Python'])
+
+    def test_if_modified_since_is_ignored(self):
+        self.client.get(self.url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        # a delete in the same second as the last poll must not be answered with 304
+        self.skill.delete()
+
+        response = self.client.get(
+            self.url,
+            HTTP_AUTHORIZATION=f'Bearer {self.token}',
+            HTTP_IF_MODIFIED_SINCE='Fri, 31 Dec 9999 23:59:59 GMT',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([skill['skill_name'] for skill in response.data['skills']], ['Python'])
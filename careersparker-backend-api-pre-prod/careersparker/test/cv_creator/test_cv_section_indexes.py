@@ -0,0 +1,23 @@
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+
+from cvbuilder.sections.registry import SECTIONS
+
+
+# ----------------------------------------------------------------
+# Section indexes
+# ----------------------------------------------------------------
+class TestCVSectionIndexes(TestCase):
+    def test_section_ordering_is_indexed(self):
+        for section in SECTIONS:
+            index_fields = [index.fields for index in section.model._meta.indexes]
+            self.assertIn(['cv', *section.ordering], index_fields, section.name)
+
+    def test_index_report_needs_postgresql(self):
+        if connection.vendor == 'postgresql':
+            self.skipTest('runs on the test database of another vendor')
+
+        with self.assertRaises(CommandError):
+            call_command('index_report')
@@ -0,0 +1,94 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from cvbuilder.models import CvBuilder, Skill
+
+
+# ----------------------------------------------------------------
+# Ownership of CV sections
+# ----------------------------------------------------------------
+class TestCVSectionOwner(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email='test@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username='johndoe',
+            is_active=True,
+            is_verified=True,
+        )
+        self.other_user = get_user_model().objects.create_user(
+            email='other@example.com',
+            password='Password123!',
+            first_name='Jane',
+            last_name='Doe',
+            username='janedoe',
+            is_active=True,
+            is_verified=True,
+        )
+
+        login_url = reverse('user:token_obtain_pair')
+
+        token_data = {
+            'email': 'test@example.com',
+            'password': 'Password123!',
+        }
+
+        response = self.client.post(login_url, token_data, format='json')  # login user
+        self.token = response.data['access']  # get token
+
+        self.cv = CvBuilder.objects.create(user=self.user, cv_title='Test CV')
+        self.skill = Skill.objects.create(user=self.user, cv=self.cv, skill_name='Django', skill_level=4)
+
+        self.other_cv = CvBuilder.objects.create(user=self.other_user, cv_title='Other CV')
+        self.other_skill = Skill.objects.create(user=self.other_user, cv=self.other_cv, skill_name='Go', skill_level=2)
+
+    def test_delete_own_skill(self):
+        url = reverse('skill', args=[self.skill.id])
+
+        # the user, the owned skill with its cv, then the delete itself
+        with self.assertNumQueries(3):
+            response = self.client.delete(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Skill.objects.filter(id=self.skill.id).exists())
+
+    def test_delete_skill_of_another_user(self):
+        url = reverse('skill', args=[self.other_skill.id])
+
+        response = self.client.delete(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 403)
+        self.assertTrue(Skill.objects.filter(id=self.other_skill.id).exists())
+
+    def test_delete_skill_not_found(self):
+        url = reverse('skill', args=[self.other_skill.id + 100])
+
+        response = self.client.delete(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_delete_skills_of_another_users_cv(self):
+        url = reverse('skill_cv_id', args=[self.other_cv.id])
+
+        response = self.client.delete(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 403)
+        self.assertTrue(Skill.objects.filter(cv=self.other_cv).exists())
+
+    def test_get_skills_of_another_users_cv(self):
+        url = reverse('skill_cv_id', args=[self.other_cv.id])
+
+        response = self.client.get(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 403)
+        self.assertNotIn('ETag', response)
+
+    def test_get_skill_of_another_user(self):
+        url = reverse('skill', args=[self.other_skill.id])
+
+        response = self.client.get(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,102 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from cvbuilder.models import CvBuilder, Skill, Hobby, Award
+
+
+# ----------------------------------------------------------------
+# Generated section endpoints
+# ----------------------------------------------------------------
+class TestCVSections(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email='test@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username='johndoe',
+            is_active=True,
+            is_verified=True,
+        )
+
+        login_url = reverse('user:token_obtain_pair')
+
+        token_data = {
+            'email': 'test@example.com',
+            'password': 'Password123!',
+        }
+
+        response = self.client.post(login_url, token_data, format='json')  # login user
+        self.token = response.data['access']  # get token
+
+        self.cv = CvBuilder.objects.create(user=self.user, cv_title='Test CV')
+        self.skill = Skill.objects.create(user=self.user, cv=self.cv, skill_name='Django', skill_level=4)
+
+    def test_create_skill(self):
+        url = reverse('skill_cv_id', args=[self.cv.id])
+
+        response = self.client.post(url, {'skill_name': 'Python', 'skill_level': 5},
+                                    content_type='application/json', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 201)
+        skill = Skill.objects.get(id=response.data['id'])
+        self.assertEqual(skill.cv, self.cv)
+        self.assertEqual(skill.user, self.user)
+
+    def test_create_duplicate_skill(self):
+        url = reverse('skill_cv_id', args=[self.cv.id])
+
+        response = self.client.post(url, {'skill_name': 'Django'},
+                                    content_type='application/json', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['message'], 'Skill already exists')
+        self.assertEqual(Skill.objects.filter(cv=self.cv).count(), 1)
+
+    def test_list_skills_ordering(self):
+        Skill.objects.create(user=self.user, cv=self.cv, skill_name='Python', skill_level=5)
+        url = reverse('skill_cv_id', args=[self.cv.id])
+
+        response = self.client.get(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([skill['skill_name'] for skill in response.data['skills']], ['Python', 'Django'])
+
+    def test_get_skill(self):
+        url = reverse('skill', args=[self.skill.id])
+
+        response = self.client.get(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        # the skill keeps its original one item list envelope
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([skill['skill_name'] for skill in response.data['skills']], ['Django'])
+
+    def test_get_award(self):
+        award = Award.objects.create(user=self.user, cv=self.cv, award_title='Test Award')
+        url = reverse('award_by_id', args=[award.id])
+
+        response = self.client.get(url, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['award_title'], 'Test Award')
+
+    def test_update_skill(self):
+        url = reverse('skill', args=[self.skill.id])
+
+        response = self.client.patch(url, {'skill_level': 2, 'cv': self.cv.id + 100},
+                                     content_type='application/json', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        self.skill.refresh_from_db()
+        self.assertEqual(self.skill.skill_level, 2)
+        self.assertEqual(self.skill.cv, self.cv)  # the cv is read only
+
+    def test_create_premium_section_free_user(self):
+        url = reverse('hobby_by_cv_id', args=[self.cv.id])
+
+        response = self.client.post(url, {}, content_type='application/json',
+                                    HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Hobby.objects.filter(cv=self.cv).exists())
@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from cvbuilder.models import CvBuilder, Skill
+
+
+# ----------------------------------------------------------------
+# Sparse fieldsets on cv and section lists
+# ----------------------------------------------------------------
+class TestCVSparseFields(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email='test@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username='johndoe',
+            is_active=True,
+            is_verified=True,
+        )
+
+        login_url = reverse('user:token_obtain_pair')
+
+        token_data = {
+            'email': 'test@example.com',
+            'password': 'Password123!',
+        }
+
+        response = self.client.post(login_url, token_data, format='json')  # login user
+        self.token = response.data['access']  # get token
+
+        self.cv = CvBuilder.objects.create(user=self.user, cv_title='Test CV')
+        self.skill = Skill.objects.create(user=self.user, cv=self.cv, skill_name='Django', skill_level=4)
+
+    def test_list_cvs_with_fields(self):
+        response = self.client.get(reverse('cvbuilder:cvbuilder-list'), {'fields': 'id,cv_title'},
+                                   HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'], [{'id': self.cv.id, 'cv_title': 'Test CV'}])
+
+    def test_list_skills_with_fields(self):
+        url = reverse('skill_cv_id', args=[self.cv.id])
+
+        response = self.client.get(url, {'fields': 'skill_name'}, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['skills'], [{'skill_name': 'Django'}])
+
+    def test_get_skill_with_exclude(self):
+        url = reverse('skill', args=[self.skill.id])
+
+        response = self.client.get(url, {'exclude': 'user,cv,created_at,updated_at'},
+                                   HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data['skills'][0]), {'id', 'skill_name', 'skill_level'})
+
+    def test_list_skills_with_unknown_field(self):
+        url = reverse('skill_cv_id', args=[self.cv.id])
+
+        response = self.client.get(url, {'fields': 'skill_name,password'}, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('password', response.data['fields'])
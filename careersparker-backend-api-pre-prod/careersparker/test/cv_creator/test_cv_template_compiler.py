@@ -0,0 +1,71 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from cvbuilder.documents import compiler
+from cvbuilder.documents.compiler import RenderPlanCache, TemplateCompileError, get_render_plan
+from cvbuilder.documents.pdf import render_cv_pdf
+
+
+# ----------------------------------------------------------------
+# Template render plans
+# ----------------------------------------------------------------
+class TestCVTemplateCompiler(TestCase):
+    def setUp(self):
+        compiler.render_plan_cache.clear()
+
+    def test_compile_template(self):
+        plan = compiler.compile_template('classic')
+
+        self.assertEqual(plan.spec['word_font'], 'Times New Roman')
+        self.assertEqual(plan.spec['accent_color'], '#000000')
+
+    def test_compile_unknown_template_uses_default(self):
+        plan = compiler.compile_template('unknown')
+
+        self.assertEqual(plan.spec, compiler.compile_template('default').spec)
+
+    def test_compile_invalid_template(self):
+        with mock.patch.dict(compiler.DOCUMENT_TEMPLATES, broken={'accent_color': 'blue'}):
+            with self.assertRaises(TemplateCompileError):
+                compiler.compile_template('broken')
+
+    def test_plan_is_compiled_once(self):
+        with mock.patch.object(compiler, 'compile_template', wraps=compiler.compile_template) as compile_template:
+            first = get_render_plan('classic')
+            second = get_render_plan('classic')
+
+        self.assertIs(first, second)
+        self.assertEqual(compile_template.call_count, 1)
+
+    def test_plan_parts_are_compiled_once(self):
+        plan = get_render_plan('classic')
+        compile_part = mock.Mock(return_value='styles')
+
+        self.assertEqual(plan.part('styles', compile_part), 'styles')
+        self.assertEqual(plan.part('styles', compile_part), 'styles')
+        compile_part.assert_called_once_with(plan.spec)
+
+    def test_pdf_render_reuses_the_plan(self):
+        render_cv_pdf({'cv_title': 'Test CV'}, 'classic')
+        styles = get_render_plan('classic').part('pdf_styles', mock.Mock())
+
+        render_cv_pdf({'cv_title': 'Test CV'}, 'classic')
+
+        self.assertIs(get_render_plan('classic').part('pdf_styles', mock.Mock()), styles)
+
+    def test_cached_plan_is_found_without_a_query(self):
+        get_render_plan('classic')
+
+        with self.assertNumQueries(0):
+            get_render_plan('classic')
+
+    def test_least_recently_used_plan_is_evicted(self):
+        cache = RenderPlanCache(max_size=2)
+        cache.get('a', lambda: 'plan a')
+        cache.get('b', lambda: 'plan b')
+        cache.get('a', lambda: 'plan a')
+        cache.get('c', lambda: 'plan c')
+
+        self.assertEqual(cache.get('a', lambda: 'new a'), 'plan a')
+        self.assertEqual(cache.get('b', lambda: 'new b'), 'new b')
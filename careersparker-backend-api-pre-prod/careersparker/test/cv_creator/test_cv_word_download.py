@@ -0,0 +1,116 @@
+import io
+import zipfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from cvbuilder.documents import jobs, word
+from cvbuilder.documents.jobs import claim_render_job, run_render_job
+from cvbuilder.models import CvBuilder, EmploymentHistory, Skill
+
+
+# ----------------------------------------------------------------
+# Word download
+# ----------------------------------------------------------------
+class TestCVWordDownload(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            email='test@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username='johndoe',
+            is_active=True,
+            is_verified=True,
+        )
+        self.user.cv_word_download_count = 5
+        self.user.save()
+
+        login_url = reverse('user:token_obtain_pair')
+
+        token_data = {
+            'email': 'test@example.com',
+            'password': 'Password123!',
+        }
+
+        response = self.client.post(login_url, token_data, format='json')  # login user
+        self.token = response.data['access']  # get token
+
+        self.cv = CvBuilder.objects.create(user=self.user, cv_title='Test CV')
+        EmploymentHistory.objects.create(
+            user=self.user, cv=self.cv, job_title='Engineer', employer_name='ACME',
+            job_description='<p>Built <strong>things</strong> &amp; more</p><ul><li>One</li><li>Two</li></ul>',
+        )
+        Skill.objects.create(user=self.user, cv=self.cv, skill_name='Django', skill_level=4)
+        self.url = reverse('cvbuilder:cv-word-download', args=[self.cv.id])
+
+    def download(self):
+        """Request the download, render it like the render worker does and fetch the file"""
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {self.token}'}
+        response = self.client.get(self.url, **headers)
+        if response.status_code != 202:
+            return response
+
+        while (job := claim_render_job()) is not None:
+            run_render_job(job)
+
+        job_status = self.client.get(response['Location'], **headers)
+        response = self.client.get(job_status.data['result_url'], **headers)
+        if response.streaming:
+            response.content_bytes = b''.join(response.streaming_content)
+        return response
+
+    def test_download_word(self):
+        response = self.download()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], word.DOCX_CONTENT_TYPE)
+        self.assertIn('attachment', response['Content-Disposition'])
+
+        archive = zipfile.ZipFile(io.BytesIO(response.content_bytes))
+        self.assertIsNone(archive.testzip())
+        document = archive.read('word/document.xml').decode()
+        self.assertIn('Engineer', document)
+        self.assertIn('things</w:t>', document)
+        self.assertIn('&amp; more', document)
+        self.assertIn('<w:numId w:val="1"/>', document)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.cv_word_download_count, 4)
+
+    def test_download_unchanged_cv_is_not_rendered_again(self):
+        with mock.patch.object(jobs, 'iter_cv_docx', wraps=word.iter_cv_docx) as render:
+            first = self.download()
+            second = self.download()
+
+            self.assertEqual(render.call_count, 1)
+            self.assertEqual(first['ETag'], second['ETag'])
+            self.assertEqual(first.content_bytes, second.content_bytes)
+
+            with self.captureOnCommitCallbacks(execute=True):  # invalidates the cached cv
+                Skill.objects.create(user=self.user, cv=self.cv, skill_name='Python', skill_level=5)
+            third = self.download()
+
+            self.assertEqual(render.call_count, 2)
+            self.assertNotEqual(first['ETag'], third['ETag'])
+
+    def test_large_download_is_spooled_to_disk(self):
+        with mock.patch.object(jobs, 'RENDER_SPOOL_MAX_SIZE', 100), \
+                mock.patch.object(jobs.tempfile, 'SpooledTemporaryFile', wraps=jobs.tempfile.SpooledTemporaryFile) as spool:
+            response = self.download()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(spool.call_args.kwargs['max_size'], 100)
+        self.assertIsNone(zipfile.ZipFile(io.BytesIO(response.content_bytes)).testzip())
+
+    def test_download_word_without_credits(self):
+        self.user.cv_word_download_count = 0
+        self.user.save()
+
+        response = self.download()
+
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,52 @@
+import datetime
+import decimal
+import io
+import json
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from cvbuilder.models import CvTemplate
+from util.Renderer.orjson_renderer import OrjsonRenderer, OrjsonParser
+
+
+# ----------------------------------------------------------------
+# orjson renderer and parser
+# ----------------------------------------------------------------
+class TestJSONRenderer(SimpleTestCase):
+    def test_render_matches_stock_renderer(self):
+        data = {
+            'date': datetime.date(2024, 5, 1),
+            'datetime': datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.timezone.utc),
+            'decimal': decimal.Decimal('9.99'),
+            'lazy': gettext_lazy('Skill'),
+            'html': '<p>Café &amp; bar</p>',
+            'nested': [{'id': 1, 'value': None}],
+        }
+
+        self.assertEqual(json.loads(OrjsonRenderer().render(data)), json.loads(JSONRenderer().render(data)))
+        self.assertIn(b'"2024-05-01T12:30:00Z"', OrjsonRenderer().render(data))
+
+    def test_render_image_field(self):
+        template = CvTemplate(cv_template_thumbnail='cv/template/thumbnail.png')
+
+        rendered = json.loads(OrjsonRenderer().render({
+            'thumbnail': template.cv_template_thumbnail,
+            'thumbnail_small': template.cv_template_thumbnail_small,
+            'created_at': timezone.now(),
+        }))
+
+        self.assertTrue(rendered['thumbnail'].endswith('cv/template/thumbnail.png'))
+        self.assertIsNone(rendered['thumbnail_small'])
+
+    def test_parse(self):
+        data = OrjsonParser().parse(io.BytesIO('{"skill_name": "Café", "skill_level": 3}'.encode()))
+
+        self.assertEqual(data, {'skill_name': 'Café', 'skill_level': 3})
+
+    def test_parse_invalid_json(self):
+        with self.assertRaises(ParseError):
+            OrjsonParser().parse(io.BytesIO(b'{"skill_name": '))
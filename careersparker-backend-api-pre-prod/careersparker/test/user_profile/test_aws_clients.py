@@ -0,0 +1,52 @@
+from unittest import mock
+
+from botocore.stub import Stubber
+from django.test import SimpleTestCase
+
+from util.Storage import aws_clients
+from util.Storage.aws_clients import AwsClientRegistry
+
+
+# ----------------------------------------------------------------
+# Shared aws clients
+# ----------------------------------------------------------------
+class TestAwsClients(SimpleTestCase):
+    def setUp(self):
+        self.registry = AwsClientRegistry()
+
+    def test_clients_are_created_on_first_use(self):
+        with mock.patch.object(self.registry, '_create', wraps=self.registry._create) as create:
+            self.assertEqual(self.registry.metrics(), {})
+
+            first = self.registry.get('s3')
+            second = self.registry.get('s3')
+
+        self.assertIs(first, second)
+        create.assert_called_once_with('s3')
+
+    def test_client_config(self):
+        client = self.registry.get('s3')
+
+        self.assertEqual(client.meta.config.max_pool_connections, 20)
+        self.assertEqual(client.meta.config.retries, {'total_max_attempts': 4, 'mode': 'standard'})
+
+    def test_forked_process_gets_its_own_clients(self):
+        client = self.registry.get('s3')
+
+        with mock.patch.object(aws_clients.os, 'getpid', return_value=-1):
+            self.assertIsNot(self.registry.get('s3'), client)
+
+    def test_call_latency_is_recorded(self):
+        client = self.registry.get('s3')
+
+        with Stubber(client) as stubber:
+            stubber.add_response('delete_object', {}, {'Bucket': 'bucket', 'Key': 'file.png'})
+            stubber.add_client_error('delete_object', 'NoSuchBucket', http_status_code=404)
+            client.delete_object(Bucket='bucket', Key='file.png')
+            with self.assertRaises(client.exceptions.NoSuchBucket):
+                client.delete_object(Bucket='bucket', Key='file.png')
+
+        metrics = self.registry.metrics()['s3']['DeleteObject']
+        self.assertEqual(metrics['calls'], 2)
+        self.assertEqual(metrics['errors'], 1)
+        self.assertGreaterEqual(metrics['max_ms'], metrics['avg_ms'])
@@ -0,0 +1,157 @@
+import hashlib
+import io
+from unittest import mock
+
+from botocore.exceptions import ClientError
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from PIL import Image
+
+from user.models import Profile, ProfilePicture
+from util.Storage import direct_upload, s3_deletion
+from util.Storage.image_pool import image_pool
+
+
+def picture_bytes():
+    output = io.BytesIO()
+    Image.linear_gradient('L').resize((600, 400)).convert('RGB').save(output, format='JPEG')
+    return output.getvalue()
+
+
+# ----------------------------------------------------------------
+# Presigned uploads straight to s3
+# ----------------------------------------------------------------
+class TestDirectUpload(TestCase):
+    def setUp(self):
+        self.user = self.create_user('johndoe')
+        self.profile = Profile.objects.get(user=self.user)
+        self.headers = self.login('johndoe')
+
+        # the bucket, with the object staged by the client once presigned
+        self.staged = {}
+        self.replaced_with = {}
+        s3_client = mock.patch.object(direct_upload, 's3_client')
+        self.s3_client = s3_client.start().return_value
+        self.addCleanup(s3_client.stop)
+        self.s3_client.generate_presigned_post.side_effect = lambda Bucket, Key, **kwargs: {
+            'url': 'https://bucket.s3.amazonaws.com/', 'fields': {'key': Key},
+        }
+        self.s3_client.get_object.side_effect = self.get_object
+        self.s3_client.exceptions.NoSuchKey = KeyError
+
+        # the replaced pictures are deleted from the bucket once the request commits
+        deletion_client = mock.patch.object(s3_deletion, 's3_client')
+        deletion_client.start().return_value.delete_objects.return_value = {}
+        self.addCleanup(deletion_client.stop)
+
+        # image tasks run in the test process, where the s3 client is mocked
+        run = mock.patch.object(image_pool, 'run', side_effect=lambda task, *args: task(*args))
+        run.start()
+        self.addCleanup(run.stop)
+
+    def create_user(self, username):
+        return get_user_model().objects.create_user(
+            email=f'{username}@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username=username,
+            is_active=True,
+            is_verified=True,
+        )
+
+    def login(self, username):
+        token = self.client.post(reverse('user:token_obtain_pair'),
+                                 {'email': f'{username}@example.com', 'password': 'Password123!'}).data['access']
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def get_object(self, Bucket, Key, Range=None, IfMatch=None):
+        data = self.staged[Key]
+        etag = f'"{hashlib.md5(data).hexdigest()}"'
+        if IfMatch is not None and IfMatch != etag:
+            raise ClientError({'Error': {'Code': 'PreconditionFailed'}}, 'GetObject')
+        if Range is None:
+            return {'Body': io.BytesIO(data), 'ContentLength': len(data), 'ETag': etag}
+
+        # the client may post to the presigned url again once its upload was checked
+        self.staged[Key] = self.replaced_with.pop(Key, data)
+        end = min(int(Range.rsplit('-', 1)[1]), len(data) - 1)
+        return {'Body': io.BytesIO(data[:end + 1]), 'ContentLength': end + 1,
+                'ContentRange': f'bytes 0-{end}/{len(data)}', 'ETag': etag}
+
+    def presign(self, headers=None):
+        return self.client.post(reverse('user_profile:profile_picture_upload', args=[self.profile.pk]),
+                                **(headers or self.headers))
+
+    def confirm(self, upload_token):
+        return self.client.patch(reverse('user_profile:profile_picture', args=[self.profile.pk]),
+                                 {'upload_token': upload_token}, content_type='application/json', **self.headers)
+
+    def test_presign(self):
+        response = self.presign()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('upload_token', response.data)
+        self.assertTrue(response.data['fields']['key'].startswith(
+            f'static/staging-uploads/profile_picture/{self.user.id}/'))
+        conditions = self.s3_client.generate_presigned_post.call_args.kwargs['Conditions']
+        self.assertIn(['starts-with', '$Content-Type', 'image/'], conditions)
+
+    def test_presign_for_another_user(self):
+        self.create_user('janedoe')
+
+        self.assertEqual(self.presign(self.login('janedoe')).status_code, 403)
+
+    def test_confirm_processes_the_staged_picture(self):
+        presigned = self.presign().data
+        key = presigned['fields']['key']
+        self.staged[key] = picture_bytes()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.confirm(presigned['upload_token'])
+
+        self.assertEqual(response.status_code, 200)
+        picture = ProfilePicture.objects.get(user=self.user)
+        self.assertEqual(picture.profile_picture_variants['full']['width'], 512)
+        with Image.open(picture.profile_picture) as stored:
+            self.assertEqual(stored.format, 'WEBP')
+        self.s3_client.delete_object.assert_called_once_with(Bucket=mock.ANY, Key=key)
+
+    def test_confirm_rejects_an_oversized_upload(self):
+        presigned = self.presign().data
+        key = presigned['fields']['key']
+        self.staged[key] = picture_bytes() + b'\0' * (11 * 1024 * 1024)
+        previous = ProfilePicture.objects.get(user=self.user).profile_picture.name
+
+        response = self.confirm(presigned['upload_token'])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(ProfilePicture.objects.get(user=self.user).profile_picture.name, previous)
+        self.s3_client.delete_object.assert_called_once_with(Bucket=mock.ANY, Key=key)
+
+    def test_confirm_rejects_another_users_token(self):
+        other = self.create_user('janedoe')
+        upload = direct_upload.create_presigned_upload(other, 'profile_picture')
+        self.staged[upload['fields']['key']] = picture_bytes()
+
+        response = self.confirm(upload['upload_token'])
+
+        self.assertEqual(response.status_code, 400)
+        self.s3_client.get_object.assert_not_called()
+
+    def test_confirm_rejects_a_tampered_token(self):
+        self.assertEqual(self.confirm('not-a-token').status_code, 400)
+
+    def test_confirm_rejects_an_upload_replaced_after_its_check(self):
+        presigned = self.presign().data
+        key = presigned['fields']['key']
+        self.staged[key] = picture_bytes()
+        self.replaced_with[key] = picture_bytes() + b'replaced'
+        previous = ProfilePicture.objects.get(user=self.user).profile_picture.name
+
+        response = self.confirm(presigned['upload_token'])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(ProfilePicture.objects.get(user=self.user).profile_picture.name, previous)
+        self.s3_client.delete_object.assert_called_once_with(Bucket=mock.ANY, Key=key)
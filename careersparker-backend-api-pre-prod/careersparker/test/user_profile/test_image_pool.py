@@ -0,0 +1,135 @@
+import os
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from django.urls import reverse
+from PIL import Image
+
+from test.user_profile.test_process_image import png_claiming_size
+from user.models import Profile, ProfilePicture
+from util.Storage.image_pool import ImagePool, ImagePoolBusy, ImagePoolError, ImagePoolTimeout, image_pool
+
+
+def uploaded_picture():
+    output = BytesIO()
+    Image.linear_gradient('L').resize((600, 400)).convert('RGB').save(output, format='PNG')
+    return SimpleUploadedFile('picture.png', output.getvalue(), content_type='image/png')
+
+
+# ----------------------------------------------------------------
+# Image process pool
+# ----------------------------------------------------------------
+class TestImagePool(SimpleTestCase):
+    def setUp(self):
+        self.pool = ImagePool(size=1, max_pending=0, timeout=10)
+        self.addCleanup(self.pool.shutdown)
+
+    def test_run(self):
+        self.assertEqual(self.pool.run(pow, 2, 10), 1024)
+
+    def test_saturated_pool_is_busy(self):
+        self.pool.run(pow, 2, 10)  # start the worker
+        running = threading.Thread(target=self.pool.run, args=(time.sleep, 1))
+        running.start()
+        time.sleep(0.1)
+
+        with self.assertRaises(ImagePoolBusy):
+            self.pool.run(pow, 2, 10)
+
+        running.join()
+        self.assertEqual(self.pool.run(pow, 2, 10), 1024)
+
+    def test_timeout(self):
+        self.pool.timeout = 0.1
+
+        with self.assertRaises(ImagePoolTimeout):
+            self.pool.run(time.sleep, 1)
+
+    def test_timed_out_task_frees_capacity(self):
+        self.pool.run(pow, 2, 10)  # start the worker
+        hung = self.pool._get_executor()
+        workers = list(hung._processes.values())
+        self.pool.timeout = 0.5
+
+        with self.assertRaises(ImagePoolTimeout):
+            self.pool.run(time.sleep, 60)
+
+        # the slot is free straight away and the hung worker is stopped
+        self.pool.timeout = 30
+        self.assertEqual(self.pool.run(pow, 2, 10), 1024)
+        self.assertIsNot(self.pool._get_executor(), hung)
+        for worker in workers:
+            worker.join(timeout=5)
+            self.assertFalse(worker.is_alive())
+
+    def test_task_errors_are_raised(self):
+        with self.assertRaises(ValueError):
+            self.pool.run(int, 'not a number')
+
+    def test_killed_worker_restarts_the_pool(self):
+        with self.assertRaises(ImagePoolError):
+            self.pool.run(os._exit, 1)
+
+        self.assertEqual(self.pool.run(pow, 2, 10), 1024)
+
+    def test_broken_pool_on_submit_restarts_the_pool(self):
+        broken = self.pool._get_executor()
+        with mock.patch.object(broken, 'submit', side_effect=BrokenProcessPool()):
+            with self.assertRaises(ImagePoolError):
+                self.pool.run(pow, 2, 10)
+
+        self.assertIsNot(self.pool._get_executor(), broken)
+        self.assertEqual(self.pool.run(pow, 2, 10), 1024)
+
+
+class TestProfilePicturePool(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email='test@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username='johndoe',
+            is_active=True,
+            is_verified=True,
+        )
+        self.profile = Profile.objects.get(user=self.user)
+        token = self.client.post(reverse('user:token_obtain_pair'),
+                                 {'email': 'test@example.com', 'password': 'Password123!'}).data['access']
+        self.headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def patch_picture(self, picture=None):
+        return self.client.patch(reverse('user_profile:profile_picture', args=[self.profile.pk]),
+                                 encode_multipart(BOUNDARY, {'profile_picture': picture or uploaded_picture()}),
+                                 content_type=MULTIPART_CONTENT, **self.headers)
+
+    def test_picture_is_processed_in_the_pool(self):
+        response = self.patch_picture()
+
+        self.assertEqual(response.status_code, 200)
+        picture = ProfilePicture.objects.get(user=self.user)
+        self.assertEqual(picture.profile_picture_variants['full']['width'], 512)
+        self.assertEqual(picture.profile_picture_variants['small']['width'], 128)
+
+    def test_busy_pool_returns_429(self):
+        previous = ProfilePicture.objects.get(user=self.user).profile_picture.name
+
+        with mock.patch.object(image_pool, 'run', side_effect=ImagePoolBusy()):
+            response = self.patch_picture()
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(ProfilePicture.objects.get(user=self.user).profile_picture.name, previous)
+
+    def test_oversized_picture_is_rejected_before_the_pool(self):
+        with mock.patch.object(image_pool, 'run') as run:
+            response = self.patch_picture(png_claiming_size(100000, 100000))
+
+        self.assertEqual(response.status_code, 400)
+        run.assert_not_called()
@@ -0,0 +1,179 @@
+import struct
+import zlib
+from io import BytesIO
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ValidationError
+from PIL import Image, JpegImagePlugin
+
+from util.Storage import process_image
+from util.Storage.process_image import (TEMPLATE_THUMBNAIL_VARIANTS, derive_image_variants, encode_to_target_size,
+                                        image_srcset, process_profile_picture, validate_image_upload)
+
+
+def noisy_image(size):
+    """A gradient with noise, so its encoded size depends on the quality like a photo"""
+    noise = Image.effect_noise(size, 30).convert('RGB')
+    gradient = Image.linear_gradient('L').resize(size).convert('RGB')
+    return Image.blend(gradient, noise, 0.25)
+
+
+def uploaded(image, image_format='PNG', content_type='image/png', name='picture.png'):
+    output = BytesIO()
+    image.save(output, format=image_format)
+    return SimpleUploadedFile(name, output.getvalue(), content_type=content_type)
+
+
+def png_claiming_size(width, height):
+    """A tiny png whose header claims width x height pixels"""
+    data = uploaded(Image.new('RGB', (1, 1))).read()
+    header = b'IHDR' + struct.pack('>II', width, height) + data[24:29]
+    data = data[:12] + header + struct.pack('>I', zlib.crc32(header)) + data[33:]
+    return SimpleUploadedFile('bomb.png', data, content_type='image/png')
+
+
+# ----------------------------------------------------------------
+# Target size image encoding
+# ----------------------------------------------------------------
+class TestProcessImage(SimpleTestCase):
+    def test_encode_to_target_size_fits_budget(self):
+        image = noisy_image((300, 300))
+
+        output, quality = encode_to_target_size(image, 10 * 1024)
+
+        self.assertLessEqual(output.getbuffer().nbytes, 10 * 1024)
+        self.assertGreater(quality, 30)
+        self.assertGreater(encode_to_target_size(image, 10 ** 9)[1], quality)
+
+    def test_encode_to_target_size_picks_highest_fitting_quality(self):
+        image = noisy_image((200, 200))
+        output, quality = encode_to_target_size(image, 5 * 1024, max_passes=10)
+
+        above = BytesIO()
+        image.save(above, format='webp', quality=quality + 1)
+
+        self.assertGreater(above.getbuffer().nbytes, 5 * 1024)
+
+    def test_encode_to_target_size_bounds_encode_passes(self):
+        image = noisy_image((200, 200))
+
+        with mock.patch.object(process_image, '_encode', wraps=process_image._encode) as encode:
+            encode_to_target_size(image, 5 * 1024, max_passes=4)
+
+        self.assertLessEqual(encode.call_count, 4)
+
+    def test_encode_to_target_size_unreachable_budget(self):
+        image = noisy_image((200, 200))
+
+        output, quality = encode_to_target_size(image, 100)
+
+        self.assertEqual(quality, 30)
+        self.assertGreater(output.getbuffer().nbytes, 100)
+
+    def test_process_profile_picture(self):
+        pictures, manifest = process_profile_picture(uploaded(noisy_image((1024, 768))))
+
+        self.assertLessEqual(pictures['full'].size, process_image.PROFILE_PICTURE_TARGET_SIZE)
+        with Image.open(pictures['full']) as processed:
+            self.assertEqual(processed.format, 'WEBP')
+            self.assertEqual(processed.size, (512, 384))
+        self.assertEqual((manifest['small']['width'], manifest['small']['height']), (128, 96))
+
+
+# ----------------------------------------------------------------
+# Image variants from a single decode
+# ----------------------------------------------------------------
+class TestImageVariants(SimpleTestCase):
+    def test_derive_image_variants(self):
+        image = uploaded(noisy_image((1300, 1800)), 'JPEG', 'image/jpeg', 'thumbnail.jpg')
+
+        thumbnails, manifest = derive_image_variants(image, TEMPLATE_THUMBNAIL_VARIANTS)
+
+        for name, variant in TEMPLATE_THUMBNAIL_VARIANTS.items():
+            with Image.open(thumbnails[name]) as derived:
+                self.assertEqual(derived.format, 'WEBP')
+                self.assertLessEqual(derived.width, variant['size'][0])
+                self.assertLessEqual(derived.height, variant['size'][1])
+                self.assertEqual(derived.size, (manifest[name]['width'], manifest[name]['height']))
+            self.assertLessEqual(thumbnails[name].size, variant['target_size'])
+            self.assertEqual(manifest[name]['bytes'], thumbnails[name].size)
+        self.assertEqual(thumbnails['small'].name, 'thumbnail-small.webp')
+
+    def test_image_is_decoded_once(self):
+        image = uploaded(noisy_image((400, 600)))
+
+        with mock.patch.object(process_image, '_open_rgb', wraps=process_image._open_rgb) as open_rgb:
+            derive_image_variants(image, TEMPLATE_THUMBNAIL_VARIANTS)
+
+        open_rgb.assert_called_once_with(image, process_image.TEMPLATE_THUMBNAIL_SIZE)
+
+    def test_jpeg_is_scaled_down_while_decoding(self):
+        image = uploaded(noisy_image((3000, 3000)), 'JPEG', 'image/jpeg', 'photo.jpg')
+        draft = JpegImagePlugin.JpegImageFile.draft
+
+        with mock.patch.object(JpegImagePlugin.JpegImageFile, 'draft', autospec=True, side_effect=draft) as drafted:
+            _, manifest = derive_image_variants(image, {'small': {'size': (300, 300), 'target_size': 20 * 1024}})
+
+        drafted.assert_called_once_with(mock.ANY, 'RGB', (300, 300))
+        self.assertEqual((manifest['small']['width'], manifest['small']['height']), (300, 300))
+
+    def test_small_image_is_not_enlarged(self):
+        _, manifest = derive_image_variants(uploaded(noisy_image((200, 280))), TEMPLATE_THUMBNAIL_VARIANTS)
+
+        self.assertEqual((manifest['full']['width'], manifest['full']['height']), (200, 280))
+
+    def test_image_srcset(self):
+        files = {
+            'full': mock.Mock(url='/media/full.webp'),
+            'small': mock.Mock(url='/media/small.webp'),
+            'retina': mock.Mock(url='/media/retina.webp'),
+        }
+        manifest = {'full': {'width': 1240}, 'small': {'width': 310}, 'retina': {'width': 620}}
+
+        self.assertEqual(image_srcset(files, manifest), {
+            'src': '/media/full.webp',
+            'srcset': '/media/small.webp 310w, /media/retina.webp 620w, /media/full.webp 1240w',
+        })
+        self.assertIsNone(image_srcset(files, {}))
+
+
+# ----------------------------------------------------------------
+# Upload validation from the image header
+# ----------------------------------------------------------------
+class TestValidateImageUpload(SimpleTestCase):
+    def test_valid_image(self):
+        image = uploaded(noisy_image((300, 200)), 'JPEG', 'image/jpeg', 'photo.jpg')
+
+        self.assertEqual(validate_image_upload(image), ('JPEG', 300, 200))
+        self.assertEqual(image.tell(), 0)
+
+    def test_too_many_pixels(self):
+        with self.assertRaises(ValidationError):
+            validate_image_upload(uploaded(noisy_image((300, 200))), max_pixels=300 * 199)
+
+    def test_decompression_bomb_is_not_decoded(self):
+        bomb = png_claiming_size(100000, 100000)
+
+        with mock.patch.object(Image.Image, 'load') as load:
+            with self.assertRaises(ValidationError):
+                validate_image_upload(bomb)
+
+        load.assert_not_called()
+
+    def test_too_large_file(self):
+        with self.assertRaises(ValidationError):
+            validate_image_upload(uploaded(noisy_image((300, 200))), max_size=1024)
+
+    def test_not_an_image(self):
+        with self.assertRaises(ValidationError):
+            validate_image_upload(SimpleUploadedFile('cv.pdf', b'%PDF-1.4 not an image'))
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValidationError):
+            validate_image_upload(uploaded(noisy_image((30, 20)), 'GIF', 'image/gif', 'animation.gif'))
+
+    def test_missing_upload(self):
+        with self.assertRaises(ValidationError):
+            validate_image_upload(None)
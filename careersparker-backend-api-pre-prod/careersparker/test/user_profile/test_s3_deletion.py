@@ -0,0 +1,113 @@
+import datetime
+from unittest import mock
+
+from botocore.exceptions import EndpointConnectionError
+from django.core.management import call_command
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import TestCase
+from django.utils import timezone
+
+from user.models import S3DeletionRetry
+from util.Storage import s3_deletion
+from util.Storage.s3_deletion import (S3DeletionBatchMiddleware, cancel_s3_deletion, delete_s3_keys,
+                                      s3_deletion_batch, schedule_s3_deletion)
+
+
+# ----------------------------------------------------------------
+# Batched s3 deletion
+# ----------------------------------------------------------------
+class TestS3Deletion(TestCase):
+    def setUp(self):
+        s3_client = mock.patch.object(s3_deletion, 's3_client')
+        self.s3_client = s3_client.start().return_value
+        self.addCleanup(s3_client.stop)
+        self.s3_client.delete_objects.return_value = {}
+
+    def deleted_keys(self):
+        return [[item['Key'] for item in call.kwargs['Delete']['Objects']]
+                for call in self.s3_client.delete_objects.call_args_list]
+
+    def test_files_are_deleted_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            schedule_s3_deletion('cv/thumbnail.webp', '', 'cv/small.webp')
+            self.s3_client.delete_objects.assert_not_called()
+
+        self.assertEqual(self.deleted_keys(), [['static/cv/thumbnail.webp', 'static/cv/small.webp']])
+
+    def test_nothing_is_deleted_on_rollback(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    schedule_s3_deletion('cv/thumbnail.webp')
+                    raise ValueError()
+            except ValueError:
+                pass
+
+        self.s3_client.delete_objects.assert_not_called()
+
+    def test_batch_gathers_committed_transactions(self):
+        with s3_deletion_batch():
+            for name in ('a.webp', 'b.webp'):
+                with self.captureOnCommitCallbacks(execute=True):
+                    schedule_s3_deletion(name)
+            self.s3_client.delete_objects.assert_not_called()
+
+        self.assertEqual(self.deleted_keys(), [['static/a.webp', 'static/b.webp']])
+
+    def test_cancelled_deletion_is_kept(self):
+        with s3_deletion_batch():
+            with self.captureOnCommitCallbacks(execute=True):
+                schedule_s3_deletion('a.webp', 'b.webp')
+            cancel_s3_deletion('a.webp')
+
+        self.assertEqual(self.deleted_keys(), [['static/b.webp']])
+
+    def test_middleware_deletes_once_per_request(self):
+        def view(request):
+            for name in ('a.webp', 'b.webp'):
+                with self.captureOnCommitCallbacks(execute=True):
+                    schedule_s3_deletion(name)
+            return HttpResponse()
+
+        S3DeletionBatchMiddleware(view)(mock.Mock())
+
+        self.assertEqual(self.s3_client.delete_objects.call_count, 1)
+
+    def test_keys_are_deleted_in_batches_of_1000(self):
+        delete_s3_keys([f'static/{number}.webp' for number in range(2500)])
+
+        self.assertEqual([len(keys) for keys in self.deleted_keys()], [1000, 1000, 500])
+
+    def test_failed_keys_are_retried(self):
+        self.s3_client.delete_objects.return_value = {
+            'Errors': [{'Key': 'static/b.webp', 'Code': 'AccessDenied', 'Message': 'Access Denied'}],
+        }
+
+        self.assertEqual(delete_s3_keys(['static/a.webp', 'static/b.webp']), ['static/b.webp'])
+
+        retry = S3DeletionRetry.objects.get()
+        self.assertEqual((retry.key, retry.error, retry.attempts), ('static/b.webp', 'Access Denied', 1))
+
+    def test_unreachable_bucket(self):
+        self.s3_client.delete_objects.side_effect = EndpointConnectionError(endpoint_url='https://s3')
+
+        delete_s3_keys(['static/a.webp', 'static/b.webp'])
+
+        self.assertEqual(S3DeletionRetry.objects.count(), 2)
+
+    def test_retry_command(self):
+        past = timezone.now() - datetime.timedelta(minutes=1)
+        S3DeletionRetry.objects.create(key='static/a.webp', run_after=past)
+        S3DeletionRetry.objects.create(key='static/b.webp', run_after=past)
+        S3DeletionRetry.objects.create(key='static/later.webp', run_after=timezone.now() + datetime.timedelta(hours=1))
+        self.s3_client.delete_objects.return_value = {'Errors': [{'Key': 'static/b.webp', 'Code': 'InternalError'}]}
+
+        call_command('retry_s3_deletions', stdout=mock.Mock())
+
+        self.assertEqual(self.deleted_keys(), [['static/a.webp', 'static/b.webp']])
+        retry = S3DeletionRetry.objects.get(key='static/b.webp')
+        self.assertEqual(retry.attempts, 2)
+        self.assertGreater(retry.run_after, timezone.now() + datetime.timedelta(seconds=60))
+        self.assertEqual(set(S3DeletionRetry.objects.values_list('key', flat=True)),
+                         {'static/b.webp', 'static/later.webp'})
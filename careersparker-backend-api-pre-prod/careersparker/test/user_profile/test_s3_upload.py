@@ -0,0 +1,99 @@
+import base64
+import hashlib
+import io
+from unittest import mock
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+from botocore.stub import ANY, Stubber
+from django.test import SimpleTestCase
+
+from util.Storage import s3_function
+from util.Storage.s3_function import save_to_s3, upload_to_s3
+
+PART_SIZE = 5 * 1024 * 1024
+
+
+def sha256(data):
+    return base64.b64encode(hashlib.sha256(data).digest()).decode()
+
+
+# ----------------------------------------------------------------
+# Streaming uploads to s3
+# ----------------------------------------------------------------
+class TestS3Upload(SimpleTestCase):
+    def setUp(self):
+        client = boto3.session.Session().client(
+            's3', region_name='eu-west-2', aws_access_key_id='key', aws_secret_access_key='secret',
+        )
+        self.stubber = Stubber(client)
+        self.stubber.activate()
+        self.addCleanup(self.stubber.deactivate)
+
+        for name, value in (('s3_client', lambda: client), ('bucket_name', 'bucket')):
+            patch = mock.patch.object(s3_function, name, value)
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        # parts are sent one at a time so they reach the stubber in order
+        config = TransferConfig(multipart_threshold=PART_SIZE, multipart_chunksize=PART_SIZE, max_concurrency=1)
+        patch = mock.patch.object(s3_function.settings, 'AWS_S3_TRANSFER_CONFIG', config)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_small_file_is_put_in_one_request(self):
+        data = b'document' * 100
+        self.stubber.add_response('put_object', {}, {
+            'Bucket': 'bucket', 'Key': 'static/exports/cv.pdf', 'Body': ANY,
+            'ChecksumAlgorithm': 'SHA256', 'ContentType': 'application/pdf',
+        })
+
+        uploaded = upload_to_s3(io.BytesIO(data), 'static/exports/cv.pdf', 'application/pdf')
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(uploaded, {'key': 'static/exports/cv.pdf', 'size': len(data), 'sha256': sha256(data)})
+
+    def test_large_file_is_uploaded_in_parts(self):
+        data = bytes(range(256)) * (PART_SIZE * 2 // 256) + b'end'
+        key = 'static/exports/archive.zip'
+        self.stubber.add_response('create_multipart_upload', {'UploadId': 'upload'},
+                                  {'Bucket': 'bucket', 'Key': key, 'ChecksumAlgorithm': 'SHA256'})
+        for number, part in enumerate((data[:PART_SIZE], data[PART_SIZE:2 * PART_SIZE], b'end'), start=1):
+            self.stubber.add_response('upload_part', {'ETag': f'"{number}"', 'ChecksumSHA256': sha256(part)}, {
+                'Bucket': 'bucket', 'Key': key, 'UploadId': 'upload', 'PartNumber': number,
+                'Body': ANY, 'ChecksumAlgorithm': 'SHA256',
+            })
+        self.stubber.add_response('complete_multipart_upload', {}, {
+            'Bucket': 'bucket', 'Key': key, 'UploadId': 'upload',
+            'MultipartUpload': {'Parts': [
+                {'ETag': '"1"', 'PartNumber': 1, 'ChecksumSHA256': sha256(data[:PART_SIZE])},
+                {'ETag': '"2"', 'PartNumber': 2, 'ChecksumSHA256': sha256(data[PART_SIZE:2 * PART_SIZE])},
+                {'ETag': '"3"', 'PartNumber': 3, 'ChecksumSHA256': sha256(b'end')},
+            ]},
+        })
+
+        uploaded = upload_to_s3(io.BytesIO(data), key)
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual((uploaded['size'], uploaded['sha256']), (len(data), sha256(data)))
+
+    def test_failed_multipart_upload_is_aborted(self):
+        key = 'static/exports/archive.zip'
+        self.stubber.add_response('create_multipart_upload', {'UploadId': 'upload'})
+        self.stubber.add_client_error('upload_part', 'AccessDenied', http_status_code=403)
+        self.stubber.add_response('abort_multipart_upload', {},
+                                  {'Bucket': 'bucket', 'Key': key, 'UploadId': 'upload'})
+
+        with self.assertRaises(ClientError):
+            upload_to_s3(io.BytesIO(b'\0' * (PART_SIZE + 1)), key)
+
+        self.stubber.assert_no_pending_responses()
+
+    def test_save_to_s3(self):
+        self.stubber.add_response('put_object', {}, {
+            'Bucket': 'bucket', 'Key': 'static/public/test_s3_upload.py', 'Body': ANY, 'ChecksumAlgorithm': 'SHA256',
+        })
+
+        self.assertIs(save_to_s3(__file__, 'public'), True)
+        self.assertEqual(save_to_s3('/missing/file.pdf', 'public').status_code, 404)
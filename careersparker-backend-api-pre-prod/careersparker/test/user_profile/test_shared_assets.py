@@ -0,0 +1,146 @@
+from io import BytesIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
+from django.test import TestCase
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from django.urls import reverse
+from PIL import Image
+
+from user.models import Profile, ProfilePicture, SharedAsset
+from util.Storage import s3_deletion
+from util.Storage.shared_assets import acquire_shared_asset, release_shared_asset, release_stored_file
+
+
+def uploaded_picture():
+    output = BytesIO()
+    Image.linear_gradient('L').resize((600, 400)).convert('RGB').save(output, format='PNG')
+    return SimpleUploadedFile('picture.png', output.getvalue(), content_type='image/png')
+
+
+# ----------------------------------------------------------------
+# Shared assets
+# ----------------------------------------------------------------
+class TestSharedAssets(TestCase):
+    def setUp(self):
+        s3_client = mock.patch.object(s3_deletion, 's3_client')
+        self.s3_client = s3_client.start().return_value
+        self.addCleanup(s3_client.stop)
+        self.s3_client.delete_objects.return_value = {}
+
+    def deleted_keys(self):
+        return [item['Key'] for call in self.s3_client.delete_objects.call_args_list
+                for item in call.kwargs['Delete']['Objects']]
+
+    def create_user(self, username):
+        return get_user_model().objects.create_user(
+            email=f'{username}@example.com',
+            password='Password123!',
+            first_name='John',
+            last_name='Doe',
+            username=username,
+            is_active=True,
+            is_verified=True,
+        )
+
+    def test_identical_content_is_stored_once(self):
+        first = acquire_shared_asset(b'content', 'file.png')
+        second = acquire_shared_asset(b'content', 'other.png')
+
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(first.file.name, second.file.name)
+        self.assertTrue(first.file.name.endswith('.png'))
+        self.assertEqual(SharedAsset.objects.get(pk=first.pk).ref_count, 2)
+
+    def test_asset_is_deleted_with_its_last_reference(self):
+        asset = acquire_shared_asset(b'content', 'file.png')
+        acquire_shared_asset(b'content', 'file.png')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(release_shared_asset(asset.file.name))
+        self.assertEqual(self.deleted_keys(), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(release_shared_asset(asset.file.name))
+        self.assertFalse(SharedAsset.objects.filter(pk=asset.pk).exists())
+        self.assertEqual(self.deleted_keys(), [f'static/{asset.file.name}'])
+
+    def test_released_asset_acquired_again_before_the_commit(self):
+        asset = acquire_shared_asset(b'content', 'file.png')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            release_shared_asset(asset.file.name)
+            acquire_shared_asset(b'content', 'file.png')
+
+        self.assertEqual(SharedAsset.objects.get(pk=asset.pk).ref_count, 1)
+        self.assertEqual(self.deleted_keys(), [])
+
+    def test_rolled_back_release_keeps_the_file(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    release_stored_file(ProfilePicture(profile_picture='user-media/picture.webp').profile_picture)
+                    raise ValueError()
+            except ValueError:
+                pass
+
+        self.s3_client.delete_objects.assert_not_called()
+
+    def test_release_of_a_file_that_is_not_shared(self):
+        self.assertFalse(release_shared_asset('user-media/user-profile/johndoe/profile-picture/picture.webp'))
+
+    def test_signups_share_the_default_picture(self):
+        first = self.create_user('johndoe')
+        second = self.create_user('janedoe')
+
+        pictures = ProfilePicture.objects.filter(user__in=[first, second])
+        self.assertEqual(len({picture.profile_picture.name for picture in pictures}), 1)
+        asset = SharedAsset.objects.get(file=pictures[0].profile_picture.name)
+        self.assertEqual(asset.ref_count, 2)
+
+    def upload_picture(self, user):
+        profile = Profile.objects.get(user=user)
+        token = self.client.post(reverse('user:token_obtain_pair'),
+                                 {'email': user.email, 'password': 'Password123!'}).data['access']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.patch(reverse('user_profile:profile_picture', args=[profile.pk]),
+                                     encode_multipart(BOUNDARY, {'profile_picture': uploaded_picture()}),
+                                     content_type=MULTIPART_CONTENT, HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_replaced_default_picture_keeps_the_shared_file(self):
+        self.create_user('janedoe')
+        user = self.create_user('johndoe')
+        default = ProfilePicture.objects.get(user=user).profile_picture
+
+        response = self.upload_picture(user)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(SharedAsset.objects.get(file=default.name).ref_count, 1)
+        self.assertTrue(default.storage.exists(default.name))
+        picture = ProfilePicture.objects.get(user=user)
+        self.assertEqual(SharedAsset.objects.get(file=picture.profile_picture.name).ref_count, 1)
+
+    def test_same_picture_uploaded_again_by_its_only_holder(self):
+        user = self.create_user('johndoe')
+        self.assertEqual(self.upload_picture(user).status_code, 200)
+        first = ProfilePicture.objects.get(user=user).profile_picture.name
+
+        self.assertEqual(self.upload_picture(user).status_code, 200)
+
+        picture = ProfilePicture.objects.get(user=user).profile_picture
+        self.assertEqual(picture.name, first)
+        self.assertEqual(SharedAsset.objects.get(file=picture.name).ref_count, 1)
+        self.assertTrue(picture.storage.exists(picture.name))
+
+    def test_deleted_user_releases_its_pictures(self):
+        self.create_user('janedoe')
+        user = self.create_user('johndoe')
+        default = ProfilePicture.objects.get(user=user).profile_picture.name
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user.delete()
+
+        self.assertEqual(SharedAsset.objects.get(file=default).ref_count, 1)
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from util.Storage.s3_deletion import DELETE_OBJECTS_BATCH_SIZE, retry_s3_deletions
+
+
+class Command(BaseCommand):
+    """
+    Delete the s3 keys whose deletion failed after a commit again, meant to run from cron.
+    """
+
+    help = 'Retry the failed deletions of files from the s3 bucket'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=10 * DELETE_OBJECTS_BATCH_SIZE,
+                            help='Most keys retried in one run')
+
+    def handle(self, *args, **options):
+        deleted = failed = 0
+        while deleted + failed < options['limit']:
+            batch_deleted, batch_failed = retry_s3_deletions(
+                min(DELETE_OBJECTS_BATCH_SIZE, options['limit'] - deleted - failed)
+            )
+            if not batch_deleted and not batch_failed:
+                break
+            deleted += batch_deleted
+            failed += batch_failed
+
+        self.stdout.write(f'{deleted} keys deleted, {failed} failed again')
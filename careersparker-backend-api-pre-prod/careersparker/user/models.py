@@ -5,7 +5,7 @@ from django.db import models
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from careersparker import settings
-from util.Storage.media_storage_path import get_upload_path_profile_picture
+from util.Storage.media_storage_path import get_upload_path_profile_picture, get_upload_shared_asset_path
 from util.user.user_validator import validate_username, validate_password_complexity, validate_required_fields
 
 
@@ -215,6 +215,56 @@ class Profile(models.Model):
     linkedin = models.URLField(max_length=255, blank=True)
 
 
+# ------------------------------------------------------------------------------
+# Shared Asset Model
+# ------------------------------------------------------------------------------
+class SharedAsset(models.Model):
+    """
+    A stored file referenced by every row with the same content, stored once under the
+    sha256 of its content. ref_count is the number of rows referencing it, the file is
+    deleted with the last reference.
+    """
+
+    id = models.AutoField(primary_key=True)
+    content_hash = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to=get_upload_shared_asset_path, max_length=255, unique=True)
+    size = models.PositiveIntegerField(default=0)
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.file.name
+
+    class Meta:
+        verbose_name = 'Shared Asset'
+        verbose_name_plural = 'Shared Assets'
+
+
+# ------------------------------------------------------------------------------
+# S3 Deletion Retry Model
+# ------------------------------------------------------------------------------
+class S3DeletionRetry(models.Model):
+    """
+    A bucket key whose deletion failed, deleted again by the retry_s3_deletions command.
+    """
+
+    id = models.AutoField(primary_key=True)
+    key = models.CharField(max_length=1024, unique=True)
+    attempts = models.PositiveIntegerField(default=1)
+    error = models.TextField(blank=True)
+    run_after = models.DateTimeField(db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.key
+
+    class Meta:
+        verbose_name = 'S3 Deletion Retry'
+        verbose_name_plural = 'S3 Deletion Retries'
+
+
 # ------------------------------------------------------------------------------
 # User Profile Picture Model
 # ------------------------------------------------------------------------------
@@ -225,6 +275,8 @@ class ProfilePicture(models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='profile_images')
     user_profile = models.OneToOneField(Profile, on_delete=models.CASCADE, related_name='profile_images')
     profile_picture = models.ImageField(upload_to=get_upload_path_profile_picture, default='default.png')
+    profile_picture_small = models.ImageField(upload_to=get_upload_path_profile_picture, blank=True)
+    profile_picture_variants = models.JSONField(default=dict, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True, null=True)
 
@@ -3,10 +3,19 @@ from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 from user.models import Profile, ProfilePicture
+from util.Storage.process_image import image_srcset
 
 
 class ProfilePictureSerializer(serializers.ModelSerializer):
     """Serializer for the profile picture model"""
+    profile_picture_srcset = serializers.SerializerMethodField()
+
+    @extend_schema_field(serializers.DictField(child=serializers.CharField(), allow_null=True))
+    def get_profile_picture_srcset(self, profile_picture):
+        return image_srcset({
+            'full': profile_picture.profile_picture,
+            'small': profile_picture.profile_picture_small,
+        }, profile_picture.profile_picture_variants)
 
     class Meta:
         model = ProfilePicture
@@ -54,3 +63,11 @@ class UserProfileSerializer(serializers.ModelSerializer):
 
         )
         extra_kwargs = {'id': {'read_only': True}}
+
+
+class PresignedUploadSerializer(serializers.Serializer):
+    """Serializer for an upload presigned straight to the s3 bucket"""
+    url = serializers.URLField()
+    fields = serializers.DictField(child=serializers.CharField())
+    upload_token = serializers.CharField()
+    expires_in = serializers.IntegerField()
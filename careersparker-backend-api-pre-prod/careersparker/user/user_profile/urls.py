@@ -20,5 +20,6 @@ urlpatterns = [
 
     # #profile Images
     path('profile_pictures/<int:pk>', views.ProfilePictureView.as_view(), name='profile_picture'),
+    path('profile_pictures/<int:pk>/upload', views.ProfilePictureUploadView.as_view(), name='profile_picture_upload'),
 
     ]
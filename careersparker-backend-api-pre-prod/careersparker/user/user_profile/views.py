@@ -2,6 +2,7 @@ from django.db import transaction
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema
 from rest_framework import status, mixins, viewsets
+from rest_framework.exceptions import ValidationError
 from rest_framework.parsers import MultiPartParser, JSONParser, FormParser
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
 from rest_framework.response import Response
@@ -11,9 +12,10 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from user.models import Profile, ProfilePicture
 from user.user_profile import serializers
 from user.user_profile.serializers import UserProfileSerializer
-from util.Image_processor.image_file_processor import convert_png_to_jpg
-from util.Storage.process_image import default_profile_picture
-from util.Storage.s3_function import delete_s3_file
+from util.Storage.image_pool import ImagePoolError, image_pool_error_response
+from util.Storage.direct_upload import create_presigned_upload, derive_uploaded_image_variants
+from util.Storage.process_image import PROFILE_PICTURE_VARIANTS, default_profile_picture
+from util.Storage.shared_assets import acquire_shared_asset, release_stored_file
 
 
 @extend_schema(tags=['User Profile'])
@@ -252,27 +254,45 @@ class ProfilePictureView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        profile_image = user_profile.profile_images.profile_picture
+        # the picture is sent in the request, or uploaded straight to s3 and confirmed with
+        # the upload_token of ProfilePictureUploadView
+        get_profile_image = request.data.get('profile_picture') or request.data.get('upload_token')
 
-        if profile_image:
-            # delete profile picture from s3 bucket
-            delete_s3_file(str(user_profile.profile_images.profile_picture))
-            profile_image.delete()
+        # decode the picture once and derive every size of it, each within its byte budget,
+        # before the current picture is deleted so a busy image pool leaves it in place
+        if get_profile_image:
+            try:
+                profile_images, manifest = derive_uploaded_image_variants(
+                    user, request.data, 'profile_picture', 'profile_picture', PROFILE_PICTURE_VARIANTS
+                )
+            except ValidationError as e:
+                return Response({'error': e.detail[0]}, status=status.HTTP_400_BAD_REQUEST)
+            except ImagePoolError as e:
+                return image_pool_error_response(e)
 
-        get_profile_image = request.data.get('profile_picture')
+        previous = user_profile.profile_images
 
         # Add default profile picture if no profile picture is uploaded
         if not get_profile_image:
             default_profile_picture(user, user_profile, pk)
-            return Response({'message': 'Profile picture updated successfully'}, status=status.HTTP_200_OK)
-
-        check_png = convert_png_to_jpg(get_profile_image)  # convert image to png
-        process_profile_image = check_png
+        else:
+            # an identical picture uploaded before is referenced instead of stored again
+            stored = {name: acquire_shared_asset(image.file.getvalue(), image.name).file.name
+                      for name, image in profile_images.items()}
+
+            ProfilePicture.objects.filter(user_profile=pk).update_or_create(
+                user_profile=user_profile,
+                defaults={
+                    'profile_picture': stored['full'],
+                    'profile_picture_small': stored['small'],
+                    'profile_picture_variants': manifest,
+                }
+            )
 
-        ProfilePicture.objects.filter(user_profile=pk).update_or_create(
-            user_profile=user_profile,
-            defaults={'profile_picture': process_profile_image}
-        )
+        # release the previous pictures once the new ones are referenced, a picture shared
+        # with other users is only deleted from the s3 bucket by the last user releasing it
+        release_stored_file(previous.profile_picture)
+        release_stored_file(previous.profile_picture_small)
 
         return Response({'message': 'Profile picture updated successfully'}, status=status.HTTP_200_OK)
 
@@ -291,19 +311,43 @@ class ProfilePictureView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        profile_pictures = ProfilePicture.objects.filter(user_profile=pk)
-
         try:
-            # delete profile picture from s3 bucket
-            delete_s3_file(str(user_profile.profile_images.profile_picture))
+            previous = user_profile.profile_images
 
-            # delete profile picture from database
-            profile_pictures.delete()
-
-            # set default profile picture
+            # set default profile picture in place of the deleted one
             default_profile_picture(user, user_profile, pk)
 
+            # release the pictures, deleted from the s3 bucket once no other user shares them
+            release_stored_file(previous.profile_picture)
+            release_stored_file(previous.profile_picture_small)
+
             return Response({'message': 'Profile picture deleted successfully'}, status=status.HTTP_200_OK)
 
         except Exception as e:
             return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+@extend_schema(tags=['User Profile'])
+class ProfilePictureUploadView(APIView):
+    """
+    Presign an upload of a profile picture straight to the s3 bucket.
+
+    The picture is then set by sending the upload_token to ProfilePictureView.patch.
+    """
+
+    permission_classes = (IsAuthenticated,)
+    authentication_classes = [JWTAuthentication, ]
+    serializer_class = serializers.PresignedUploadSerializer
+
+    @extend_schema(operation_id='presign_profile_picture_upload', request=None)
+    def post(self, request, pk):
+        user_profile = get_object_or_404(Profile, pk=pk)
+
+        # prevent unauthorized user from uploading the profile picture of another user
+        if user_profile.user != request.user:
+            return Response(
+                {"error": "You are not authorized to update this profile picture."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        return Response(create_presigned_upload(request.user, 'profile_picture'), status=status.HTTP_200_OK)
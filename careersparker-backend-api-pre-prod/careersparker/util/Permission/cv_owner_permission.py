@@ -0,0 +1,70 @@
+from django.http import Http404
+from rest_framework import permissions
+from rest_framework.exceptions import PermissionDenied
+
+from cvbuilder.models import CvBuilder
+
+CV_OWNER_ERROR_MESSAGE = 'You are not authorized to perform this action'
+
+
+class CvOwnerMixin:
+    """
+    Load the cv, or the cv section entry, the url points at for the user making the request.
+
+    owner_model is the model of the url pk: CvBuilder for cv and *ByCvId views, the section
+    model for *ById views. The object is loaded with a single query filtered on the
+    requesting user and kept on the view, which lives for one request.
+
+    Methods:
+        get_owned_object(self): The object of the url pk, owned by the requesting user.
+        get_owned_cv(self): The cv of that object.
+    """
+
+    owner_model = CvBuilder
+
+    def get_owner_queryset(self):
+        user = self.request.user
+        if self.owner_model is CvBuilder:
+            return CvBuilder.objects.filter(user=user)
+        return self.owner_model.objects.select_related('cv').filter(cv__user=user)
+
+    def get_owned_object(self):
+        """
+        Return the object of the url pk if the requesting user owns it.
+
+        Raises Http404 if it does not exist and PermissionDenied if it belongs to another
+        user. The extra query telling both apart only runs on a denied request.
+        """
+        if not hasattr(self, '_owned_object'):
+            pk = self.kwargs.get('pk')
+            owned_object = self.get_owner_queryset().filter(pk=pk).first()
+
+            if owned_object is None:
+                if self.owner_model.objects.filter(pk=pk).exists():
+                    raise PermissionDenied(CV_OWNER_ERROR_MESSAGE)
+                raise Http404
+
+            self._owned_object = owned_object
+        return self._owned_object
+
+    def get_owned_cv(self):
+        owned_object = self.get_owned_object()
+        return owned_object if isinstance(owned_object, CvBuilder) else owned_object.cv
+
+
+class IsCvOwner(permissions.BasePermission):
+    """
+    Allow write requests only to the owner of the cv the url points at.
+
+    Used on views with CvOwnerMixin, after IsAuthenticated. Read requests are let through;
+    views reading private data call get_owned_cv() themselves.
+    """
+
+    message = CV_OWNER_ERROR_MESSAGE
+
+    def has_permission(self, request, view):
+        if request.method in permissions.SAFE_METHODS:
+            return True
+
+        view.get_owned_object()  # raises when the user is not the owner
+        return True
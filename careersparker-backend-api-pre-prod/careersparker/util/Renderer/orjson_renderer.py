@@ -0,0 +1,89 @@
+import datetime
+import decimal
+
+import orjson
+from django.conf import settings
+from django.db.models.fields.files import FieldFile
+from django.db.models.query import QuerySet
+from django.utils.functional import Promise
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+# dates and datetimes are encoded natively by orjson, "+00:00" is written as "Z" like DRF does
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def orjson_default(obj):
+    """
+    Encode the values orjson does not handle natively, the same way DRF's JSONEncoder does.
+    """
+    if isinstance(obj, Promise):
+        return str(obj)
+    elif isinstance(obj, decimal.Decimal):
+        # serializers emit strings unless COERCE_DECIMAL_TO_STRING is disabled
+        return float(obj)
+    elif isinstance(obj, FieldFile):
+        # image and file fields read straight from a model or values() queryset
+        return obj.url if obj else None
+    elif isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    elif isinstance(obj, QuerySet):
+        return tuple(obj)
+    elif isinstance(obj, bytes):
+        return obj.decode()
+    elif hasattr(obj, '__getitem__'):
+        cls = list if isinstance(obj, (list, tuple)) else dict
+        try:
+            return cls(obj)
+        except Exception:
+            pass
+    elif hasattr(obj, '__iter__'):
+        return tuple(item for item in obj)
+    raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
+
+
+# -------------------------------------------------------------------
+# Renderer
+# -------------------------------------------------------------------
+class OrjsonRenderer(JSONRenderer):
+    """
+    Drop-in replacement of DRF's JSONRenderer using orjson.
+
+    The output is always compact UTF-8, unless the client asks for an indent in the
+    Accept header (e.g. application/json; indent=2), which is rendered with 2 spaces.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        options = ORJSON_OPTIONS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=orjson_default, option=options)
+
+
+# -------------------------------------------------------------------
+# Parser
+# -------------------------------------------------------------------
+class OrjsonParser(JSONParser):
+    """
+    Drop-in replacement of DRF's JSONParser using orjson.
+    """
+
+    renderer_class = OrjsonRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        data = stream.read()
+        if encoding.lower().replace('-', '') != 'utf8':
+            data = data.decode(encoding)
+
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
@@ -0,0 +1,137 @@
+import os
+import threading
+import time
+
+import boto3
+from botocore.config import Config
+
+from careersparker import settings
+
+# region of the client of each service, the default region of boto3 for the others
+AWS_CLIENT_REGIONS = {
+    's3': settings.AWS_S3_REGION_NAME,
+    'ses': settings.AWS_SES_REGION_NAME,
+}
+
+
+class ClientMetrics:
+    """
+    Thread safe latency of the calls made by an aws client, per operation.
+
+    A call is timed from before it is sent to after its response is parsed, retries
+    included, so the latency is the one seen by the code calling the client.
+    """
+
+    def __init__(self):
+        self._operations = {}
+        self._lock = threading.Lock()
+
+    def record(self, operation, seconds, error=False):
+        with self._lock:
+            metrics = self._operations.setdefault(operation, {'calls': 0, 'errors': 0, 'total': 0.0, 'max': 0.0})
+            metrics['calls'] += 1
+            metrics['errors'] += error
+            metrics['total'] += seconds
+            metrics['max'] = max(metrics['max'], seconds)
+
+    def snapshot(self):
+        """
+        Return {operation: {'calls', 'errors', 'avg_ms', 'max_ms'}}.
+        """
+        with self._lock:
+            return {
+                operation: {
+                    'calls': metrics['calls'],
+                    'errors': metrics['errors'],
+                    'avg_ms': round(metrics['total'] / metrics['calls'] * 1000, 1),
+                    'max_ms': round(metrics['max'] * 1000, 1),
+                }
+                for operation, metrics in self._operations.items()
+            }
+
+
+# -----------------------------------------------
+# Lazily created, shared aws clients
+# -----------------------------------------------
+class AwsClientRegistry:
+    """
+    One aws client per service and per process, created on first use.
+
+    boto3 clients are thread safe and keep a pool of connections, sharing one reuses the
+    resolved endpoint, the credentials and the open connections, instead of resolving them
+    again for every call. A forked process gets clients of its own, connections are not
+    shared across a fork.
+    """
+
+    def __init__(self):
+        self._clients = {}
+        self._metrics = {}
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def _config(self):
+        return Config(
+            max_pool_connections=settings.AWS_CLIENT_MAX_POOL_CONNECTIONS,
+            connect_timeout=settings.AWS_CLIENT_CONNECT_TIMEOUT,
+            read_timeout=settings.AWS_CLIENT_READ_TIMEOUT,
+            retries={'total_max_attempts': settings.AWS_CLIENT_MAX_ATTEMPTS, 'mode': 'standard'},
+        )
+
+    def _create(self, service):
+        # sessions are not thread safe, each client is created from a session of its own
+        client = boto3.session.Session().client(
+            service,
+            region_name=AWS_CLIENT_REGIONS.get(service),
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            config=self._config(),
+        )
+        metrics = self._metrics.setdefault(service, ClientMetrics())
+
+        def before_call(model, context, **kwargs):
+            context['operation_name'] = model.name
+            context['started_at'] = time.monotonic()
+
+        def after_call(http_response, model, context, **kwargs):
+            metrics.record(model.name, time.monotonic() - context['started_at'], http_response.status_code >= 300)
+
+        def after_call_error(context, **kwargs):
+            # the request failed without a response, after its retries
+            metrics.record(context['operation_name'], time.monotonic() - context['started_at'], error=True)
+
+        client.meta.events.register('before-call.*.*', before_call)
+        client.meta.events.register('after-call.*.*', after_call)
+        client.meta.events.register('after-call-error.*.*', after_call_error)
+        return client
+
+    def get(self, service):
+        """
+        Return the client of an aws service ('s3', 'ses'), created on first use.
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                self._clients, self._metrics, self._pid = {}, {}, os.getpid()
+            if service not in self._clients:
+                self._clients[service] = self._create(service)
+            return self._clients[service]
+
+    def metrics(self):
+        """
+        Return the latency of the calls of each client of this process, {service: {operation: ...}}.
+        """
+        with self._lock:
+            return {service: metrics.snapshot() for service, metrics in self._metrics.items()}
+
+    def clear(self):
+        with self._lock:
+            self._clients, self._metrics = {}, {}
+
+
+aws_clients = AwsClientRegistry()
+
+
+def get_aws_client(service):
+    """
+    Return the shared client of an aws service for this process.
+    """
+    return aws_clients.get(service)
@@ -0,0 +1,149 @@
+import uuid
+
+from botocore.exceptions import ClientError
+from django.core import signing
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from careersparker import settings
+from util.Storage.process_image import (_derive_image_variants_task, derive_image_variants_pooled,
+                                        run_image_variants_task, validate_image_upload)
+from util.Storage.s3_function import bucket_name, s3_client
+
+UPLOAD_TOKEN_SALT = 'util.Storage.direct_upload'
+
+# first bytes of a staged upload read to check its header, enough for the exif of a photo
+STAGED_HEADER_BYTES = 256 * 1024
+
+
+# -----------------------------------------------
+# Presigned uploads straight to the s3 bucket
+# -----------------------------------------------
+def create_presigned_upload(user, purpose):
+    """
+    Presign a POST uploading an image straight to a staging key of the s3 bucket.
+
+    The client posts its file with the returned fields, and a Content-Type field starting
+    with image/, to url. It then sends upload_token to the endpoint of purpose in place
+    of the file. Staged uploads never confirmed are left to the lifecycle rule of the
+    staging prefix.
+
+    Returns:
+        {'url', 'fields', 'upload_token', 'expires_in'}
+    """
+    key = '{0}/staging-uploads/{1}/{2}/{3}'.format(settings.AWS_LOCATION, purpose, user.id, uuid.uuid4().hex)
+    presigned = s3_client().generate_presigned_post(
+        Bucket=bucket_name,
+        Key=key,
+        Conditions=[
+            ['content-length-range', 1, settings.MAX_IMAGE_UPLOAD_SIZE],
+            ['starts-with', '$Content-Type', 'image/'],
+        ],
+        ExpiresIn=settings.DIRECT_UPLOAD_EXPIRES,
+    )
+    upload_token = signing.dumps({'key': key, 'user': user.id, 'purpose': purpose}, salt=UPLOAD_TOKEN_SALT)
+
+    return {
+        'url': presigned['url'],
+        'fields': presigned['fields'],
+        'upload_token': upload_token,
+        'expires_in': settings.DIRECT_UPLOAD_EXPIRES,
+    }
+
+
+def _staged_key(user, upload_token, purpose):
+    try:
+        staged = signing.loads(upload_token, salt=UPLOAD_TOKEN_SALT, max_age=settings.DIRECT_UPLOAD_EXPIRES * 2)
+    except signing.BadSignature:
+        staged = None
+
+    if not staged or staged['user'] != user.id or staged['purpose'] != purpose:
+        raise ValidationError('The upload is not valid or has expired, please upload the image again')
+    return staged['key']
+
+
+def validate_staged_upload(key):
+    """
+    Check a staged upload from its size and header, reading only its first bytes.
+
+    Returns:
+        The ETag of the checked object.
+
+    Raises:
+        ValidationError: nothing was uploaded, or the upload fails validate_image_upload.
+    """
+    client = s3_client()
+    try:
+        staged = client.get_object(Bucket=bucket_name, Key=key, Range=f'bytes=0-{STAGED_HEADER_BYTES - 1}')
+    except client.exceptions.NoSuchKey:
+        raise ValidationError('No image was uploaded')
+
+    # Content-Range is "bytes 0-262143/<size of the object>"
+    size = int(staged['ContentRange'].rsplit('/', 1)[1]) if 'ContentRange' in staged else staged['ContentLength']
+    if size > settings.MAX_IMAGE_UPLOAD_SIZE:
+        raise ValidationError(f'Image must be smaller than {settings.MAX_IMAGE_UPLOAD_SIZE // (1024 * 1024)}MB')
+
+    validate_image_upload(SimpleUploadedFile(key.rsplit('/', 1)[-1], staged['Body'].read()))
+    return staged['ETag']
+
+
+def _discard_staged_upload(key):
+    s3_client().delete_object(Bucket=bucket_name, Key=key)
+
+
+def _derive_staged_image_variants_task(key, etag, name, variants, image_format):
+    """
+    _derive_image_variants_task of a staged upload, downloaded by the image pool worker.
+
+    The presigned post stays valid after the upload was checked, so only the checked object
+    is downloaded, and its bytes are checked again before they are decoded.
+    """
+    client = s3_client()
+    try:
+        data = client.get_object(Bucket=bucket_name, Key=key, IfMatch=etag)['Body'].read()
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') not in ('PreconditionFailed', 'NoSuchKey'):
+            raise
+        raise ValidationError('The upload changed after it was checked, please upload the image again')
+
+    validate_image_upload(SimpleUploadedFile(name, data))
+    return _derive_image_variants_task(data, name, variants, image_format)
+
+
+# -----------------------------------------------
+# Images uploaded through the api or staged in s3
+# -----------------------------------------------
+def derive_uploaded_image_variants(user, data, field, purpose, variants, image_format='webp'):
+    """
+    Validate and derive the variants of an image sent in field of the request data, or
+    uploaded to a staging key and confirmed with the upload_token of the request data.
+
+    A staged image is validated from its first bytes and downloaded by the image pool
+    worker processing it, it never passes through the request. It is deleted from the
+    staging prefix once the transaction of the request commits.
+
+    Returns:
+        ({name: InMemoryUploadedFile}, manifest) as returned by derive_image_variants.
+
+    Raises:
+        ValidationError: the image or the upload token is not valid.
+        ImagePoolError: the image could not be processed in the image pool.
+    """
+    upload_token = data.get('upload_token')
+    if not upload_token:
+        image = data.get(field)
+        validate_image_upload(image)
+        return derive_image_variants_pooled(image, variants, image_format)
+
+    key = _staged_key(user, upload_token, purpose)
+    try:
+        etag = validate_staged_upload(key)
+        derived = run_image_variants_task(_derive_staged_image_variants_task, key, etag, purpose, variants,
+                                          image_format)
+    except ValidationError:
+        _discard_staged_upload(key)
+        raise
+
+    transaction.on_commit(lambda: _discard_staged_upload(key))
+    return derived
@@ -0,0 +1,143 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+import django
+from rest_framework import status
+from rest_framework.response import Response
+
+from careersparker import settings
+
+
+class ImagePoolError(Exception):
+    """
+    An image task that did not complete in the image pool.
+    """
+
+
+class ImagePoolBusy(ImagePoolError):
+    """
+    Every worker of the image pool is busy and its queue is full.
+    """
+
+
+class ImagePoolTimeout(ImagePoolError):
+    """
+    An image task did not complete within IMAGE_POOL_TIMEOUT.
+    """
+
+
+# -----------------------------------------------
+# Bounded process pool for image work
+# -----------------------------------------------
+class ImagePool:
+    """
+    A process pool running PIL decodes and encodes off the request thread.
+
+    At most size tasks run at once and max_pending more wait for a worker. A task submitted
+    beyond that raises ImagePoolBusy straight away instead of queueing, so a burst of uploads
+    is turned away rather than holding every request thread. A slot is freed once its task
+    has finished, or has timed out: a running task cannot be cancelled, so its workers are
+    terminated and the next task starts a new pool.
+
+    Workers are spawned, not forked from a threaded server process, and set Django up once
+    when they start. The pool is started on first use in each process.
+    """
+
+    def __init__(self, size, max_pending, timeout):
+        self.size = size
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(size + max_pending)
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.size,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=django.setup,
+                )
+                self._pid = os.getpid()
+            return self._executor
+
+    def _reset(self, executor, terminate=False):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        if terminate:
+            for process in list((executor._processes or {}).values()):
+                process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, fn, *args):
+        """
+        Run fn(*args) in a worker process and return its result.
+
+        fn, its arguments and its result are pickled, pass and return bytes rather than
+        uploaded files.
+
+        Raises:
+            ImagePoolBusy: the pool and its queue are full.
+            ImagePoolTimeout: the task did not complete within the timeout.
+            ImagePoolError: the worker process running the task died.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise ImagePoolBusy()
+
+        # the slot is released once, by whichever of the timeout and the task end comes first
+        released = threading.Lock()
+
+        def release_slot(_=None):
+            if released.acquire(blocking=False):
+                self._slots.release()
+
+        executor = self._get_executor()
+        try:
+            future = executor.submit(fn, *args)
+        except BrokenProcessPool:
+            # the pool broke after an earlier task, start a new one for the next request
+            release_slot()
+            self._reset(executor)
+            raise ImagePoolError('The image worker stopped')
+        except BaseException:
+            release_slot()
+            raise
+        future.add_done_callback(release_slot)
+
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            # a hung decode would keep its worker and slot forever, stop the pool it runs in
+            release_slot()
+            self._reset(executor, terminate=True)
+            raise ImagePoolTimeout()
+        except BrokenProcessPool:
+            # a worker was killed, e.g. out of memory on a huge image, start a new pool
+            self._reset(executor)
+            raise ImagePoolError('The image worker stopped')
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+image_pool = ImagePool(settings.IMAGE_POOL_SIZE, settings.IMAGE_POOL_MAX_PENDING, settings.IMAGE_POOL_TIMEOUT)
+
+
+def image_pool_error_response(error):
+    """
+    The response to an upload whose image task failed in the image pool.
+    """
+    if isinstance(error, ImagePoolBusy):
+        return Response({'error': 'Too many images are being processed, please try again shortly'},
+                        status=status.HTTP_429_TOO_MANY_REQUESTS, headers={'Retry-After': '5'})
+
+    return Response({'error': 'The image could not be processed, please try again'},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE)
@@ -7,6 +7,12 @@ def get_upload_path_profile_picture(instance, filename):
                                                        os.path.basename(filename))
 
 
+# ---------Shared Asset Storage Path---------
+def get_upload_shared_asset_path(instance, filename):
+    extension = os.path.splitext(filename)[1].lower()
+    return 'shared-assets/{0}/{1}{2}'.format(instance.content_hash[:2], instance.content_hash, extension)
+
+
 # ---------CV Template List Storage Path---------
 def get_upload_cv_template_list_path(instance, filename):
     return 'cvr-asset/cv-template-list/{0}/{1}'.format('cv-template/', os.path.basename(filename))
@@ -15,3 +21,8 @@ def get_upload_cv_template_list_path(instance, filename):
 # ---------CV Template Storage Path---------
 def get_upload_cv_template_path(instance, filename):
     return 'user-media/user-profile/{0}/{1}'.format('cv-template/', os.path.basename(filename))
+
+
+# ---------Rendered CV Storage Path---------
+def get_upload_rendered_cv_path(instance, filename):
+    return 'user-media/rendered-cv/{0}'.format(os.path.basename(filename))
@@ -1,14 +1,15 @@
-import sys
 from io import BytesIO
 
-from PIL import Image
-from django.core.files import File
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from PIL import ExifTags, Image, ImageOps, UnidentifiedImageError
+from django.core.files.uploadedfile import InMemoryUploadedFile, SimpleUploadedFile
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
 from careersparker import settings
 from user.models import ProfilePicture
+from util.Storage.image_pool import image_pool
+from util.Storage.shared_assets import acquire_default_profile_picture
 
 
 # -----------------------------------------------
@@ -16,94 +17,284 @@ from user.models import ProfilePicture
 # -----------------------------------------------
 def default_profile_picture(user, user_profile, pk):
     """
-    Add default image if no image is uploaded
+    Add default image if no image is uploaded, the stored default picture shared by all users
     """
-    profile_image_local_path = settings.PROFILE_IMAGE_LOCAL_PATH
-    profile_image_default = File(open(profile_image_local_path, 'rb'))
+    profile_image_default = acquire_default_profile_picture()
     ProfilePicture.objects.filter(user_profile=pk).update_or_create(
-        profile_picture=profile_image_default,
-        user=user,
-        user_profile=user_profile
+        user_profile=user_profile,
+        defaults={
+            'user': user,
+            'profile_picture': profile_image_default.file.name,
+            'profile_picture_small': '',
+            'profile_picture_variants': {},
+        }
     )
 
     return Response({'message': 'Default Profile image updated successfully'}, status=status.HTTP_200_OK)
 
 
 # -----------------------------------------------
-# Convert png, jpeg, jpg to webp
+# Validate an upload from its header
 # -----------------------------------------------
-def convert_image_webp(image):
-    """
-    This function converts an image to a desired format based on its content type.
-
-  Args:
-      image: A Django InMemoryUploadedFile object representing the image.
-
-  Returns:
-      A converted InMemoryUploadedFile object.
-    """
-    # Check for supported image types (PNG or JPEG)
-    if image.content_type in ('image/png', 'image/jpeg', 'image/jpg'):
-        converted_rgb = Image.open(image)
-        converted_webp = converted_rgb.convert('RGB')
-        output = BytesIO()
-        converted_webp.save(output, format='webp', quality=100)
-        output.seek(0)
-        new_filename = "%s.webp" % (image.name.split('.')[0])
-        content_type = "image/webp"
-        converted_image = InMemoryUploadedFile(
-            output,
-            'ImageField',
-            new_filename,
-            content_type,
-            sys.getsizeof(output),
-            None
-        )
-        return converted_image
-    else:
-        return image
+UPLOAD_IMAGE_FORMATS = ('JPEG', 'PNG', 'WEBP')
+
+# Pillow refuses to decode an image of more than twice this many pixels, in the web
+# processes and in the image pool workers, which import this module to run their tasks
+Image.MAX_IMAGE_PIXELS = settings.MAX_IMAGE_PIXELS
+
+
+def validate_image_upload(image, max_pixels=None, max_size=None):
+    """
+    Check an uploaded image from its header, before anything decodes it.
+
+    Image.open only reads the header of the file, so the format and the dimensions are known
+    without decoding the pixels, a small file that decodes to a huge image is turned away
+    without ever being decoded.
+
+    Args:
+        image: A Django UploadedFile object representing the image.
+        max_pixels: Most pixels (width x height) allowed, MAX_IMAGE_PIXELS by default.
+        max_size: Largest file allowed in bytes, MAX_IMAGE_UPLOAD_SIZE by default.
+
+    Returns:
+        (format, width, height) of the image.
+
+    Raises:
+        ValidationError: the upload is missing, not an image, of an unsupported format,
+            or too large.
+    """
+    max_pixels = max_pixels or settings.MAX_IMAGE_PIXELS
+    max_size = max_size or settings.MAX_IMAGE_UPLOAD_SIZE
+
+    if not image:
+        raise ValidationError('No image was uploaded')
+    if image.size > max_size:
+        raise ValidationError(f'Image must be smaller than {max_size // (1024 * 1024)}MB')
+
+    image.seek(0)
+    try:
+        with Image.open(image, formats=UPLOAD_IMAGE_FORMATS) as opened:
+            image_format, (width, height) = opened.format, opened.size
+    except Image.DecompressionBombError:
+        raise ValidationError(f'Image must have fewer than {max_pixels} pixels')
+    except (UnidentifiedImageError, OSError, SyntaxError):
+        raise ValidationError('Image must be a JPEG, PNG or WEBP image')
+    finally:
+        image.seek(0)
+
+    if width * height > max_pixels:
+        raise ValidationError(f'Image must have fewer than {max_pixels} pixels')
+
+    return image_format, width, height
 
 
 # -----------------------------------------------
-# check if image is greater than 1240x1754, if yes reduce image size to 1240x1754 and file size to 200kb
+# Encode an image within a byte size budget
 # -----------------------------------------------
+TEMPLATE_THUMBNAIL_SIZE = (1240, 1754)
+TEMPLATE_THUMBNAIL_TARGET_SIZE = 300 * 1024  # bytes
+TEMPLATE_THUMBNAIL_SMALL_SIZE = (310, 438)
+TEMPLATE_THUMBNAIL_SMALL_TARGET_SIZE = 40 * 1024  # bytes
+PROFILE_PICTURE_SIZE = (512, 512)
+PROFILE_PICTURE_TARGET_SIZE = 100 * 1024  # bytes
+
+IMAGE_CONTENT_TYPES = {'webp': 'image/webp', 'jpeg': 'image/jpeg', 'png': 'image/png'}
+IMAGE_EXTENSIONS = {'webp': 'webp', 'jpeg': 'jpg', 'png': 'png'}
+
+
+def _encode(image, image_format, quality):
+    output = BytesIO()
+    image.save(output, format=image_format, quality=quality)
+    return output
+
+
+def encode_to_target_size(image, target_size, image_format='webp', min_quality=30, max_quality=90, max_passes=6):
+    """
+    Encode a PIL image at the highest quality that fits in target_size bytes.
 
-def check_image_size(image):
-    """
-       This function checks if an image is greater than 1240x1754 and reduces the image size to 1240x1754 and file size to 300kb if it's more than 800mb.
-
-       Args:
-           image: A Django InMemoryUploadedFile object representing the image.
-
-       Returns:
-           A converted InMemoryUploadedFile object.
-       """
-    # Check if image is greater than 1240x1754
-    if image.width > 1240 or image.height > 1754:
-        converted_rgb = Image.open(image)
-        converted_rgb.thumbnail((1240, 1754))
-        output = BytesIO()
-        converted_rgb.save(output, format='jpeg', quality=100)
-        output.seek(0)
-        # Check if file size is greater than 800kb
-        if sys.getsizeof(output) > 800 * 1024:
-            # Calculate dynamic quality to achieve target size
-            target_size = 300 * 1024  # Target file size in bytes (300kb)
-            original_size = sys.getsizeof(output)  # Original file size in bytes
-            quality = int(100 * (target_size / original_size))
-            output = BytesIO()
-            converted_rgb.save(output, format='jpeg', quality=quality)
-            output.seek(0)
-        new_filename = "%s.jpg" % (image.name.split('.')[0])
-        content_type = "image/jpeg"
-        converted_image = InMemoryUploadedFile(
-            output,
-            'ImageField',
-            new_filename,
-            content_type,
-            sys.getsizeof(output),
-            None
-        )
-        return converted_image
+    The quality is bisected between min_quality and max_quality against the real size of
+    the encoded bytes, with at most max_passes encodes. When even min_quality does not fit,
+    the smallest encode made is returned, it is up to the caller to downscale further.
+
+    Returns:
+        (BytesIO, quality) of the encoded image, the buffer rewound.
+    """
+    encodes = {}
+
+    def encode(quality):
+        if quality not in encodes:
+            encodes[quality] = _encode(image, image_format, quality)
+        return encodes[quality]
+
+    best = None
+    low, high = min_quality, max_quality
+    if encode(high).getbuffer().nbytes <= target_size:
+        best = high
     else:
-        return image
+        high -= 1
+        while low <= high and len(encodes) < max_passes:
+            quality = (low + high) // 2
+            if encode(quality).getbuffer().nbytes <= target_size:
+                best, low = quality, quality + 1
+            else:
+                high = quality - 1
+
+    if best is None:  # nothing fitted, use the smallest encode made
+        best = min(encodes, key=lambda quality: encodes[quality].getbuffer().nbytes)
+
+    output = encodes[best]
+    output.seek(0)
+    return output, best
+
+
+def _uploaded_image(output, name, image_format):
+    """
+    Wrap encoded image bytes in an InMemoryUploadedFile named after the original upload.
+    """
+    return InMemoryUploadedFile(
+        output,
+        'ImageField',
+        "%s.%s" % (name.rsplit('.', 1)[0], IMAGE_EXTENSIONS[image_format]),
+        IMAGE_CONTENT_TYPES[image_format],
+        output.getbuffer().nbytes,
+        None
+    )
+
+
+def _open_rgb(image, max_size):
+    """
+    Open an uploaded image upright, in RGB and no larger than max_size.
+
+    A JPEG is drafted to max_size first, libjpeg then scales it down by up to 8x while
+    decoding, so a large photo is never decoded at full resolution.
+    """
+    image.seek(0)
+    with Image.open(image) as opened:
+        if opened.format == 'JPEG':
+            # the draft size is before the exif rotation, swap it for a rotated image
+            rotated = opened.getexif().get(ExifTags.Base.Orientation) in (5, 6, 7, 8)
+            opened.draft('RGB', max_size[::-1] if rotated else max_size)
+        converted = ImageOps.exif_transpose(opened).convert('RGB')
+    converted.thumbnail(max_size)
+    return converted
+
+
+# -----------------------------------------------
+# Derive every size of an image from a single decode
+# -----------------------------------------------
+TEMPLATE_THUMBNAIL_VARIANTS = {
+    'full': {'size': TEMPLATE_THUMBNAIL_SIZE, 'target_size': TEMPLATE_THUMBNAIL_TARGET_SIZE},
+    'small': {'size': TEMPLATE_THUMBNAIL_SMALL_SIZE, 'target_size': TEMPLATE_THUMBNAIL_SMALL_TARGET_SIZE},
+    # the small thumbnail at twice the pixel density, for high dpi screens
+    'retina': {
+        'size': (TEMPLATE_THUMBNAIL_SMALL_SIZE[0] * 2, TEMPLATE_THUMBNAIL_SMALL_SIZE[1] * 2),
+        'target_size': TEMPLATE_THUMBNAIL_SMALL_TARGET_SIZE * 3,
+    },
+}
+PROFILE_PICTURE_VARIANTS = {
+    'full': {'size': PROFILE_PICTURE_SIZE, 'target_size': PROFILE_PICTURE_TARGET_SIZE},
+    'small': {'size': (128, 128), 'target_size': 12 * 1024},
+}
+
+
+def derive_image_variants(image, variants, image_format='webp'):
+    """
+    Decode an uploaded image once and derive every variant of it from that decode.
+
+    The image is decoded at the size of the largest variant, each variant is then
+    resized from the decoded image and encoded within its byte budget.
+
+    Args:
+        image: A Django UploadedFile object representing the image.
+        variants: {name: {'size': (max width, max height), 'target_size': bytes}}.
+
+    Returns:
+        ({name: InMemoryUploadedFile}, {name: {'width', 'height', 'bytes'}}), the files
+        named after the upload with the variant name appended, and their manifest.
+    """
+    largest = (max(variant['size'][0] for variant in variants.values()),
+               max(variant['size'][1] for variant in variants.values()))
+    decoded = _open_rgb(image, largest)
+    stem = image.name.rsplit('.', 1)[0]
+
+    files, manifest = {}, {}
+    for name, variant in variants.items():
+        resized = decoded
+        if resized.width > variant['size'][0] or resized.height > variant['size'][1]:
+            resized = decoded.copy()
+            resized.thumbnail(variant['size'])
+
+        output, _ = encode_to_target_size(resized, variant['target_size'], image_format)
+        files[name] = _uploaded_image(output, f'{stem}-{name}', image_format)
+        manifest[name] = {'width': resized.width, 'height': resized.height, 'bytes': files[name].size}
+
+    return files, manifest
+
+
+def _derive_image_variants_task(data, name, variants, image_format):
+    """
+    derive_image_variants of the bytes of an upload, run in an image pool worker.
+    """
+    files, manifest = derive_image_variants(SimpleUploadedFile(name, data), variants, image_format)
+    return {key: (file.name, file.file.getvalue()) for key, file in files.items()}, manifest
+
+
+def derive_image_variants_pooled(image, variants, image_format='webp'):
+    """
+    derive_image_variants run in the image pool, off the request thread.
+
+    Raises ImagePoolBusy when the pool is saturated, ImagePoolError when the task fails
+    in the pool. Errors raised by the task itself, e.g. for an unreadable image, are raised
+    as they are.
+    """
+    image.seek(0)
+    return run_image_variants_task(_derive_image_variants_task, image.read(), image.name, variants, image_format)
+
+
+def run_image_variants_task(task, *args):
+    """
+    Run a task returning encoded variants like _derive_image_variants_task in the image pool.
+
+    The last argument of the task is the image format of the variants.
+
+    Returns:
+        ({name: InMemoryUploadedFile}, manifest) as returned by derive_image_variants.
+    """
+    encoded, manifest = image_pool.run(task, *args)
+    files = {key: _uploaded_image(BytesIO(content), filename, args[-1]) for key, (filename, content) in encoded.items()}
+    return files, manifest
+
+
+def image_srcset(files, manifest):
+    """
+    Return the srcset of stored image variants, {'src': url, 'srcset': 'url 310w, ...'}.
+
+    Args:
+        files: {name: FieldFile} of the stored variants, 'full' is the src.
+        manifest: The manifest of the variants returned by derive_image_variants.
+    """
+    stored = sorted((manifest[name]['width'], file.url) for name, file in files.items() if file and name in manifest)
+    if not stored:
+        return None
+
+    return {
+        'src': files['full'].url if files.get('full') else stored[-1][1],
+        'srcset': ', '.join(f'{url} {width}w' for width, url in stored),
+    }
+
+
+# -----------------------------------------------
+# Resize and compress an uploaded profile picture
+# -----------------------------------------------
+def process_profile_picture(image):
+    """
+    Derive the profile picture variants, webp of at most 512x512 and 128x128, from an upload
+    in the image pool.
+
+    Args:
+        image: A Django UploadedFile object representing the image.
+
+    Returns:
+        ({name: InMemoryUploadedFile}, manifest) as returned by derive_image_variants.
+    """
+    return derive_image_variants_pooled(image, PROFILE_PICTURE_VARIANTS)
@@ -0,0 +1,167 @@
+import contextlib
+import datetime
+import threading
+
+from botocore.exceptions import BotoCoreError, ClientError
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from careersparker import settings
+from user.models import S3DeletionRetry
+from util.Storage.s3_function import bucket_name, s3_client
+
+# most keys a single delete_objects call accepts
+DELETE_OBJECTS_BATCH_SIZE = 1000
+
+_batch = threading.local()
+
+
+def s3_key(file):
+    """
+    Return the bucket key of a stored file name or FieldFile, stored under AWS_LOCATION.
+    """
+    return '{0}/{1}'.format(settings.AWS_LOCATION, getattr(file, 'name', file))
+
+
+# -------------------------------------------------------------------
+# Deleting once the transaction commits
+# -------------------------------------------------------------------
+def schedule_s3_deletion(*files):
+    """
+    Delete stored files (names or FieldFiles) from the bucket once the current transaction
+    commits, nothing is deleted when it rolls back.
+
+    Inside s3_deletion_batch(), e.g. during a request, the keys of every committed
+    transaction are gathered and deleted together when the batch ends, otherwise they are
+    deleted right after the commit. Empty files are skipped.
+    """
+    keys = [s3_key(file) for file in files if file]
+    if keys:
+        transaction.on_commit(lambda: _committed(keys))
+
+
+def _committed(keys):
+    pending = getattr(_batch, 'keys', None)
+    if pending is None:
+        delete_s3_keys(keys)
+    else:
+        pending.extend(keys)
+
+
+@contextlib.contextmanager
+def s3_deletion_batch():
+    """
+    Gather the deletions committed inside the block and delete them in batches when it
+    exits. A nested batch is part of the outer one.
+    """
+    if getattr(_batch, 'keys', None) is not None:
+        yield
+        return
+
+    _batch.keys = []
+    try:
+        yield
+    finally:
+        keys, _batch.keys = _batch.keys, None
+        delete_s3_keys(keys)
+
+
+def cancel_s3_deletion(*files):
+    """
+    Keep stored files whose deletion is pending in the current batch, e.g. stored again
+    under the same name since.
+    """
+    pending = getattr(_batch, 'keys', None)
+    if pending:
+        keys = {s3_key(file) for file in files if file}
+        pending[:] = [key for key in pending if key not in keys]
+
+
+class S3DeletionBatchMiddleware:
+    """
+    Deletes the files scheduled for deletion by the committed transactions of a request
+    in batches, once its response is ready.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with s3_deletion_batch():
+            return self.get_response(request)
+
+
+# -------------------------------------------------------------------
+# Batched deletion
+# -------------------------------------------------------------------
+def delete_s3_keys(keys):
+    """
+    Delete keys from the bucket with delete_objects calls of up to 1000 keys.
+
+    A key that could not be deleted is saved to S3DeletionRetry, deleted again by the
+    retry_s3_deletions command.
+
+    Returns:
+        The keys that could not be deleted.
+    """
+    keys = list(dict.fromkeys(keys))
+    failed = {}
+
+    for start in range(0, len(keys), DELETE_OBJECTS_BATCH_SIZE):
+        batch = keys[start:start + DELETE_OBJECTS_BATCH_SIZE]
+        try:
+            response = s3_client().delete_objects(
+                Bucket=bucket_name,
+                Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True},
+            )
+        except (BotoCoreError, ClientError) as e:
+            failed.update((key, str(e)) for key in batch)
+        else:
+            # only the keys that failed are listed in a quiet response
+            failed.update((error['Key'], error.get('Message') or error.get('Code', ''))
+                          for error in response.get('Errors', []))
+
+    if failed:
+        _save_retries(failed)
+    return list(failed)
+
+
+def _save_retries(failed):
+    retry_after = timezone.now() + datetime.timedelta(seconds=settings.S3_DELETION_RETRY_DELAY)
+    known = dict(S3DeletionRetry.objects.filter(key__in=failed).values_list('key', 'pk'))
+
+    S3DeletionRetry.objects.bulk_create([
+        S3DeletionRetry(key=key, error=error[:1000], run_after=retry_after)
+        for key, error in failed.items() if key not in known
+    ])
+    for key, pk in known.items():
+        S3DeletionRetry.objects.filter(pk=pk).update(
+            attempts=F('attempts') + 1, error=failed[key][:1000], run_after=retry_after,
+        )
+
+
+def retry_s3_deletions(limit=DELETE_OBJECTS_BATCH_SIZE):
+    """
+    Delete the keys of S3DeletionRetry due for a retry again, in batches.
+
+    The delay before the next retry doubles after every failed attempt.
+
+    Returns:
+        (deleted, failed) counts of keys.
+    """
+    retries = list(S3DeletionRetry.objects.filter(run_after__lte=timezone.now()).order_by('run_after')[:limit])
+    if not retries:
+        return 0, 0
+
+    failed = set(delete_s3_keys([retry.key for retry in retries]))
+    S3DeletionRetry.objects.filter(pk__in=[retry.pk for retry in retries if retry.key not in failed]).delete()
+
+    # back off exponentially, the attempts were counted by delete_s3_keys
+    for retry in retries:
+        if retry.key in failed:
+            delay = settings.S3_DELETION_RETRY_DELAY * 2 ** min(retry.attempts + 1, 10)
+            S3DeletionRetry.objects.filter(pk=retry.pk).update(
+                run_after=timezone.now() + datetime.timedelta(seconds=delay),
+            )
+    return len(retries) - len(failed), len(failed)
@@ -1,18 +1,21 @@
-import boto3
+import base64
+import hashlib
+
 from rest_framework import status
 from rest_framework.response import Response
 
 from careersparker import settings
-
-# Get the AWS credentials from the settings.py file
-aws_access_key_id = settings.AWS_ACCESS_KEY_ID
-aws_secret_access_key = settings.AWS_SECRET_ACCESS_KEY
+from util.Storage.aws_clients import get_aws_client
 
 # get the bucket name from the settings.py file
 bucket_name = settings.AWS_STORAGE_BUCKET_NAME
 
-# Initiate the s3 client
-s3_client = boto3.client('s3', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key)
+
+def s3_client():
+    """
+    The s3 client shared by this process, created on first use
+    """
+    return get_aws_client('s3')
 
 
 # -------------------DELETE A FILE FROM S3 BUCKET--------------------------------
@@ -24,13 +27,60 @@ def delete_s3_file(file_name):
 
     try:
         # Delete the file
-        s3_client.delete_object(Bucket=bucket_name, Key=file_name)
+        s3_client().delete_object(Bucket=bucket_name, Key=file_name)
         return True
 
     except Exception as e:
         return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
+# -------------------STREAMING UPLOADS TO S3 BUCKET--------------------------------
+class ChecksumReader:
+    """
+    Read-only wrapper of a file computing the sha256 of the bytes read from it.
+
+    It has no seek, so boto3 reads it once from start to end, in order, and uploads the
+    parts read as they come, holding only the parts waiting to be sent in memory.
+    """
+
+    def __init__(self, file):
+        self._file = file
+        self._sha256 = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size=-1):
+        data = self._file.read(size)
+        self._sha256.update(data)
+        self.size += len(data)
+        return data
+
+    @property
+    def sha256(self):
+        # base64 digest, as the ChecksumSHA256 of s3
+        return base64.b64encode(self._sha256.digest()).decode()
+
+
+def upload_to_s3(file, key, content_type=None):
+    """
+    Stream a file object to key of the bucket, with bounded memory.
+
+    A file of at least S3_MULTIPART_PART_SIZE bytes is sent as a multipart upload, its parts
+    uploaded concurrently as configured by AWS_S3_TRANSFER_CONFIG, a smaller one with a
+    single put_object. s3 checks the sha256 checksum of each part, and a failed multipart
+    upload is aborted.
+
+    Returns:
+        {'key', 'size', 'sha256'}, sha256 being the base64 checksum of the whole file.
+    """
+    reader = ChecksumReader(file)
+    extra_args = {'ChecksumAlgorithm': 'SHA256'}
+    if content_type:
+        extra_args['ContentType'] = content_type
+
+    s3_client().upload_fileobj(reader, bucket_name, key, ExtraArgs=extra_args, Config=settings.AWS_S3_TRANSFER_CONFIG)
+    return {'key': key, 'size': reader.size, 'sha256': reader.sha256}
+
+
 # -------------------SAVE A FILE TO S3 BUCKET--------------------------------
 def save_to_s3(local_file_path, destination_path):  # Save a file to an S3 bucket
     """
@@ -41,16 +91,9 @@ def save_to_s3(local_file_path, destination_path):  # Save a file to an S3 bucke
     file_name = local_file_path.split('/')[-1]
 
     try:
-        # Read the local file
+        # Stream the local file to S3
         with open(local_file_path, 'rb') as file:
-            file_content = file.read()
-
-        # Save the file to S3
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=str('static/' + destination_path + '/' + file_name),
-            Body=file_content
-        )
+            upload_to_s3(file, str('static/' + destination_path + '/' + file_name))
 
         # Return a success response
         return True
@@ -0,0 +1,102 @@
+import functools
+import hashlib
+
+from django.core.files.base import ContentFile
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from careersparker import settings
+from user.models import SharedAsset
+from util.Storage.s3_deletion import cancel_s3_deletion, schedule_s3_deletion
+
+
+# -----------------------------------------------
+# Content addressed files shared between rows
+# -----------------------------------------------
+def acquire_shared_asset(content, name):
+    """
+    Return the shared asset holding content with one more reference, storing content
+    when no asset holds it yet.
+
+    A row replacing its file acquires the new asset before releasing the old one, so
+    replacing a file with the same content never drops the last reference.
+
+    Args:
+        content: The bytes of the file.
+        name: A file name for its extension, the asset is stored under the content hash.
+    """
+    content_hash = hashlib.sha256(content).hexdigest()
+
+    while True:
+        if SharedAsset.objects.filter(content_hash=content_hash).update(ref_count=F('ref_count') + 1):
+            return SharedAsset.objects.get(content_hash=content_hash)
+
+        # always written, the file of an asset deleted meanwhile may still be stored under
+        # this name, its pending deletion is cancelled
+        asset = SharedAsset(content_hash=content_hash, size=len(content), ref_count=1)
+        file_name = asset.file.field.generate_filename(asset, name)
+        asset.file.name = asset.file.storage.save(file_name, ContentFile(content))
+        cancel_s3_deletion(asset.file.name)
+
+        try:
+            with transaction.atomic():
+                asset.save()
+            return asset
+        except IntegrityError:
+            continue  # stored by a concurrent request meanwhile, reference that one
+
+
+def release_shared_asset(file_name):
+    """
+    Drop a reference to the shared asset stored as file_name, deleting the asset and its
+    file once nothing references it.
+
+    An asset left without references is only deleted once the release commits, and only
+    if nothing acquired it meanwhile. Its file is then deleted with schedule_s3_deletion.
+
+    Returns:
+        False when file_name is not a shared asset, the caller then owns the file.
+    """
+    with transaction.atomic():
+        asset = SharedAsset.objects.select_for_update().filter(file=file_name).first()
+        if asset is None:
+            return False
+
+        SharedAsset.objects.filter(pk=asset.pk, ref_count__gt=0).update(ref_count=F('ref_count') - 1)
+        if asset.ref_count <= 1:
+            transaction.on_commit(lambda: _delete_unreferenced_asset(asset.pk))
+    return True
+
+
+def _delete_unreferenced_asset(pk):
+    with transaction.atomic():
+        asset = SharedAsset.objects.select_for_update().filter(pk=pk, ref_count=0).first()
+        if asset is not None:
+            asset.delete()
+            schedule_s3_deletion(asset.file)
+
+
+def release_stored_file(file):
+    """
+    Release the file of a FileField, a shared asset loses a reference and any other file
+    is deleted from the s3 bucket once the transaction commits.
+    """
+    if file and not release_shared_asset(file.name):
+        schedule_s3_deletion(file)
+
+
+# -----------------------------------------------
+# Default profile picture
+# -----------------------------------------------
+@functools.lru_cache(maxsize=1)
+def _default_profile_picture():
+    with open(settings.PROFILE_IMAGE_LOCAL_PATH, 'rb') as image:
+        return image.read()
+
+
+def acquire_default_profile_picture():
+    """
+    Return the shared asset of the default profile picture with one more reference,
+    uploaded once for every user instead of once per user.
+    """
+    return acquire_shared_asset(_default_profile_picture(), settings.PROFILE_IMAGE_LOCAL_PATH)
@@ -1,7 +1,7 @@
-import boto3
 from botocore.exceptions import ClientError
 
-from careersparker.settings import AWS_SES_REGION_NAME, AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, DEFAULT_FROM
+from careersparker.settings import DEFAULT_FROM
+from util.Storage.aws_clients import get_aws_client
 
 
 def send_email(recipient=None, subject=None, body_html=None, sender=DEFAULT_FROM):
@@ -41,12 +41,8 @@ def send_email(recipient=None, subject=None, body_html=None, sender=DEFAULT_FROM
 
     CHARSET = "UTF-8"
 
-    client = boto3.client(
-        'ses',
-        region_name=AWS_SES_REGION_NAME,
-        aws_access_key_id=AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=AWS_SECRET_ACCESS_KEY
-    )
+    # the ses client shared by this process, created on the first email sent
+    client = get_aws_client('ses')
 
     # send email
     try:
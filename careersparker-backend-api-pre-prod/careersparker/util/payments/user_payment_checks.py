@@ -92,6 +92,6 @@ def premium_required(view_func):
                 {'message': 'This is a premium feature.'},
                 status=status.HTTP_403_FORBIDDEN
             )
-        return view_func(request, *args, **kwargs)
+        return view_func(self, request, *args, **kwargs)
 
     return _wrapped_view
@@ -1,10 +1,9 @@
 from django.contrib.auth.signals import user_logged_in
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch.dispatcher import receiver
-from django.core.files import File
-from careersparker import settings
 from user import models
-from user.models import User
+from user.models import ProfilePicture, User
+from util.Storage.shared_assets import acquire_default_profile_picture, release_stored_file
 from util.general.send_email import send_user_activation_email
 
 
@@ -14,17 +13,28 @@ from util.general.send_email import send_user_activation_email
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
         print("sINGAL")
-        profile_image_local_path = settings.PROFILE_IMAGE_LOCAL_PATH
-        print(profile_image_local_path)
         models.Profile.objects.create(user=instance, id=instance.id)
-        profile_image = File(open(profile_image_local_path, 'rb'))  # open the file in read mode
+
+        # every new user references the one stored default picture, nothing is uploaded
+        profile_image = acquire_default_profile_picture()
         models.ProfilePicture.objects.create(user_profile_id=instance.id, user_id=instance.id,
-                                             profile_picture=profile_image)
+                                             profile_picture=profile_image.file.name)
 
         # call send_activation_email function
         send_user_activation_email(instance, user=instance)
 
 
+# ----------------- Release Deleted Profile Pictures -----------------
+@receiver(post_delete, sender=ProfilePicture)
+def release_profile_picture(sender, instance, **kwargs):
+    """
+    Release the pictures of a deleted profile picture row, also deleted by cascade with
+    its user or profile, so shared pictures lose the reference.
+    """
+    release_stored_file(instance.profile_picture)
+    release_stored_file(instance.profile_picture_small)
+
+
 # ----------------- User Login Signal -----------------
 @receiver(user_logged_in)
 def user_login(request, user, **kwargs):